@@ -108,6 +108,7 @@ def run():
     # Get current prices and check conditions
     from utils.fetch import get_current_prices
 
+    prices = {}
     try:
         prices = get_current_prices(symbols)
         triggered = checker.check(prices)
@@ -121,7 +122,7 @@ def run():
     # ===== STEP 10: Return Summary =====
     return {
         'symbols_monitored': len(symbols),
-        'portfolio_value': portfolio.total_value() if hasattr(portfolio, 'total_value') else 0,
+        'portfolio_value': portfolio.total_value(prices, include_details=False)['total_value'],
         'executor_balance': executor.balance if hasattr(executor, 'balance') else 0,
         'status': 'completed'
     }
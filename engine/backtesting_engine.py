@@ -14,9 +14,16 @@ Usage:
         cash=10_000_000
     )
     print(result.summary())
+
+    # 여러 종목 병렬 실행
+    results = engine.batch_run(SmaCross, ["AAPL", "MSFT", "NVDA"], period="1y")
 """
 
-from typing import Optional, Type, Dict, Any, Union
+import os
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Optional, Type, Dict, Any, Union, List
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
@@ -26,6 +33,9 @@ import numpy as np
 from backtesting import Backtest, Strategy
 
 
+logger = logging.getLogger(__name__)
+
+
 @dataclass
 class BacktestResult:
     """백테스트 결과"""
@@ -184,6 +194,61 @@ class BacktestEngine:
             equity_curve=stats._equity_curve if hasattr(stats, '_equity_curve') else pd.DataFrame()
         )
 
+    def batch_run(
+        self,
+        strategy: Type[Strategy],
+        tickers: List[str],
+        period: str = "1y",
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        cash: float = 10_000_000,
+        workers: Optional[int] = None,
+        **strategy_params
+    ) -> Dict[str, BacktestResult]:
+        """
+        여러 종목 백테스트 (종목별 프로세스 병렬 실행)
+
+        종목별 백테스트는 서로 독립적이므로 프로세스 풀로 나눠 실행합니다.
+        실패한 종목은 로그만 남기고 결과에서 제외됩니다. 프로세스 간에 결과를
+        주고받으므로 stats에서는 '_'로 시작하는 항목(_strategy, _trades,
+        _equity_curve)을 뺍니다 - 거래 내역과 자산 곡선은 trades/equity_curve로 제공.
+
+        Args:
+            strategy: 전략 클래스 (모듈 최상위에 정의되어 pickle 가능해야 함)
+            tickers: 종목 코드 목록
+            period: 기간
+            start: 시작일
+            end: 종료일
+            cash: 초기 자금
+            workers: 프로세스 수 (None이면 CPU 수, 1이면 순차 실행)
+            **strategy_params: 전략 파라미터
+
+        Returns:
+            {ticker: BacktestResult} 딕셔너리 (입력 순서 유지)
+        """
+        if workers is None:
+            workers = min(os.cpu_count() or 1, len(tickers))
+
+        run_one = partial(
+            _run_one,
+            commission=self.commission,
+            margin=self.margin,
+            strategy=strategy,
+            period=period,
+            start=start,
+            end=end,
+            cash=cash,
+            strategy_params=strategy_params,
+        )
+
+        if workers <= 1 or len(tickers) <= 1:
+            outcomes = map(run_one, tickers)
+            return _collect_results(tickers, outcomes)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_one, ticker) for ticker in tickers]
+            return _collect_results(tickers, map(_future_outcome, futures))
+
     def optimize(
         self,
         strategy: Type[Strategy],
@@ -233,3 +298,65 @@ class BacktestEngine:
             trades=stats._trades if hasattr(stats, '_trades') else pd.DataFrame(),
             equity_curve=stats._equity_curve if hasattr(stats, '_equity_curve') else pd.DataFrame()
         )
+
+
+def _run_one(
+    ticker: str,
+    commission: float,
+    margin: float,
+    strategy: Type[Strategy],
+    period: str,
+    start: Optional[str],
+    end: Optional[str],
+    cash: float,
+    strategy_params: Dict[str, Any]
+) -> Union[BacktestResult, Exception]:
+    """batch_run 워커: 프로세스별로 엔진을 생성해 단일 종목 실행"""
+    engine = BacktestEngine(commission=commission, margin=margin)
+    try:
+        result = engine.run(
+            strategy=strategy,
+            ticker=ticker,
+            period=period,
+            start=start,
+            end=end,
+            cash=cash,
+            **strategy_params
+        )
+    except Exception as e:
+        return e
+    return _portable_result(result)
+
+
+def _portable_result(result: BacktestResult) -> BacktestResult:
+    """
+    프로세스 간 전달용 결과 (stats의 '_' 항목 제외)
+
+    _strategy는 전략 인스턴스와 데이터/브로커를 통째로 들고 있어 pickle이
+    무겁거나 실패할 수 있음
+    """
+    public = [key for key in result.stats.index if not str(key).startswith('_')]
+    return BacktestResult(
+        stats=result.stats[public],
+        trades=result.trades,
+        equity_curve=result.equity_curve
+    )
+
+
+def _future_outcome(future) -> Union[BacktestResult, Exception]:
+    """워커 결과 또는 예외 (결과/예외 pickle 실패, 워커 프로세스 종료 포함)"""
+    try:
+        return future.result()
+    except Exception as e:
+        return e
+
+
+def _collect_results(tickers: List[str], outcomes) -> Dict[str, BacktestResult]:
+    """워커 결과 수집 (실패 종목은 로그 후 제외)"""
+    results = {}
+    for ticker, outcome in zip(tickers, outcomes):
+        if isinstance(outcome, Exception):
+            logger.warning(f"Backtest failed for {ticker}: {outcome}")
+            continue
+        results[ticker] = outcome
+    return results
@@ -10,27 +10,41 @@ Usage:
     sentiment = aggregator.get_sentiment("AAPL")
 """
 
+import re
+import math
+import asyncio
 import logging
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from collections import defaultdict
+from functools import lru_cache
 
 from .provider import (
-    BaseNewsProvider, NewsProvider, NewsItem, NewsSentiment, Sentiment
+    BaseNewsProvider, NewsProvider, NewsItem, NewsSentiment, Sentiment,
+    summarize_sentiment
 )
 from .finnhub import FinnhubProvider
 from .marketaux import MarketauxProvider
 
 
+# Title normalization patterns (compiled once)
+_TITLE_PREFIX_RE = re.compile(r"breaking:|update:|exclusive:")
+_NON_ALNUM_RE = re.compile(r"[^\w\s]|_")  # \w minus "_" == str.isalnum()
+
+
 class NewsAggregator:
     """다중 뉴스 소스 통합 클래스"""
 
+    # get_multi_sentiment_async에서 동시에 조회하는 종목 수 (Finnhub 무료: 60회/분)
+    CONCURRENCY_LIMIT = 4
+
     def __init__(
         self,
         finnhub_key: Optional[str] = None,
         marketaux_key: Optional[str] = None,
         enable_finnhub: bool = True,
-        enable_marketaux: bool = True
+        enable_marketaux: bool = True,
+        fanout_factor: float = 1.5
     ):
         """
         Args:
@@ -38,9 +52,14 @@ class NewsAggregator:
             marketaux_key: Marketaux API 키
             enable_finnhub: Finnhub 활성화
             enable_marketaux: Marketaux 활성화
+            fanout_factor: 제공자 합산 요청량 / limit 비율.
+                제공자별로 ceil(limit * fanout_factor / 제공자 수)건만 요청합니다
+                (limit 초과 불가). 클수록 중복 제거 후에도 limit을 채울 여유가
+                커지고, 작을수록 API 쿼터를 아낍니다.
         """
         self.logger = logging.getLogger(__name__)
         self._providers: List[BaseNewsProvider] = []
+        self.fanout_factor = fanout_factor
 
         if enable_finnhub:
             try:
@@ -68,6 +87,17 @@ class NewsAggregator:
         """활성화된 제공자 목록"""
         return [p.name for p in self._providers]
 
+    def close(self) -> None:
+        """모든 제공자의 HTTP 세션 종료"""
+        for provider in self._providers:
+            provider.close()
+
+    def __enter__(self) -> "NewsAggregator":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
     def get_news(
         self,
         ticker: str,
@@ -94,13 +124,14 @@ class NewsAggregator:
             return []
 
         all_news: List[NewsItem] = []
+        per_provider_limit = self._per_provider_limit(limit)
 
         # Fetch from all providers
         for provider in self._providers:
             try:
                 news = provider.get_news(
                     ticker=ticker,
-                    limit=limit,
+                    limit=per_provider_limit,
                     from_date=from_date,
                     to_date=to_date
                 )
@@ -109,6 +140,61 @@ class NewsAggregator:
             except Exception as e:
                 self.logger.error(f"Error fetching from {provider.name}: {e}")
 
+        return self._finalize(all_news, limit, deduplicate)
+
+    async def get_news_async(
+        self,
+        ticker: str,
+        limit: int = 20,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+        deduplicate: bool = True
+    ) -> List[NewsItem]:
+        """
+        종목 뉴스 통합 조회 (비동기)
+
+        모든 제공자에 동시에 요청합니다. 인자는 get_news와 동일합니다.
+        """
+        if not self._providers:
+            self.logger.warning("No news providers configured")
+            return []
+
+        per_provider_limit = self._per_provider_limit(limit)
+        results = await asyncio.gather(
+            *[
+                provider.get_news_async(
+                    ticker=ticker,
+                    limit=per_provider_limit,
+                    from_date=from_date,
+                    to_date=to_date
+                )
+                for provider in self._providers
+            ],
+            return_exceptions=True
+        )
+
+        all_news: List[NewsItem] = []
+        for provider, news in zip(self._providers, results):
+            if isinstance(news, Exception):
+                self.logger.error(f"Error fetching from {provider.name}: {news}")
+                continue
+            all_news.extend(news)
+            self.logger.debug(f"Fetched {len(news)} news from {provider.name}")
+
+        return self._finalize(all_news, limit, deduplicate)
+
+    def _per_provider_limit(self, limit: int) -> int:
+        """제공자별 요청 건수 (중복 제거 여유분 포함, limit 이하)"""
+        share = math.ceil(limit * self.fanout_factor / len(self._providers))
+        return max(1, min(limit, share))
+
+    def _finalize(
+        self,
+        all_news: List[NewsItem],
+        limit: int,
+        deduplicate: bool
+    ) -> List[NewsItem]:
+        """중복 제거 + 최신순 정렬 + limit 적용"""
         # Deduplicate
         if deduplicate:
             all_news = self._deduplicate(all_news)
@@ -127,28 +213,35 @@ class NewsAggregator:
         if not news_items:
             return []
 
-        seen_titles: Dict[str, NewsItem] = {}
+        # Entries of admitted titles: [word set, representative item]
+        seen: List[list] = []
+        # word -> indices into `seen`; only titles sharing a word can reach the threshold
+        word_index: Dict[str, List[int]] = defaultdict(list)
         unique_news = []
 
         for item in news_items:
             # Normalize title for comparison
-            normalized = self._normalize_title(item.title)
+            words = frozenset(self._normalize_title(item.title).split())
+
+            # Check for similar titles (candidates in insertion order)
+            candidates = sorted({idx for word in words for idx in word_index.get(word, ())})
 
-            # Check for similar titles
             is_duplicate = False
-            for seen_title in seen_titles:
-                if self._is_similar(normalized, seen_title):
+            for idx in candidates:
+                if self._is_similar_words(words, seen[idx][0]):
                     # Keep the one with more info (sentiment score)
-                    existing = seen_titles[seen_title]
+                    existing = seen[idx][1]
                     if item.sentiment_score is not None and existing.sentiment_score is None:
-                        seen_titles[seen_title] = item
-                        unique_news = [n for n in unique_news if n != existing]
+                        seen[idx][1] = item
+                        unique_news = [n for n in unique_news if n is not existing]
                         unique_news.append(item)
                     is_duplicate = True
                     break
 
             if not is_duplicate:
-                seen_titles[normalized] = item
+                for word in words:
+                    word_index[word].append(len(seen))
+                seen.append([words, item])
                 unique_news.append(item)
 
         return unique_news
@@ -156,21 +249,33 @@ class NewsAggregator:
     def _normalize_title(self, title: str) -> str:
         """제목 정규화"""
         # Remove common prefixes, lowercase, remove punctuation
-        title = title.lower()
-        for prefix in ["breaking:", "update:", "exclusive:"]:
-            title = title.replace(prefix, "")
-        return "".join(c for c in title if c.isalnum() or c.isspace()).strip()
+        title = _TITLE_PREFIX_RE.sub("", title.lower())
+        return _NON_ALNUM_RE.sub("", title).strip()
 
     def _is_similar(self, title1: str, title2: str, threshold: float = 0.7) -> bool:
         """제목 유사도 체크 (간단한 Jaccard 유사도)"""
-        words1 = set(title1.split())
-        words2 = set(title2.split())
+        return self._is_similar_words(
+            frozenset(title1.split()), frozenset(title2.split()), threshold
+        )
+
+    @staticmethod
+    def _is_similar_words(
+        words1: frozenset,
+        words2: frozenset,
+        threshold: float = 0.7
+    ) -> bool:
+        """단어 집합 Jaccard 유사도 체크"""
+        len1, len2 = len(words1), len(words2)
+
+        if not len1 or not len2:
+            return False
 
-        if not words1 or not words2:
+        # intersection <= min(len), union >= max(len): 크기 차이만으로 불가능하면 조기 종료
+        if min(len1, len2) < threshold * max(len1, len2):
             return False
 
         intersection = len(words1 & words2)
-        union = len(words1 | words2)
+        union = len1 + len2 - intersection
 
         return intersection / union >= threshold
 
@@ -181,37 +286,12 @@ class NewsAggregator:
         여러 제공자의 결과를 평균
         """
         news_items = self.get_news(ticker, limit=50, deduplicate=True)
+        return summarize_sentiment(ticker, news_items)
 
-        if not news_items:
-            return None
-
-        positive = 0
-        negative = 0
-        neutral = 0
-        scores = []
-
-        for item in news_items:
-            if item.sentiment == Sentiment.POSITIVE:
-                positive += 1
-            elif item.sentiment == Sentiment.NEGATIVE:
-                negative += 1
-            else:
-                neutral += 1
-
-            if item.sentiment_score is not None:
-                scores.append(item.sentiment_score)
-
-        avg_score = sum(scores) / len(scores) if scores else 0
-
-        return NewsSentiment(
-            ticker=ticker,
-            total_count=len(news_items),
-            positive_count=positive,
-            negative_count=negative,
-            neutral_count=neutral,
-            avg_sentiment_score=avg_score,
-            latest_news=news_items[:5],
-        )
+    async def get_sentiment_async(self, ticker: str) -> Optional[NewsSentiment]:
+        """종목 감성 분석 (통합, 비동기)"""
+        news_items = await self.get_news_async(ticker, limit=50, deduplicate=True)
+        return summarize_sentiment(ticker, news_items)
 
     def get_multi_sentiment(self, tickers: List[str]) -> Dict[str, NewsSentiment]:
         """
@@ -232,6 +312,30 @@ class NewsAggregator:
 
         return results
 
+    async def get_multi_sentiment_async(self, tickers: List[str]) -> Dict[str, NewsSentiment]:
+        """
+        여러 종목 감성 분석 (비동기, 최대 CONCURRENCY_LIMIT 종목 동시 요청)
+
+        Args:
+            tickers: 종목 코드 목록
+
+        Returns:
+            {ticker: NewsSentiment} 딕셔너리
+        """
+        sem = asyncio.Semaphore(self.CONCURRENCY_LIMIT)
+
+        async def fetch(ticker: str) -> Optional[NewsSentiment]:
+            async with sem:
+                return await self.get_sentiment_async(ticker)
+
+        sentiments = await asyncio.gather(*[fetch(ticker) for ticker in tickers])
+
+        return {
+            ticker: sentiment
+            for ticker, sentiment in zip(tickers, sentiments)
+            if sentiment
+        }
+
     def summary(self, ticker: str) -> str:
         """종목 뉴스 요약"""
         sentiment = self.get_sentiment(ticker)
@@ -259,13 +363,21 @@ class NewsAggregator:
 
 
 # Convenience functions
+@lru_cache(maxsize=1)
+def _default_aggregator() -> NewsAggregator:
+    """
+    편의 함수용 공유 NewsAggregator (환경변수 API 키 사용)
+
+    다른 API 키가 필요하면 NewsAggregator를 직접 생성하세요.
+    """
+    return NewsAggregator()
+
+
 def get_news(ticker: str, limit: int = 10) -> List[NewsItem]:
     """뉴스 조회 (편의 함수)"""
-    aggregator = NewsAggregator()
-    return aggregator.get_news(ticker, limit=limit)
+    return _default_aggregator().get_news(ticker, limit=limit)
 
 
 def get_sentiment(ticker: str) -> Optional[NewsSentiment]:
     """감성 분석 (편의 함수)"""
-    aggregator = NewsAggregator()
-    return aggregator.get_sentiment(ticker)
+    return _default_aggregator().get_sentiment(ticker)
@@ -0,0 +1,83 @@
+"""
+News Response Cache
+뉴스 API 응답 파일 캐시
+
+Usage:
+    from news.cache import FileCache
+
+    cache = FileCache("data/cache/marketaux")
+    key = cache.make_key("news/all", {"symbols": "AAPL", "limit": 10})
+
+    data = cache.get(key, ttl=900)
+    if data is None:
+        data = fetch()
+        cache.set(key, data)
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Optional
+
+
+class FileCache:
+    """JSON 파일 기반 TTL 캐시 (프로세스 간 공유)"""
+
+    def __init__(self, cache_dir: str, default_ttl: float = 900):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 경로
+            default_ttl: 기본 유효 시간 (초)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.default_ttl = default_ttl
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """요청 구성요소(엔드포인트, 파라미터)로 캐시 키 생성"""
+        raw = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str, ttl: Optional[float] = None) -> Optional[Any]:
+        """TTL 이내의 캐시 데이터 반환 (없거나 만료되면 None)"""
+        ttl = self.default_ttl if ttl is None else ttl
+        path = self._path(key)
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"Ignoring unreadable cache entry {path.name}: {e}")
+            return None
+
+        if time.time() - entry.get("ts", 0) >= ttl:
+            return None
+
+        return entry.get("data")
+
+    def set(self, key: str, data: Any) -> None:
+        """캐시 저장 (임시 파일 기록 후 교체)"""
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"ts": time.time(), "data": data}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Failed to write cache entry {path.name}: {e}")
+
+    def clear(self) -> None:
+        """전체 캐시 삭제"""
+        for path in self.cache_dir.glob("*.json"):
+            path.unlink(missing_ok=True)
@@ -8,33 +8,93 @@ Usage:
     provider = FinnhubProvider(api_key="your_api_key")
     news = provider.get_news("AAPL")
 
+    # Async (runs get_news in a worker thread, sharing the keep-alive session)
+    news = await provider.get_news_async("AAPL")
+
+    provider.close()  # 또는 with FinnhubProvider(...) as provider:
+
 API Docs: https://finnhub.io/docs/api/company-news
 Free tier: 60 calls/minute
 """
 
 import os
+import json
+import time
 import logging
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime, timedelta, timezone
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     HAS_REQUESTS = True
 except ImportError:
     HAS_REQUESTS = False
 
-from .provider import BaseNewsProvider, NewsItem, Sentiment, NewsSentiment
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+from .provider import BaseNewsProvider, NewsItem, Sentiment, NewsSentiment, clean_ticker, classify_score
+
+
+# Positive keywords
+POSITIVE_WORDS = (
+    "surge", "jump", "gain", "rise", "up", "high", "record", "beat",
+    "exceed", "strong", "growth", "profit", "success", "bullish",
+    "upgrade", "buy", "outperform", "positive", "boost", "rally"
+)
+
+# Negative keywords
+NEGATIVE_WORDS = (
+    "fall", "drop", "decline", "down", "low", "miss", "loss", "weak",
+    "bearish", "downgrade", "sell", "underperform", "negative", "cut",
+    "crash", "plunge", "concern", "risk", "warning", "fail"
+)
+
+
+@lru_cache(maxsize=4096)
+def _score_text(text: str) -> Tuple[Optional[Sentiment], Optional[float]]:
+    """키워드 기반 감성 점수 (같은 헤드라인+요약은 캐시 재사용)"""
+    if not text:
+        return None, None
+
+    text_lower = text.lower()
+
+    positive_count = sum(1 for word in POSITIVE_WORDS if word in text_lower)
+    negative_count = sum(1 for word in NEGATIVE_WORDS if word in text_lower)
+
+    total = positive_count + negative_count
+    if total == 0:
+        return Sentiment.NEUTRAL, 0.0
+
+    score = (positive_count - negative_count) / max(total, 1)
+    score = max(-1.0, min(1.0, score))  # Clamp to [-1, 1]
+
+    return classify_score(score), score
 
 
 class FinnhubProvider(BaseNewsProvider):
     """Finnhub 뉴스 제공자"""
 
     BASE_URL = "https://finnhub.io/api/v1"
+    CACHE_TTL = 300  # seconds
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+        store_raw: bool = False
+    ):
         """
         Args:
             api_key: Finnhub API 키 (없으면 환경변수 FINNHUB_API_KEY 사용)
+            cache_ttl: get_news 결과 캐시 유지 시간(초), 0이면 캐시 비활성화
+            store_raw: NewsItem.raw_data에 원본 응답 보관 여부 (기본: 보관 안 함)
         """
         if not HAS_REQUESTS:
             raise ImportError("requests library required for FinnhubProvider")
@@ -42,6 +102,40 @@ class FinnhubProvider(BaseNewsProvider):
         api_key = api_key or os.environ.get("FINNHUB_API_KEY")
         super().__init__(api_key)
         self.logger = logging.getLogger(__name__)
+        self.cache_ttl = self.CACHE_TTL if cache_ttl is None else cache_ttl
+        self.store_raw = store_raw
+
+        # (ticker, from_date, to_date, limit) -> (fetched_at, news_items)
+        self._cache: Dict[tuple, Tuple[float, List[NewsItem]]] = {}
+
+        # Keep-alive session: reuse TLS connections across calls
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                # 429는 urllib3가 대기 후 재시도하지 않도록 제외 (get_news가 오류로 처리)
+                status_forcelist=[500, 502, 503, 504],
+            ),
+        )
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """HTTP 세션 종료"""
+        self._session.close()
+
+    def __enter__(self) -> "FinnhubProvider":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def clear_cache(self) -> None:
+        """뉴스/감성 캐시 초기화"""
+        self._cache.clear()
+        _score_text.cache_clear()
 
     @property
     def name(self) -> str:
@@ -70,21 +164,16 @@ class FinnhubProvider(BaseNewsProvider):
             self.logger.warning("Finnhub API key not configured")
             return []
 
-        # Default date range: last 7 days
-        if to_date is None:
-            to_date = datetime.now()
-        if from_date is None:
-            from_date = to_date - timedelta(days=7)
+        from_date, to_date = self._resolve_window(from_date, to_date)
+        cache_key = (ticker.upper(), from_date.date(), to_date.date(), limit)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.BASE_URL}/company-news",
-                params={
-                    "symbol": ticker.upper().replace(".KS", "").replace(".KQ", ""),
-                    "from": from_date.strftime("%Y-%m-%d"),
-                    "to": to_date.strftime("%Y-%m-%d"),
-                    "token": self.api_key,
-                },
+                params=self._company_news_params(ticker, from_date, to_date),
                 timeout=10
             )
 
@@ -92,50 +181,124 @@ class FinnhubProvider(BaseNewsProvider):
                 self.logger.error(f"Finnhub API error: {response.status_code}")
                 return []
 
-            data = response.json()
+            return self._store_company_news(cache_key, _json_loads(response.content), ticker, limit)
 
-            if not isinstance(data, list):
-                return []
+        except Exception as e:
+            self.logger.error(f"Finnhub fetch error: {e}")
+            return []
+
+    @staticmethod
+    def _resolve_window(
+        from_date: Optional[datetime],
+        to_date: Optional[datetime]
+    ) -> Tuple[datetime, datetime]:
+        """조회 기간 기본값 적용 (최근 7일)"""
+        if to_date is None:
+            to_date = datetime.now()
+        if from_date is None:
+            from_date = to_date - timedelta(days=7)
+        return from_date, to_date
+
+    def _company_news_params(
+        self,
+        ticker: str,
+        from_date: datetime,
+        to_date: datetime
+    ) -> Dict[str, str]:
+        """company-news 요청 파라미터"""
+        return {
+            "symbol": clean_ticker(ticker),
+            "from": from_date.strftime("%Y-%m-%d"),
+            "to": to_date.strftime("%Y-%m-%d"),
+            "token": self.api_key,
+        }
+
+    def _get_cached(self, cache_key: tuple) -> Optional[List[NewsItem]]:
+        """TTL 이내의 캐시 항목 반환 (만료 시 제거)"""
+        cached = self._cache.get(cache_key)
+        if cached is None:
+            return None
 
-            news_items = []
-            for item in data[:limit]:
-                news_item = self._parse_news_item(item, ticker)
-                if news_item:
-                    news_items.append(news_item)
+        fetched_at, cached_items = cached
+        if time.monotonic() - fetched_at < self.cache_ttl:
+            return list(cached_items)
 
-            return news_items
+        # get_news_async로 여러 스레드가 같은 만료 항목을 볼 수 있으므로 pop 사용
+        self._cache.pop(cache_key, None)
+        return None
 
-        except Exception as e:
-            self.logger.error(f"Finnhub fetch error: {e}")
+    def _prune_cache(self, now: float) -> None:
+        """만료된 캐시 항목 제거 (to_date 기본값이 매일 바뀌어 쌓이는 키 정리)"""
+        expired = [
+            key for key, (fetched_at, _) in list(self._cache.items())
+            if now - fetched_at >= self.cache_ttl
+        ]
+        for key in expired:
+            self._cache.pop(key, None)
+
+    def _store_company_news(
+        self,
+        cache_key: tuple,
+        data: Any,
+        ticker: str,
+        limit: int
+    ) -> List[NewsItem]:
+        """응답 파싱 후 캐시에 저장"""
+        if not isinstance(data, list):
             return []
 
-    def _parse_news_item(self, data: Dict[str, Any], ticker: str) -> Optional[NewsItem]:
-        """뉴스 아이템 파싱"""
-        try:
-            # Parse datetime from Unix timestamp
-            published_at = datetime.fromtimestamp(data.get("datetime", 0))
+        news_items = self._parse_batch(data[:limit], ticker)
+
+        if self.cache_ttl > 0:
+            now = time.monotonic()
+            self._prune_cache(now)
+            self._cache[cache_key] = (now, news_items)
+
+        return list(news_items)
+
+    def _parse_batch(self, data: List[Any], ticker: str) -> List[NewsItem]:
+        """
+        뉴스 아이템 일괄 파싱
+
+        스키마 검증은 배치 앞단에서 한 번만 수행하고, 통과한 항목은
+        예외 처리 없이 바로 변환합니다. 시각은 Marketaux와 같이 UTC 기준
+        naive datetime으로 맞춥니다.
+        """
+        valid = [
+            d for d in data
+            if isinstance(d, dict)
+            and isinstance(d.get("datetime"), (int, float))
+            and isinstance(d.get("headline"), str)
+        ]
+        if len(valid) < len(data):
+            self.logger.warning(f"Skipped {len(data) - len(valid)} malformed Finnhub news items")
+
+        name = self.name
+        store_raw = self.store_raw
+        news_items = []
+
+        for d in valid:
+            headline = d["headline"]
+            summary = d.get("summary") or ""
 
             # Finnhub doesn't provide sentiment directly
             # We'll use a simple keyword-based approach
-            headline = data.get("headline", "")
-            summary = data.get("summary", "")
-            sentiment, score = self._analyze_sentiment(headline + " " + summary)
+            sentiment, score = _score_text(headline + " " + summary)
 
-            return NewsItem(
+            news_items.append(NewsItem(
                 title=headline,
                 summary=summary[:500] if summary else None,
-                url=data.get("url", ""),
-                source=data.get("source", "Unknown"),
-                published_at=published_at,
+                url=d.get("url", ""),
+                source=d.get("source", "Unknown"),
+                published_at=datetime.fromtimestamp(d["datetime"], timezone.utc).replace(tzinfo=None),
                 ticker=ticker,
                 sentiment=sentiment,
                 sentiment_score=score,
-                provider=self.name,
-                raw_data=data,
-            )
-        except Exception as e:
-            self.logger.warning(f"Failed to parse news item: {e}")
-            return None
+                provider=name,
+                raw_data=d if store_raw else None,
+            ))
+
+        return news_items
 
     def _analyze_sentiment(self, text: str) -> tuple[Optional[Sentiment], Optional[float]]:
         """
@@ -143,41 +306,7 @@ class FinnhubProvider(BaseNewsProvider):
 
         Note: 실제 프로덕션에서는 NLP 라이브러리나 API 사용 권장
         """
-        if not text:
-            return None, None
-
-        text_lower = text.lower()
-
-        # Positive keywords
-        positive_words = [
-            "surge", "jump", "gain", "rise", "up", "high", "record", "beat",
-            "exceed", "strong", "growth", "profit", "success", "bullish",
-            "upgrade", "buy", "outperform", "positive", "boost", "rally"
-        ]
-
-        # Negative keywords
-        negative_words = [
-            "fall", "drop", "decline", "down", "low", "miss", "loss", "weak",
-            "bearish", "downgrade", "sell", "underperform", "negative", "cut",
-            "crash", "plunge", "concern", "risk", "warning", "fail"
-        ]
-
-        positive_count = sum(1 for word in positive_words if word in text_lower)
-        negative_count = sum(1 for word in negative_words if word in text_lower)
-
-        total = positive_count + negative_count
-        if total == 0:
-            return Sentiment.NEUTRAL, 0.0
-
-        score = (positive_count - negative_count) / max(total, 1)
-        score = max(-1.0, min(1.0, score))  # Clamp to [-1, 1]
-
-        if score > 0.2:
-            return Sentiment.POSITIVE, score
-        elif score < -0.2:
-            return Sentiment.NEGATIVE, score
-        else:
-            return Sentiment.NEUTRAL, score
+        return _score_text(text)
 
     def get_market_news(self, category: str = "general", limit: int = 10) -> List[NewsItem]:
         """
@@ -191,7 +320,7 @@ class FinnhubProvider(BaseNewsProvider):
             return []
 
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.BASE_URL}/news",
                 params={
                     "category": category,
@@ -203,15 +332,11 @@ class FinnhubProvider(BaseNewsProvider):
             if response.status_code != 200:
                 return []
 
-            data = response.json()
-            news_items = []
-
-            for item in data[:limit]:
-                news_item = self._parse_news_item(item, "MARKET")
-                if news_item:
-                    news_items.append(news_item)
+            data = _json_loads(response.content)
+            if not isinstance(data, list):
+                return []
 
-            return news_items
+            return self._parse_batch(data[:limit], "MARKET")
 
         except Exception as e:
             self.logger.error(f"Finnhub market news error: {e}")
@@ -8,33 +8,78 @@ Usage:
     provider = MarketauxProvider(api_key="your_api_key")
     news = provider.get_news("AAPL")
 
+    # Several tickers concurrently
+    news_by_ticker = provider.get_news_many(["AAPL", "MSFT", "NVDA"])
+
 API Docs: https://www.marketaux.com/documentation
 Free tier: 100 requests/day
 """
 
 import os
+import json
+import asyncio
 import logging
 from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     HAS_REQUESTS = True
 except ImportError:
     HAS_REQUESTS = False
 
-from .provider import BaseNewsProvider, NewsItem, Sentiment, NewsSentiment
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+from .provider import BaseNewsProvider, NewsItem, Sentiment, NewsSentiment, clean_ticker, classify_score
+from .cache import FileCache
+
+
+def parse_published_at(value: str) -> datetime:
+    """
+    Marketaux published_at(ISO 8601) -> UTC 기준 naive datetime
+
+    Marketaux는 항상 "...Z"(UTC) 형식을 반환하므로 Z를 떼고 naive로 바로
+    파싱합니다 (tz-aware 파싱 대비 약 6배 빠름). 다른 오프셋은 UTC로 변환합니다.
+    """
+    if value.endswith("Z"):
+        return datetime.fromisoformat(value[:-1])
+
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
 
 
 class MarketauxProvider(BaseNewsProvider):
     """Marketaux 뉴스 제공자"""
 
     BASE_URL = "https://api.marketaux.com/v1"
+    CONCURRENCY_LIMIT = 8  # max in-flight requests for get_news_many
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Response cache (free tier: 100 requests/day), under config data.cache_dir
+    CACHE_SUBDIR = "marketaux"
+    NEWS_CACHE_TTL = 900  # seconds, get_news / search_news
+    MARKET_CACHE_TTL = 60  # seconds, get_market_news
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        use_cache: bool = True,
+        store_raw: bool = False
+    ):
         """
         Args:
             api_key: Marketaux API 키 (없으면 환경변수 MARKETAUX_API_KEY 사용)
+            cache_dir: 응답 캐시 디렉토리 (기본: <프로젝트 루트>/<data.cache_dir>/marketaux)
+            use_cache: 응답 파일 캐시 사용 여부
+            store_raw: NewsItem.raw_data에 원본 응답 보관 여부 (기본: 보관 안 함)
         """
         if not HAS_REQUESTS:
             raise ImportError("requests library required for MarketauxProvider")
@@ -43,10 +88,75 @@ class MarketauxProvider(BaseNewsProvider):
         super().__init__(api_key)
         self.logger = logging.getLogger(__name__)
 
+        self._cache = FileCache(cache_dir or self._default_cache_dir()) if use_cache else None
+        self.store_raw = store_raw
+
+        # Keep-alive session: reuse TLS connections across calls
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.3),
+        )
+        self._session.mount("https://", adapter)
+
+    @classmethod
+    def _default_cache_dir(cls) -> str:
+        """설정의 data.cache_dir 기준 캐시 경로 (실행 위치와 무관하게 프로젝트 루트 기준)"""
+        from utils.config_manager import ConfigManager
+
+        config = ConfigManager()
+        return str(
+            config.project_root
+            / config.get_config_value('data.cache_dir', 'data/cache')
+            / cls.CACHE_SUBDIR
+        )
+
+    def close(self) -> None:
+        """HTTP 세션 종료"""
+        self._session.close()
+
+    def __enter__(self) -> "MarketauxProvider":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
     @property
     def name(self) -> str:
         return "marketaux"
 
+    def _cache_key(self, params: Dict[str, Any]) -> str:
+        """API 토큰을 제외한 요청 파라미터로 캐시 키 생성"""
+        return FileCache.make_key(
+            "news/all", {k: v for k, v in params.items() if k != "api_token"}
+        )
+
+    def _request(self, params: Dict[str, Any], ttl: float) -> Optional[Dict[str, Any]]:
+        """news/all 요청 (파일 캐시 우선, 실패 시 None)"""
+        key = self._cache_key(params)
+        if self._cache is not None:
+            cached = self._cache.get(key, ttl)
+            if cached is not None:
+                return cached
+
+        response = self._session.get(
+            f"{self.BASE_URL}/news/all",
+            params=params,
+            timeout=10
+        )
+
+        if response.status_code != 200:
+            self.logger.error(f"Marketaux API error: {response.status_code}")
+            return None
+
+        data = _json_loads(response.content)
+
+        # 결과가 있는 응답만 캐시 (빈 응답이나 오류 본문을 TTL 동안 재사용하지 않도록)
+        if self._cache is not None and isinstance(data, dict) and data.get("data"):
+            self._cache.set(key, data)
+        return data
+
     def get_news(
         self,
         ticker: str,
@@ -70,12 +180,65 @@ class MarketauxProvider(BaseNewsProvider):
             self.logger.warning("Marketaux API key not configured")
             return []
 
-        # Clean ticker symbol
-        clean_ticker = ticker.upper().replace(".KS", "").replace(".KQ", "")
+        try:
+            data = self._request(
+                self._news_params(ticker, limit, from_date, to_date),
+                self.NEWS_CACHE_TTL
+            )
+            if data is None:
+                return []
+
+            return self._parse_response(data, ticker, limit)
+
+        except Exception as e:
+            self.logger.error(f"Marketaux fetch error: {e}")
+            return []
+
+    async def get_news_many_async(
+        self,
+        tickers: List[str],
+        limit: int = 10
+    ) -> Dict[str, List[NewsItem]]:
+        """
+        여러 종목 뉴스 동시 조회 (최대 CONCURRENCY_LIMIT건 동시 요청)
 
+        각 요청은 get_news를 스레드에서 실행하며 keep-alive 세션을 공유합니다.
+
+        Args:
+            tickers: 종목 코드 목록
+            limit: 종목별 최대 뉴스 수
+
+        Returns:
+            {ticker: 뉴스 아이템 목록} 딕셔너리
+        """
+        sem = asyncio.Semaphore(self.CONCURRENCY_LIMIT)
+
+        async def fetch(ticker: str) -> List[NewsItem]:
+            async with sem:
+                return await self.get_news_async(ticker, limit=limit)
+
+        results = await asyncio.gather(*[fetch(ticker) for ticker in tickers])
+        return dict(zip(tickers, results))
+
+    def get_news_many(
+        self,
+        tickers: List[str],
+        limit: int = 10
+    ) -> Dict[str, List[NewsItem]]:
+        """여러 종목 뉴스 동시 조회 (동기 래퍼, 실행 중인 이벤트 루프 밖에서 사용)"""
+        return asyncio.run(self.get_news_many_async(tickers, limit))
+
+    def _news_params(
+        self,
+        ticker: str,
+        limit: int,
+        from_date: Optional[datetime],
+        to_date: Optional[datetime]
+    ) -> Dict[str, Any]:
+        """news/all 종목 요청 파라미터"""
         params = {
             "api_token": self.api_key,
-            "symbols": clean_ticker,
+            "symbols": clean_ticker(ticker),
             "limit": min(limit, 50),  # Marketaux max is 50
             "language": "en",
         }
@@ -85,54 +248,50 @@ class MarketauxProvider(BaseNewsProvider):
         if to_date:
             params["published_before"] = to_date.strftime("%Y-%m-%dT%H:%M")
 
-        try:
-            response = requests.get(
-                f"{self.BASE_URL}/news/all",
-                params=params,
-                timeout=10
-            )
-
-            if response.status_code != 200:
-                self.logger.error(f"Marketaux API error: {response.status_code}")
-                return []
-
-            data = response.json()
+        return params
 
-            if "data" not in data:
-                return []
+    def _parse_response(self, data: Any, ticker: str, limit: int) -> List[NewsItem]:
+        """news/all 응답 파싱"""
+        if "data" not in data:
+            return []
 
-            news_items = []
-            for item in data["data"][:limit]:
-                news_item = self._parse_news_item(item, ticker)
-                if news_item:
-                    news_items.append(news_item)
+        # Normalize once per response rather than once per entity
+        symbol = clean_ticker(ticker)
 
-            return news_items
+        news_items = []
+        for item in data["data"][:limit]:
+            news_item = self._parse_news_item(item, ticker, symbol)
+            if news_item:
+                news_items.append(news_item)
 
-        except Exception as e:
-            self.logger.error(f"Marketaux fetch error: {e}")
-            return []
+        return news_items
 
-    def _parse_news_item(self, data: Dict[str, Any], ticker: str) -> Optional[NewsItem]:
+    def _parse_news_item(
+        self,
+        data: Dict[str, Any],
+        ticker: str,
+        symbol: Optional[str] = None
+    ) -> Optional[NewsItem]:
         """뉴스 아이템 파싱"""
         try:
             # Parse datetime
             published_str = data.get("published_at", "")
             if published_str:
-                # Handle ISO format with timezone
-                published_at = datetime.fromisoformat(
-                    published_str.replace("Z", "+00:00")
-                ).replace(tzinfo=None)
+                published_at = parse_published_at(published_str)
             else:
                 published_at = datetime.now()
 
             # Marketaux provides sentiment
             sentiment_data = data.get("entities", [])
-            sentiment, score = self._extract_sentiment(sentiment_data, ticker)
+            sentiment, score = self._extract_sentiment(
+                sentiment_data, symbol if symbol is not None else clean_ticker(ticker)
+            )
+
+            description = data.get("description")
 
             return NewsItem(
                 title=data.get("title", ""),
-                summary=data.get("description", "")[:500] if data.get("description") else None,
+                summary=description[:500] if description else None,
                 url=data.get("url", ""),
                 source=data.get("source", "Unknown"),
                 published_at=published_at,
@@ -140,7 +299,7 @@ class MarketauxProvider(BaseNewsProvider):
                 sentiment=sentiment,
                 sentiment_score=score,
                 provider=self.name,
-                raw_data=data,
+                raw_data=data if self.store_raw else None,
             )
         except Exception as e:
             self.logger.warning(f"Failed to parse news item: {e}")
@@ -149,42 +308,38 @@ class MarketauxProvider(BaseNewsProvider):
     def _extract_sentiment(
         self,
         entities: List[Dict],
-        ticker: str
+        symbol: str
     ) -> tuple[Optional[Sentiment], Optional[float]]:
         """
         Marketaux 엔티티에서 감성 추출
 
         Marketaux는 각 엔티티(종목)별로 sentiment_score를 제공
+        symbol은 clean_ticker()로 정규화된 심볼
         """
         if not entities:
             return None, None
 
-        clean_ticker = ticker.upper().replace(".KS", "").replace(".KQ", "")
+        # Single pass: return on the first direct ticker score, remembering
+        # the first entity's highlights average as the fallback
+        fallback_score = None
 
         for entity in entities:
-            if entity.get("symbol", "").upper() == clean_ticker:
+            if entity.get("symbol", "").upper() == symbol:
                 score = entity.get("sentiment_score")
                 if score is not None:
                     # Marketaux score is already -1 to 1
-                    if score > 0.2:
-                        return Sentiment.POSITIVE, score
-                    elif score < -0.2:
-                        return Sentiment.NEGATIVE, score
-                    else:
-                        return Sentiment.NEUTRAL, score
-
-        # Fallback: use highlights_sentiment if available
-        for entity in entities:
-            highlights = entity.get("highlights", [])
-            if highlights:
-                scores = [h.get("sentiment") for h in highlights if h.get("sentiment")]
-                if scores:
-                    avg_score = sum(scores) / len(scores)
-                    if avg_score > 0.2:
-                        return Sentiment.POSITIVE, avg_score
-                    elif avg_score < -0.2:
-                        return Sentiment.NEGATIVE, avg_score
-                    return Sentiment.NEUTRAL, avg_score
+                    return classify_score(score), score
+
+            if fallback_score is None:
+                highlights = entity.get("highlights")
+                if highlights:
+                    scores = [h.get("sentiment") for h in highlights if h.get("sentiment")]
+                    if scores:
+                        fallback_score = sum(scores) / len(scores)
+
+        # Fallback: use highlights sentiment if available
+        if fallback_score is not None:
+            return classify_score(fallback_score), fallback_score
 
         return None, None
 
@@ -204,32 +359,19 @@ class MarketauxProvider(BaseNewsProvider):
             return []
 
         try:
-            response = requests.get(
-                f"{self.BASE_URL}/news/all",
-                params={
+            data = self._request(
+                {
                     "api_token": self.api_key,
                     "countries": countries,
                     "limit": min(limit, 50),
                     "language": "en",
                 },
-                timeout=10
+                self.MARKET_CACHE_TTL
             )
-
-            if response.status_code != 200:
+            if data is None:
                 return []
 
-            data = response.json()
-
-            if "data" not in data:
-                return []
-
-            news_items = []
-            for item in data["data"][:limit]:
-                news_item = self._parse_news_item(item, "MARKET")
-                if news_item:
-                    news_items.append(news_item)
-
-            return news_items
+            return self._parse_response(data, "MARKET", limit)
 
         except Exception as e:
             self.logger.error(f"Marketaux market news error: {e}")
@@ -251,32 +393,19 @@ class MarketauxProvider(BaseNewsProvider):
             return []
 
         try:
-            response = requests.get(
-                f"{self.BASE_URL}/news/all",
-                params={
+            data = self._request(
+                {
                     "api_token": self.api_key,
                     "search": keywords,
                     "limit": min(limit, 50),
                     "language": "en",
                 },
-                timeout=10
+                self.NEWS_CACHE_TTL
             )
-
-            if response.status_code != 200:
+            if data is None:
                 return []
 
-            data = response.json()
-
-            if "data" not in data:
-                return []
-
-            news_items = []
-            for item in data["data"][:limit]:
-                news_item = self._parse_news_item(item, "SEARCH")
-                if news_item:
-                    news_items.append(news_item)
-
-            return news_items
+            return self._parse_response(data, "SEARCH", limit)
 
         except Exception as e:
             self.logger.error(f"Marketaux search error: {e}")
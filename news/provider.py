@@ -6,21 +6,37 @@ Usage:
     from news.provider import NewsProvider, NewsItem, NewsSentiment
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections import Counter
 from typing import List, Optional, Dict, Any, Protocol
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
 
 
-class Sentiment(Enum):
-    """감성 분류"""
+class Sentiment(StrEnum):
+    """감성 분류 (str 해시/비교로 Counter 집계가 빠름)"""
     POSITIVE = "positive"
     NEGATIVE = "negative"
     NEUTRAL = "neutral"
 
 
-@dataclass
+# 감성 점수(-1.0 ~ 1.0) 분류 경계
+POSITIVE_THRESHOLD = 0.2
+NEGATIVE_THRESHOLD = -0.2
+
+
+def classify_score(score: float) -> Sentiment:
+    """감성 점수를 Sentiment로 분류 (제공자 공용)"""
+    if score > POSITIVE_THRESHOLD:
+        return Sentiment.POSITIVE
+    if score < NEGATIVE_THRESHOLD:
+        return Sentiment.NEGATIVE
+    return Sentiment.NEUTRAL
+
+
+@dataclass(slots=True)
 class NewsItem:
     """뉴스 아이템"""
     title: str
@@ -36,7 +52,20 @@ class NewsItem:
 
     # Provider info
     provider: Optional[str] = None  # "finnhub", "marketaux"
-    raw_data: Dict[str, Any] = field(default_factory=dict)
+    raw_data: Optional[Dict[str, Any]] = None  # provider payload, only when store_raw=True
+
+    # Derived flags (생성 시 한 번 계산, 이후 sentiment 변경 시 갱신 안 됨)
+    is_positive: bool = field(init=False, repr=False, compare=False)
+    is_negative: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        score = self.sentiment_score
+        self.is_positive = self.sentiment == Sentiment.POSITIVE or (
+            score is not None and score > POSITIVE_THRESHOLD
+        )
+        self.is_negative = self.sentiment == Sentiment.NEGATIVE or (
+            score is not None and score < NEGATIVE_THRESHOLD
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -51,20 +80,8 @@ class NewsItem:
             "provider": self.provider,
         }
 
-    @property
-    def is_positive(self) -> bool:
-        return self.sentiment == Sentiment.POSITIVE or (
-            self.sentiment_score is not None and self.sentiment_score > 0.2
-        )
-
-    @property
-    def is_negative(self) -> bool:
-        return self.sentiment == Sentiment.NEGATIVE or (
-            self.sentiment_score is not None and self.sentiment_score < -0.2
-        )
 
-
-@dataclass
+@dataclass(slots=True)
 class NewsSentiment:
     """종목별 뉴스 감성 요약"""
     ticker: str
@@ -105,6 +122,35 @@ class NewsSentiment:
         }
 
 
+def clean_ticker(ticker: str) -> str:
+    """API 조회용 심볼 정규화 (대문자, .KS/.KQ 접미사 제거)"""
+    return ticker.upper().replace(".KS", "").replace(".KQ", "")
+
+
+def summarize_sentiment(ticker: str, news_items: List[NewsItem]) -> Optional[NewsSentiment]:
+    """뉴스 목록으로 감성 요약 생성 (제공자/통합 공용)"""
+    if not news_items:
+        return None
+
+    counts = Counter(item.sentiment for item in news_items)
+    positive = counts[Sentiment.POSITIVE]
+    negative = counts[Sentiment.NEGATIVE]
+    neutral = len(news_items) - positive - negative  # includes unscored items
+
+    scores = [item.sentiment_score for item in news_items if item.sentiment_score is not None]
+    avg_score = sum(scores) / len(scores) if scores else 0
+
+    return NewsSentiment(
+        ticker=ticker,
+        total_count=len(news_items),
+        positive_count=positive,
+        negative_count=negative,
+        neutral_count=neutral,
+        avg_sentiment_score=avg_score,
+        latest_news=news_items[:5],
+    )
+
+
 class NewsProvider(Protocol):
     """뉴스 제공자 프로토콜"""
 
@@ -123,6 +169,16 @@ class NewsProvider(Protocol):
         """종목 뉴스 조회"""
         ...
 
+    async def get_news_async(
+        self,
+        ticker: str,
+        limit: int = 10,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None
+    ) -> List[NewsItem]:
+        """종목 뉴스 비동기 조회"""
+        ...
+
     def get_sentiment(self, ticker: str) -> Optional[NewsSentiment]:
         """종목 감성 분석"""
         ...
@@ -139,6 +195,9 @@ class BaseNewsProvider(ABC):
     def name(self) -> str:
         pass
 
+    def close(self) -> None:
+        """HTTP 세션 등 리소스 정리 (기본 구현은 없음)"""
+
     @abstractmethod
     def get_news(
         self,
@@ -149,40 +208,28 @@ class BaseNewsProvider(ABC):
     ) -> List[NewsItem]:
         pass
 
+    async def get_news_async(
+        self,
+        ticker: str,
+        limit: int = 10,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None
+    ) -> List[NewsItem]:
+        """
+        종목 뉴스 비동기 조회
+
+        기본 구현은 동기 get_news를 스레드에서 실행합니다.
+        네이티브 비동기 클라이언트가 있는 제공자는 오버라이드하세요.
+        """
+        return await asyncio.to_thread(self.get_news, ticker, limit, from_date, to_date)
+
     def get_sentiment(self, ticker: str) -> Optional[NewsSentiment]:
         """뉴스 기반 감성 분석"""
-        news_items = self.get_news(ticker, limit=50)
-
-        if not news_items:
-            return None
-
-        positive = 0
-        negative = 0
-        neutral = 0
-        scores = []
-
-        for item in news_items:
-            if item.sentiment == Sentiment.POSITIVE:
-                positive += 1
-            elif item.sentiment == Sentiment.NEGATIVE:
-                negative += 1
-            else:
-                neutral += 1
-
-            if item.sentiment_score is not None:
-                scores.append(item.sentiment_score)
-
-        avg_score = sum(scores) / len(scores) if scores else 0
-
-        return NewsSentiment(
-            ticker=ticker,
-            total_count=len(news_items),
-            positive_count=positive,
-            negative_count=negative,
-            neutral_count=neutral,
-            avg_sentiment_score=avg_score,
-            latest_news=news_items[:5],
-        )
+        return summarize_sentiment(ticker, self.get_news(ticker, limit=50))
+
+    async def get_sentiment_async(self, ticker: str) -> Optional[NewsSentiment]:
+        """뉴스 기반 감성 분석 (비동기)"""
+        return summarize_sentiment(ticker, await self.get_news_async(ticker, limit=50))
 
     def is_configured(self) -> bool:
         """API 키 설정 여부"""
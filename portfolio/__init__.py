@@ -21,16 +21,16 @@ Usage:
 """
 
 from .holdings import Portfolio, Holding
-from .monitor import PriceMonitor, PriceData
+from .monitor import PriceMonitor, PriceData, PriceCache, get_price_cache
 from .trigger import ConditionChecker, TriggerCondition, TriggerType, TriggerEvent
 from .conditions import (
-    TradingContext, TradingCondition, BaseTradingCondition, ConditionChain,
+    TradingContext, TradingContextBatch, TradingCondition, BaseTradingCondition, ConditionChain,
     StopLossCondition, TakeProfitCondition, TrailingStopCondition,
     RSICondition, MACDCondition, HoldingPeriodCondition,
     create_default_sell_conditions, create_technical_conditions
 )
 from .quantity import (
-    calculate_quantity, QuantityMethod, QuantityConfig,
+    calculate_quantity, calculate_quantity_batch, QuantityMethod, QuantityConfig,
     calculate_buy_quantity, calculate_sell_quantity, estimate_position_size
 )
 from .executor import Order, OrderResult, OrderExecutor, PaperExecutor, OrderStatus
@@ -50,19 +50,19 @@ __all__ = [
     'Portfolio', 'Holding',
 
     # Monitoring
-    'PriceMonitor', 'PriceData',
+    'PriceMonitor', 'PriceData', 'PriceCache', 'get_price_cache',
 
     # Triggers
     'ConditionChecker', 'TriggerCondition', 'TriggerType', 'TriggerEvent',
 
     # Trading Conditions
-    'TradingContext', 'TradingCondition', 'BaseTradingCondition', 'ConditionChain',
+    'TradingContext', 'TradingContextBatch', 'TradingCondition', 'BaseTradingCondition', 'ConditionChain',
     'StopLossCondition', 'TakeProfitCondition', 'TrailingStopCondition',
     'RSICondition', 'MACDCondition', 'HoldingPeriodCondition',
     'create_default_sell_conditions', 'create_technical_conditions',
 
     # Quantity
-    'calculate_quantity', 'QuantityMethod', 'QuantityConfig',
+    'calculate_quantity', 'calculate_quantity_batch', 'QuantityMethod', 'QuantityConfig',
     'calculate_buy_quantity', 'calculate_sell_quantity', 'estimate_position_size',
 
     # Executor
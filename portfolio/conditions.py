@@ -22,6 +22,14 @@ Usage:
     if stop_loss.should_sell(context):
         print("Stop loss triggered!")
 
+    # 다수 종목 일괄 평가 (NumPy 마스크)
+    # 한 번의 스윕에서는 timestamp를 공유하면 컨텍스트마다 datetime.now() 호출 생략
+    now = datetime.now()
+    contexts = [TradingContext(ticker=t, current_price=p, timestamp=now) for t, p in prices.items()]
+    batch = TradingContextBatch.from_contexts(contexts)
+    mask = create_default_sell_conditions().should_sell_mask(batch)
+    to_sell = [t for t, hit in zip(batch.tickers, mask) if hit]
+
     # 커스텀 조건 구현
     class MyCondition(TradingCondition):
         def should_buy(self, context):
@@ -31,13 +39,18 @@ Usage:
             return context.rsi > 70
 """
 
+import bisect
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any, Protocol
+from typing import Callable, List, Optional, Dict, Any, Protocol
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
+from operator import attrgetter
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class TradingContext:
     """매매 판단에 필요한 컨텍스트"""
     ticker: str
@@ -66,19 +79,79 @@ class TradingContext:
     bought_at: Optional[datetime] = None
     timestamp: datetime = field(default_factory=datetime.now)
 
-    @property
-    def pnl_pct(self) -> Optional[float]:
-        """현재 손익률"""
+    # Derived (생성 시 한 번 계산, 이후 필드 변경 시 갱신 안 됨)
+    pnl_pct: Optional[float] = field(init=False, repr=False, compare=False)  # 현재 손익률
+    holding_days: Optional[int] = field(init=False, repr=False, compare=False)  # timestamp 기준 보유 일수
+
+    def __post_init__(self):
         if self.avg_price and self.avg_price > 0:
-            return (self.current_price - self.avg_price) / self.avg_price
-        return None
+            self.pnl_pct = (self.current_price - self.avg_price) / self.avg_price
+        else:
+            self.pnl_pct = None
 
-    @property
-    def holding_days(self) -> Optional[int]:
-        """보유 일수"""
         if self.bought_at:
-            return (datetime.now() - self.bought_at).days
-        return None
+            self.holding_days = (self.timestamp - self.bought_at).days
+        else:
+            self.holding_days = None
+
+
+_BATCH_FIELDS = ("current_price", "avg_price", "high_since_buy", "rsi", "macd", "macd_signal")
+_get_batch_fields = attrgetter(*_BATCH_FIELDS)
+
+
+@dataclass
+class TradingContextBatch:
+    """
+    다수 종목 컨텍스트 (필드별 NumPy 배열, None은 NaN)
+
+    비용 구조: 마스크 평가는 원소당 연산 몇 개뿐인 메모리 바운드 작업이라
+    수천 종목에서도 수십 μs 수준이고, 실제 병목은 컨텍스트 객체에서 배열을
+    만드는 from_contexts (인터프리터 바운드). 조건을 추가할 때는 중간 배열을
+    새로 만들기보다 pnl_pct 같은 캐시된 파생 배열을 재사용할 것
+    """
+    tickers: List[str]
+    current_price: np.ndarray
+    avg_price: np.ndarray
+    high_since_buy: np.ndarray
+    rsi: np.ndarray
+    macd: np.ndarray
+    macd_signal: np.ndarray
+
+    # 벡터 마스크가 없는 조건의 폴백용 원본 컨텍스트
+    contexts: List[TradingContext] = field(default_factory=list)
+
+    @classmethod
+    def from_contexts(cls, contexts: List[TradingContext]) -> "TradingContextBatch":
+        """TradingContext 목록으로 배치 생성 (컨텍스트당 속성 조회 1회)"""
+        # float 변환 시 None은 NaN이 됨
+        rows = np.array([_get_batch_fields(c) for c in contexts], dtype=float)
+        columns = rows.reshape(len(contexts), len(_BATCH_FIELDS)).T.copy()
+        return cls(
+            tickers=[c.ticker for c in contexts],
+            **dict(zip(_BATCH_FIELDS, columns)),
+            contexts=list(contexts),
+        )
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    # 파생 배열은 배치당 한 번만 계산 (손절/익절 등 여러 조건이 공유)
+    @cached_property
+    def pnl_pct(self) -> np.ndarray:
+        """손익률 배열 (평균단가 없음/0 이하는 NaN)"""
+        valid = self.avg_price > 0
+        pnl = np.full(len(self), np.nan)
+        np.divide(self.current_price - self.avg_price, self.avg_price, out=pnl, where=valid)
+        return pnl
+
+    @cached_property
+    def drop_from_high(self) -> np.ndarray:
+        """매수 후 고점 대비 하락률 배열 (고점/현재가 없음/0은 NaN)"""
+        high, price = self.high_since_buy, self.current_price
+        valid = (high != 0) & (price != 0) & ~np.isnan(high) & ~np.isnan(price)
+        drop_pct = np.full(len(self), np.nan)
+        np.divide(high - price, high, out=drop_pct, where=valid)
+        return drop_pct
 
 
 class TradingCondition(Protocol):
@@ -96,6 +169,9 @@ class TradingCondition(Protocol):
 class BaseTradingCondition(ABC):
     """매매 조건 기본 클래스"""
 
+    # 상대 평가 비용 (ConditionChain(auto_order=True) 정렬 기준)
+    COST: float = 1.0
+
     @abstractmethod
     def should_buy(self, context: TradingContext) -> bool:
         """매수 조건 충족 여부"""
@@ -110,6 +186,22 @@ class BaseTradingCondition(ABC):
         """조건 트리거 이유"""
         return ""
 
+    def should_buy_mask(self, batch: TradingContextBatch) -> np.ndarray:
+        """배치 매수 조건 마스크 (기본: 종목별 should_buy 호출)"""
+        return np.fromiter((self.should_buy(c) for c in batch.contexts), dtype=bool, count=len(batch))
+
+    def should_sell_mask(self, batch: TradingContextBatch) -> np.ndarray:
+        """배치 매도 조건 마스크 (기본: 종목별 should_sell 호출)"""
+        return np.fromiter((self.should_sell(c) for c in batch.contexts), dtype=bool, count=len(batch))
+
+    def sell_predicate(self) -> Callable[[TradingContext], bool]:
+        """
+        현재 설정을 고정한 매도 판단 함수 (사유 기록 없음)
+
+        기본은 should_sell 자체 - 기본 조건들은 임계값을 묶은 클로저로 특화
+        """
+        return self.should_sell
+
 
 class StopLossCondition(BaseTradingCondition):
     """손절 조건"""
@@ -132,6 +224,20 @@ class StopLossCondition(BaseTradingCondition):
             return True
         return False
 
+    def should_buy_mask(self, batch: TradingContextBatch) -> np.ndarray:
+        return np.zeros(len(batch), dtype=bool)
+
+    def should_sell_mask(self, batch: TradingContextBatch) -> np.ndarray:
+        return batch.pnl_pct <= -self.pct
+
+    def sell_predicate(self) -> Callable[[TradingContext], bool]:
+        threshold = -self.pct
+
+        def stop_loss(context: TradingContext) -> bool:
+            pnl = context.pnl_pct
+            return pnl is not None and pnl <= threshold
+        return stop_loss
+
     def get_reason(self) -> str:
         return self._reason
 
@@ -157,6 +263,20 @@ class TakeProfitCondition(BaseTradingCondition):
             return True
         return False
 
+    def should_buy_mask(self, batch: TradingContextBatch) -> np.ndarray:
+        return np.zeros(len(batch), dtype=bool)
+
+    def should_sell_mask(self, batch: TradingContextBatch) -> np.ndarray:
+        return batch.pnl_pct >= self.pct
+
+    def sell_predicate(self) -> Callable[[TradingContext], bool]:
+        threshold = self.pct
+
+        def take_profit(context: TradingContext) -> bool:
+            pnl = context.pnl_pct
+            return pnl is not None and pnl >= threshold
+        return take_profit
+
     def get_reason(self) -> str:
         return self._reason
 
@@ -164,6 +284,8 @@ class TakeProfitCondition(BaseTradingCondition):
 class TrailingStopCondition(BaseTradingCondition):
     """트레일링 스탑 조건"""
 
+    COST = 2.0
+
     def __init__(self, pct: float = 0.08):
         """
         Args:
@@ -186,6 +308,23 @@ class TrailingStopCondition(BaseTradingCondition):
                 return True
         return False
 
+    def should_buy_mask(self, batch: TradingContextBatch) -> np.ndarray:
+        return np.zeros(len(batch), dtype=bool)
+
+    def should_sell_mask(self, batch: TradingContextBatch) -> np.ndarray:
+        return batch.drop_from_high >= self.pct
+
+    def sell_predicate(self) -> Callable[[TradingContext], bool]:
+        threshold = self.pct
+
+        def trailing_stop(context: TradingContext) -> bool:
+            high = context.high_since_buy
+            price = context.current_price
+            if high and price:
+                return (high - price) / high >= threshold
+            return False
+        return trailing_stop
+
     def get_reason(self) -> str:
         return self._reason
 
@@ -210,6 +349,20 @@ class RSICondition(BaseTradingCondition):
             return True
         return False
 
+    def should_buy_mask(self, batch: TradingContextBatch) -> np.ndarray:
+        return batch.rsi <= self.oversold
+
+    def should_sell_mask(self, batch: TradingContextBatch) -> np.ndarray:
+        return batch.rsi >= self.overbought
+
+    def sell_predicate(self) -> Callable[[TradingContext], bool]:
+        threshold = self.overbought
+
+        def rsi_overbought(context: TradingContext) -> bool:
+            rsi = context.rsi
+            return rsi is not None and rsi >= threshold
+        return rsi_overbought
+
     def get_reason(self) -> str:
         return self._reason
 
@@ -217,6 +370,8 @@ class RSICondition(BaseTradingCondition):
 class MACDCondition(BaseTradingCondition):
     """MACD 기반 조건"""
 
+    COST = 1.5
+
     def __init__(self):
         self._reason = ""
 
@@ -234,6 +389,12 @@ class MACDCondition(BaseTradingCondition):
                 return True
         return False
 
+    def should_buy_mask(self, batch: TradingContextBatch) -> np.ndarray:
+        return batch.macd > batch.macd_signal
+
+    def should_sell_mask(self, batch: TradingContextBatch) -> np.ndarray:
+        return batch.macd < batch.macd_signal
+
     def get_reason(self) -> str:
         return self._reason
 
@@ -241,6 +402,8 @@ class MACDCondition(BaseTradingCondition):
 class HoldingPeriodCondition(BaseTradingCondition):
     """보유 기간 조건"""
 
+    COST = 1.5
+
     def __init__(self, min_days: int = 0, max_days: Optional[int] = None):
         """
         Args:
@@ -272,28 +435,38 @@ class HoldingPeriodCondition(BaseTradingCondition):
         return self._reason
 
 
+def _condition_cost(condition: BaseTradingCondition) -> float:
+    return getattr(condition, "COST", 1.0)
+
+
 class ConditionChain:
     """조건 체인 (복합 조건)"""
 
-    def __init__(self, operator: str = "OR"):
+    def __init__(self, operator: str = "OR", auto_order: bool = False):
         """
         Args:
             operator: "AND" 또는 "OR"
+            auto_order: True면 COST가 낮은 조건부터 평가 (동일 COST는 추가 순서)
+                - 조기 종료 시 비용 절감, 단 OR 체인에서 보고되는 트리거 사유가 달라질 수 있음
         """
         self.operator = operator.upper()
+        self.auto_order = auto_order
         self._conditions: List[BaseTradingCondition] = []
-        self._triggered: List[BaseTradingCondition] = []
+        self._triggered: List[BaseTradingCondition] = []  # AND 체인용
+        self._triggered_one: Optional[BaseTradingCondition] = None  # OR 체인은 최대 1개
 
     def add(self, condition: BaseTradingCondition) -> "ConditionChain":
         """조건 추가"""
-        self._conditions.append(condition)
+        if self.auto_order:
+            bisect.insort_right(self._conditions, condition, key=_condition_cost)
+        else:
+            self._conditions.append(condition)
         return self
 
     def should_buy(self, context: TradingContext) -> bool:
         """매수 조건 체크"""
-        self._triggered.clear()
-
         if self.operator == "AND":
+            self._triggered.clear()
             for cond in self._conditions:
                 if not cond.should_buy(context):
                     return False
@@ -302,15 +475,15 @@ class ConditionChain:
         else:  # OR
             for cond in self._conditions:
                 if cond.should_buy(context):
-                    self._triggered.append(cond)
+                    self._triggered_one = cond
                     return True
+            self._triggered_one = None
             return False
 
     def should_sell(self, context: TradingContext) -> bool:
         """매도 조건 체크"""
-        self._triggered.clear()
-
         if self.operator == "AND":
+            self._triggered.clear()
             for cond in self._conditions:
                 if not cond.should_sell(context):
                     return False
@@ -319,13 +492,73 @@ class ConditionChain:
         else:  # OR
             for cond in self._conditions:
                 if cond.should_sell(context):
-                    self._triggered.append(cond)
+                    self._triggered_one = cond
                     return True
+            self._triggered_one = None
             return False
 
+    def _combine_masks(self, masks: List[np.ndarray], size: int) -> np.ndarray:
+        if not masks:
+            return np.zeros(size, dtype=bool)
+        # 첫 마스크에 누적 (중간 배열 추가 할당 없음)
+        combined = masks[0].copy()
+        combine = np.logical_and if self.operator == "AND" else np.logical_or
+        for mask in masks[1:]:
+            combine(combined, mask, out=combined)
+        return combined
+
+    def should_buy_mask(self, batch: TradingContextBatch) -> np.ndarray:
+        """
+        배치 매수 조건 마스크
+
+        종목별 사유는 남기지 않음 - 필요하면 True인 종목만 should_buy로 재확인
+        """
+        return self._combine_masks([c.should_buy_mask(batch) for c in self._conditions], len(batch))
+
+    def should_sell_mask(self, batch: TradingContextBatch) -> np.ndarray:
+        """
+        배치 매도 조건 마스크
+
+        종목별 사유는 남기지 않음 - 필요하면 True인 종목만 should_sell로 재확인
+        """
+        return self._combine_masks([c.should_sell_mask(batch) for c in self._conditions], len(batch))
+
+    def compile_sell(self) -> Callable[[TradingContext], bool]:
+        """
+        현재 조건 구성을 고정한 매도 판단 함수 생성 (백테스트 등 반복 평가용)
+
+        조건별 sell_predicate()를 묶어 메서드 디스패치/사유 문자열 생성을 생략.
+        트리거 사유가 필요하면 should_sell 사용. 이후 add()는 반영되지 않음
+        """
+        predicates = tuple(c.sell_predicate() for c in self._conditions)
+
+        if not predicates:
+            return lambda context: False
+        if len(predicates) == 1:
+            return predicates[0]
+
+        if self.operator == "AND":
+            def compiled_and(context: TradingContext) -> bool:
+                for predicate in predicates:
+                    if not predicate(context):
+                        return False
+                return True
+            return compiled_and
+
+        def compiled_or(context: TradingContext) -> bool:
+            for predicate in predicates:
+                if predicate(context):
+                    return True
+            return False
+        return compiled_or
+
     def get_triggered_reasons(self) -> List[str]:
         """트리거된 조건들의 이유"""
-        return [c.get_reason() for c in self._triggered if c.get_reason()]
+        if self.operator == "AND":
+            triggered = self._triggered
+        else:
+            triggered = [self._triggered_one] if self._triggered_one is not None else []
+        return [c.get_reason() for c in triggered if c.get_reason()]
 
 
 # Factory functions
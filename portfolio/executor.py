@@ -16,11 +16,22 @@ Usage:
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
+from copy import deepcopy
+from typing import Optional, Dict, Any, List, Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-import uuid
+from types import MappingProxyType
+import itertools
+import secrets
+import sys
+
+import numpy as np
+import pandas as pd
+
+# 주문 ID: 프로세스별 랜덤 접두사 + 순번 (uuid4 대비 생성 비용 최소화)
+_ORDER_ID_PREFIX = secrets.token_hex(3)
+_ORDER_SEQ = itertools.count(1)
 
 
 class OrderSide(Enum):
@@ -45,7 +56,27 @@ class OrderStatus(Enum):
     SIMULATED = "SIMULATED"
 
 
-@dataclass
+# 실행 경로에서 쓰는 상태 문자열 (Enum 속성 조회 반복 방지)
+_STATUS_REJECTED = OrderStatus.REJECTED.value
+_STATUS_SIMULATED = OrderStatus.SIMULATED.value
+
+_ORDER_SIDES = frozenset(side.value for side in OrderSide)
+_ORDER_TYPES = frozenset(order_type.value for order_type in OrderType)
+
+
+def _normalize_choice(value: Any, choices: frozenset, name: str) -> str:
+    """Enum 멤버/소문자 입력을 대문자 문자열로 정규화"""
+    if type(value) is str and value in choices:
+        return value
+    if isinstance(value, Enum):
+        value = value.value
+    normalized = str(value).upper()
+    if normalized not in choices:
+        raise ValueError(f"Invalid {name}: {value!r} (expected one of {sorted(choices)})")
+    return normalized
+
+
+@dataclass(slots=True)
 class Order:
     """주문 데이터"""
     ticker: str
@@ -57,8 +88,12 @@ class Order:
     created_at: datetime = field(default_factory=datetime.now)
 
     def __post_init__(self):
+        # 생성 시 한 번 정규화 - 실행 경로는 대문자 문자열 비교만 수행
+        self.ticker = sys.intern(self.ticker)  # 포지션/가격 dict 조회 시 동일 객체 비교
+        self.side = _normalize_choice(self.side, _ORDER_SIDES, "side")
+        self.order_type = _normalize_choice(self.order_type, _ORDER_TYPES, "order_type")
         if self.order_id is None:
-            self.order_id = str(uuid.uuid4())[:8]
+            self.order_id = f"{_ORDER_ID_PREFIX}{next(_ORDER_SEQ):08x}"
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -72,7 +107,7 @@ class Order:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderResult:
     """주문 실행 결과"""
     order_id: str
@@ -106,6 +141,60 @@ class OrderResult:
         return 0
 
 
+class TradeLog:
+    """
+    체결 로그
+
+    Order/OrderResult 참조만 저장하고 dict/isoformat 변환은 조회 시점에
+    새로 추가된 항목만 수행
+    """
+
+    def __init__(self):
+        self._orders: List[Order] = []
+        self._results: List[OrderResult] = []
+        self._balances: List[float] = []
+        self._dicts: List[Dict[str, Any]] = []  # 변환 완료된 앞부분
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def append(self, order: Order, result: OrderResult, balance_after: float) -> None:
+        """체결 기록 추가"""
+        self._orders.append(order)
+        self._results.append(result)
+        self._balances.append(balance_after)
+
+    def to_dict_list(self) -> List[Dict[str, Any]]:
+        """{"order", "result", "balance_after"} dict 목록 (내부 리스트와 dict 그대로 - 수정 금지)"""
+        for i in range(len(self._dicts), len(self)):
+            self._dicts.append({
+                "order": self._orders[i].to_dict(),
+                "result": self._results[i].to_dict(),
+                "balance_after": self._balances[i],
+            })
+        return self._dicts
+
+    def to_frame(self) -> pd.DataFrame:
+        """체결 내역 DataFrame (분석/내보내기용)"""
+        return pd.DataFrame({
+            "order_id": [r.order_id for r in self._results],
+            "ticker": [o.ticker for o in self._orders],
+            "side": [o.side for o in self._orders],
+            "quantity": [r.fill_quantity for r in self._results],
+            "fill_price": [r.fill_price for r in self._results],
+            "commission": [r.commission for r in self._results],
+            "balance_after": self._balances,
+            "executed_at": [r.executed_at for r in self._results],
+        })
+
+    def clear(self) -> None:
+        """로그 초기화"""
+        self._orders.clear()
+        self._results.clear()
+        self._balances.clear()
+        self._dicts.clear()
+
+
 class BaseExecutor(ABC):
     """주문 실행기 기본 클래스"""
 
@@ -142,7 +231,7 @@ class PaperExecutor(BaseExecutor):
         self._orders: Dict[str, Order] = {}
         self._results: Dict[str, OrderResult] = {}
         self._positions: Dict[str, Dict[str, Any]] = {}  # Virtual positions
-        self._trade_log: List[Dict[str, Any]] = []
+        self._trade_log = TradeLog()
 
     def execute(self, order: Order, market_price: Optional[float] = None) -> OrderResult:
         """
@@ -157,25 +246,13 @@ class PaperExecutor(BaseExecutor):
         # Determine fill price
         if order.order_type == "MARKET":
             if market_price is None:
-                return OrderResult(
-                    order_id=order.order_id,
-                    success=False,
-                    status=OrderStatus.REJECTED.value,
-                    message="Market price required for market order simulation",
-                    simulated=True,
-                )
+                return self._reject(order, "Market price required for market order simulation")
             base_price = market_price
         else:
             base_price = order.price or market_price or 0
 
         if base_price <= 0:
-            return OrderResult(
-                order_id=order.order_id,
-                success=False,
-                status=OrderStatus.REJECTED.value,
-                message="Invalid price",
-                simulated=True,
-            )
+            return self._reject(order, "Invalid price")
 
         # Apply slippage
         if order.side == "BUY":
@@ -187,24 +264,117 @@ class PaperExecutor(BaseExecutor):
         trade_value = fill_price * order.quantity
         commission = trade_value * self.commission_rate
 
+        result = self._apply_fill(order, fill_price, trade_value, commission)
+
+        if result.success and self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                f"[PAPER] {order.side} {order.ticker}: "
+                f"{order.quantity} @ {fill_price:,.0f} (commission: {commission:,.0f})"
+            )
+
+        return result
+
+    def execute_batch(
+        self,
+        orders: List[Order],
+        market_prices: Optional[Sequence[Optional[float]]] = None
+    ) -> List[OrderResult]:
+        """
+        주문 일괄 시뮬레이션 (백테스트 재생용)
+
+        슬리피지/수수료는 NumPy로 한 번에 계산하고, 잔고/포지션 검증은
+        순서대로 적용 - 결과는 execute()를 차례로 호출한 것과 동일
+
+        Args:
+            orders: 주문 목록 (실행 순서)
+            market_prices: 주문별 시장가 (None이면 주문 가격 사용)
+        """
+        if not orders:
+            return []
+        if market_prices is None:
+            market_prices = [None] * len(orders)
+        if len(market_prices) != len(orders):
+            raise ValueError("market_prices must have one entry per order")
+
+        # Base prices (NaN = rejected: missing market price or invalid price)
+        base_prices = np.array([
+            (np.nan if mp is None else mp) if order.order_type == "MARKET"
+            else (order.price or mp or 0)
+            for order, mp in zip(orders, market_prices)
+        ], dtype=float)
+        base_prices[base_prices <= 0] = np.nan
+
+        side_sign = np.array([1.0 if order.side == "BUY" else -1.0 for order in orders])
+        quantities = np.array([order.quantity for order in orders], dtype=float)
+
+        fill_prices = base_prices * (1 + side_sign * self.slippage_pct)
+        trade_values = fill_prices * quantities
+        commissions = trade_values * self.commission_rate
+
+        # Sequential part works on Python floats (NumPy scalar indexing is slow)
+        # One timestamp for the whole batch
+        executed_at = datetime.now()
+        results = []
+        for order, market_price, fill_price, trade_value, commission in zip(
+            orders, market_prices,
+            fill_prices.tolist(), trade_values.tolist(), commissions.tolist()
+        ):
+            self._orders[order.order_id] = order
+
+            if fill_price != fill_price:  # NaN
+                if order.order_type == "MARKET" and market_price is None:
+                    message = "Market price required for market order simulation"
+                else:
+                    message = "Invalid price"
+                results.append(self._reject(order, message, executed_at))
+                continue
+
+            results.append(self._apply_fill(order, fill_price, trade_value, commission, executed_at))
+
+        filled = sum(1 for r in results if r.success)
+        self.logger.info(f"[PAPER] Batch executed: {filled}/{len(orders)} filled")
+
+        return results
+
+    def _reject(
+        self,
+        order: Order,
+        message: str,
+        executed_at: Optional[datetime] = None
+    ) -> OrderResult:
+        """거절 결과 생성"""
+        return OrderResult(
+            order_id=order.order_id,
+            success=False,
+            status=_STATUS_REJECTED,
+            message=message,
+            simulated=True,
+            executed_at=executed_at or datetime.now(),
+        )
+
+    def _apply_fill(
+        self,
+        order: Order,
+        fill_price: float,
+        trade_value: float,
+        commission: float,
+        executed_at: Optional[datetime] = None
+    ) -> OrderResult:
+        """잔고/포지션 검증 후 체결 반영 (executed_at: 배치 공용 시각, 없으면 현재)"""
         # Check balance for buy orders
         if order.side == "BUY":
             total_cost = trade_value + commission
             if total_cost > self.balance:
-                return OrderResult(
-                    order_id=order.order_id,
-                    success=False,
-                    status=OrderStatus.REJECTED.value,
-                    message=f"Insufficient balance: {self.balance:,.0f} < {total_cost:,.0f}",
-                    simulated=True,
+                return self._reject(
+                    order, f"Insufficient balance: {self.balance:,.0f} < {total_cost:,.0f}", executed_at
                 )
             self.balance -= total_cost
 
             # Update position
-            if order.ticker not in self._positions:
-                self._positions[order.ticker] = {"quantity": 0, "avg_price": 0}
+            pos = self._positions.get(order.ticker)
+            if pos is None:
+                pos = self._positions[order.ticker] = {"quantity": 0, "avg_price": 0}
 
-            pos = self._positions[order.ticker]
             total_cost_before = pos["quantity"] * pos["avg_price"]
             total_quantity = pos["quantity"] + order.quantity
             if total_quantity > 0:
@@ -212,23 +382,13 @@ class PaperExecutor(BaseExecutor):
             pos["quantity"] = total_quantity
 
         else:  # SELL
-            if order.ticker not in self._positions:
-                return OrderResult(
-                    order_id=order.order_id,
-                    success=False,
-                    status=OrderStatus.REJECTED.value,
-                    message=f"No position for {order.ticker}",
-                    simulated=True,
-                )
+            pos = self._positions.get(order.ticker)
+            if pos is None:
+                return self._reject(order, f"No position for {order.ticker}", executed_at)
 
-            pos = self._positions[order.ticker]
             if pos["quantity"] < order.quantity:
-                return OrderResult(
-                    order_id=order.order_id,
-                    success=False,
-                    status=OrderStatus.REJECTED.value,
-                    message=f"Insufficient quantity: {pos['quantity']} < {order.quantity}",
-                    simulated=True,
+                return self._reject(
+                    order, f"Insufficient quantity: {pos['quantity']} < {order.quantity}", executed_at
                 )
 
             self.balance += trade_value - commission
@@ -241,27 +401,19 @@ class PaperExecutor(BaseExecutor):
         result = OrderResult(
             order_id=order.order_id,
             success=True,
-            status=OrderStatus.SIMULATED.value,
+            status=_STATUS_SIMULATED,
             fill_price=fill_price,
             fill_quantity=order.quantity,
             commission=commission,
             message="Paper trade executed",
             simulated=True,
+            executed_at=executed_at or datetime.now(),
         )
 
         self._results[order.order_id] = result
 
         # Log trade
-        self._trade_log.append({
-            "order": order.to_dict(),
-            "result": result.to_dict(),
-            "balance_after": self.balance,
-        })
-
-        self.logger.info(
-            f"[PAPER] {order.side} {order.ticker}: "
-            f"{order.quantity} @ {fill_price:,.0f} (commission: {commission:,.0f})"
-        )
+        self._trade_log.append(order, result, self.balance)
 
         return result
 
@@ -277,13 +429,29 @@ class PaperExecutor(BaseExecutor):
         """현재 잔고"""
         return self.balance
 
-    def get_positions(self) -> Dict[str, Dict[str, Any]]:
-        """가상 포지션"""
-        return self._positions.copy()
+    def get_positions(self) -> Mapping[str, Dict[str, Any]]:
+        """
+        가상 포지션 (복사 없는 얕은 읽기 전용 뷰)
+
+        종목 추가/삭제는 막히지만 값인 포지션 dict는 내부 상태 그대로이므로
+        수정하면 실행기 상태가 바뀝니다. 독립된 복사본은 copy.deepcopy(...)로 만드세요.
+        """
+        return MappingProxyType(self._positions)
 
-    def get_trade_log(self) -> List[Dict[str, Any]]:
-        """거래 로그"""
-        return self._trade_log.copy()
+    def get_trade_log(self, copy: bool = False) -> List[Dict[str, Any]]:
+        """
+        거래 로그
+
+        Args:
+            copy: True면 수정해도 안전한 깊은 복사본 반환. 기본은 내부 리스트와
+                dict를 그대로 반환하므로 리스트/항목을 수정하면 거래 로그가 바뀜
+        """
+        trades = self._trade_log.to_dict_list()
+        return deepcopy(trades) if copy else trades
+
+    def get_trade_frame(self) -> pd.DataFrame:
+        """거래 로그 DataFrame"""
+        return self._trade_log.to_frame()
 
     def get_portfolio_value(self, prices: Dict[str, float]) -> float:
         """포트폴리오 총 가치"""
@@ -319,20 +487,63 @@ class OrderExecutor:
             commission_rate: 수수료율
             initial_balance: 초기 잔고 (Paper Trading용)
         """
-        self.dry_run = dry_run
+        self._dry_run = dry_run
         self.logger = logging.getLogger(__name__)
 
+        self._paper_config = {
+            "slippage_pct": slippage_pct,
+            "commission_rate": commission_rate,
+            "initial_balance": initial_balance,
+        }
+        self._fallback_paper: Optional[PaperExecutor] = None
+
         if dry_run:
-            self._executor = PaperExecutor(
-                slippage_pct=slippage_pct,
-                commission_rate=commission_rate,
-                initial_balance=initial_balance
-            )
+            self._executor = PaperExecutor(**self._paper_config)
         else:
             # Live executor requires broker setup
             self._executor = None
             self.logger.warning("Live trading not configured. Use set_live_executor()")
 
+        self._bind_execute()
+
+    @property
+    def dry_run(self) -> bool:
+        """True면 Paper Trading, False면 Live 실행"""
+        return self._dry_run
+
+    @dry_run.setter
+    def dry_run(self, value: bool) -> None:
+        # 모드가 바뀌면 미리 결정한 실행 함수도 다시 결정
+        self._dry_run = value
+        self._bind_execute()
+
+    def _bind_execute(self) -> None:
+        """기본 모드 실행 함수를 미리 결정 (호출마다 타입 검사 생략)"""
+        if self.dry_run:
+            self._execute_impl = self._paper_executor().execute
+        elif self._executor is None:
+            self._execute_impl = self._reject_unconfigured
+        else:
+            live = self._executor
+            self._execute_impl = lambda order, market_price=None: live.execute(order)
+
+    def _paper_executor(self) -> PaperExecutor:
+        """Dry-run용 PaperExecutor (라이브 모드에서는 설정값으로 한 번만 생성해 재사용)"""
+        if isinstance(self._executor, PaperExecutor):
+            return self._executor
+        if self._fallback_paper is None:
+            self._fallback_paper = PaperExecutor(**self._paper_config)
+        return self._fallback_paper
+
+    def _reject_unconfigured(self, order: Order, market_price: Optional[float] = None) -> OrderResult:
+        return OrderResult(
+            order_id=order.order_id,
+            success=False,
+            status=_STATUS_REJECTED,
+            message="Live executor not configured",
+            simulated=False,
+        )
+
     def execute(
         self,
         order: Order,
@@ -347,25 +558,15 @@ class OrderExecutor:
             market_price: 현재 시장가
             dry_run: 실행 모드 오버라이드
         """
-        use_dry_run = dry_run if dry_run is not None else self.dry_run
-
-        if use_dry_run:
-            if isinstance(self._executor, PaperExecutor):
-                return self._executor.execute(order, market_price)
-            else:
-                # Fallback paper executor
-                paper = PaperExecutor()
-                return paper.execute(order, market_price)
-        else:
-            if self._executor is None:
-                return OrderResult(
-                    order_id=order.order_id,
-                    success=False,
-                    status=OrderStatus.REJECTED.value,
-                    message="Live executor not configured",
-                    simulated=False,
-                )
-            return self._executor.execute(order)
+        if dry_run is None or dry_run == self.dry_run:
+            return self._execute_impl(order, market_price)
+
+        # Mode override
+        if dry_run:
+            return self._paper_executor().execute(order, market_price)
+        if self._executor is None:
+            return self._reject_unconfigured(order)
+        return self._executor.execute(order)
 
     def cancel(self, order_id: str) -> bool:
         """주문 취소"""
@@ -392,14 +593,14 @@ class OrderExecutor:
             return self._executor.get_balance()
         return None
 
-    def get_paper_positions(self) -> Optional[Dict[str, Dict[str, Any]]]:
-        """Paper trading 포지션"""
+    def get_paper_positions(self) -> Optional[Mapping[str, Dict[str, Any]]]:
+        """Paper trading 포지션 (PaperExecutor.get_positions와 같은 얕은 뷰 - 수정 금지)"""
         if isinstance(self._executor, PaperExecutor):
             return self._executor.get_positions()
         return None
 
     def get_trade_log(self) -> List[Dict[str, Any]]:
-        """거래 로그"""
+        """거래 로그 (내부 리스트 - 수정 금지)"""
         if isinstance(self._executor, PaperExecutor):
             return self._executor.get_trade_log()
         return []
@@ -10,17 +10,41 @@ Usage:
 
     holding = portfolio.get("005930.KS")
     print(f"Quantity: {holding.quantity}, Avg Price: {holding.avg_price}")
+
+    # 여러 변경을 한 번에 저장
+    with portfolio.batch():
+        portfolio.add("AAPL", quantity=5, avg_price=180)
+        portfolio.sell("005930.KS", quantity=3)
+
+    # 변경마다 YAML 전체를 다시 쓰지 않고 portfolio.log에 한 줄씩 추가
+    # (한 파일에 쓰는 journal 인스턴스는 하나만 사용)
+    portfolio = Portfolio(journal=True)
+    portfolio.add("AAPL", quantity=5, avg_price=180)
+    portfolio.compact()  # YAML 스냅샷에 반영 후 로그 삭제 (종료 시 자동)
 """
 
+import os
+import json
 import yaml
+import atexit
 import logging
+import threading
+import weakref
+from functools import lru_cache
+from contextlib import contextmanager
 from pathlib import Path
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, date
 
+try:
+    # libyaml C 파서/에미터 (없으면 순수 Python 구현)
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
 
-@dataclass
+@dataclass(slots=True)
 class Holding:
     """단일 보유 종목 정보"""
     ticker: str
@@ -71,55 +95,323 @@ class Holding:
 
     def calculate_pnl(self, current_price: float) -> Dict[str, float]:
         """손익 계산"""
-        current_value = self.quantity * current_price
-        pnl_amount = current_value - self.total_cost
-        pnl_pct = (pnl_amount / self.total_cost * 100) if self.total_cost > 0 else 0
+        quantity = self.quantity
+        total_cost = quantity * self.avg_price
+        current_value = quantity * current_price
+        pnl_amount = current_value - total_cost
+        pnl_pct = (pnl_amount / total_cost * 100) if total_cost > 0 else 0
 
         return {
             "current_price": current_price,
             "current_value": current_value,
-            "cost_basis": self.total_cost,
+            "cost_basis": total_cost,
             "pnl_amount": pnl_amount,
             "pnl_pct": pnl_pct,
         }
 
 
+@lru_cache(maxsize=8)
+def _load_cached(path: str, mtime_ns: int, size: int) -> Tuple[Tuple[Holding, ...], int]:
+    """
+    YAML 파싱 결과 캐시 (파일 mtime/크기가 같으면 재파싱 생략)
+
+    Returns:
+        (holdings, 스냅샷에 반영된 마지막 journal 번호)
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.load(f, Loader=_Loader) or {}
+
+    holdings = tuple(Holding.from_dict(h) for h in data.get("holdings", []))
+    return holdings, int(data.get("journal_seq", 0))
+
+
+# 종료 시 저장할 인스턴스 (약한 참조라 인스턴스마다 atexit 등록으로 붙잡지 않음)
+_open_portfolios: "weakref.WeakSet[Portfolio]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_portfolios():
+    """종료 시 보류 중인 변경(지연 저장/journal) 반영"""
+    for portfolio in list(_open_portfolios):
+        try:
+            if portfolio.journal:
+                portfolio.compact()
+            else:
+                portfolio.flush()
+        except Exception as e:
+            portfolio.logger.error(f"Failed to save portfolio at exit: {e}")
+
+
 class Portfolio:
     """포트폴리오 관리 클래스"""
 
     DEFAULT_PATH = Path(__file__).parent.parent / "config" / "portfolio.yaml"
 
-    def __init__(self, filepath: Optional[str] = None):
+    # journal 모드에서 이 개수만큼 쌓이면 자동 compact
+    JOURNAL_COMPACT_OPS = 1000
+
+    def __init__(
+        self,
+        filepath: Optional[str] = None,
+        autosave_delay: Optional[float] = None,
+        journal: bool = False
+    ):
+        """
+        Args:
+            filepath: 포트폴리오 YAML 경로
+            autosave_delay: 지연 저장 시간 (초). None이면 변경 즉시 저장,
+                설정 시 마지막 변경 후 delay 경과 또는 종료 시 한 번 저장
+            journal: True면 변경을 <파일명>.log (JSONL)에 추가만 하고
+                compact() 또는 종료 시 YAML에 반영. 로그 번호는 인스턴스별로
+                매기므로 한 파일에 쓰는 journal 인스턴스는 하나만 두어야 함
+                (여러 프로세스/인스턴스가 동시에 쓰면 항목 번호가 충돌)
+        """
         self.logger = logging.getLogger(__name__)
         self.filepath = Path(filepath) if filepath else self.DEFAULT_PATH
+        self.autosave_delay = autosave_delay
         self._holdings: Dict[str, Holding] = {}
+        self._dirty = False
+        self._batch_depth = 0
+        self._flush_timer: Optional[threading.Timer] = None
+        self._flush_lock = threading.RLock()
+
+        self.journal = journal
+        self.journal_path = self.filepath.with_suffix(".log")
+        self._journal_file = None
+        self._journal_seq = 0
+        self._journal_ops = 0
+        self._replaying = False
+
         self._load()
 
+        if journal:
+            _open_portfolios.add(self)
+
     def _load(self):
-        """파일에서 로드"""
-        if self.filepath.exists():
+        """파일에서 로드 (변경 없는 파일은 캐시된 파싱 결과 사용)"""
+        self._journal_seq = self._load_snapshot()
+
+        if self.journal:
+            self._replay_journal()
+
+    def _load_snapshot(self) -> int:
+        """YAML 스냅샷 로드, 반영된 journal 번호 반환"""
+        try:
+            stat = self.filepath.stat()
+        except FileNotFoundError:
+            return 0
+
+        try:
+            cached, journal_seq = _load_cached(str(self.filepath), stat.st_mtime_ns, stat.st_size)
+
+            # 캐시 항목은 인스턴스 간 공유되므로 변경 가능한 필드는 복사
+            for holding in cached:
+                self._holdings[holding.ticker] = replace(
+                    holding, transactions=[dict(t) for t in holding.transactions]
+                )
+            self.logger.info(f"Loaded {len(self._holdings)} holdings")
+            return journal_seq
+        except Exception as e:
+            self.logger.warning(f"Failed to load portfolio: {e}")
+            return 0
+
+    def _replay_journal(self):
+        """스냅샷 이후의 journal 항목 재적용"""
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+
+        replayed = 0
+        stopped = False
+        self._replaying = True
+        try:
+            for line in lines:
+                try:
+                    entry = json.loads(line)
+                    seq = entry.pop("seq")
+                    if seq <= self._journal_seq:
+                        continue
+
+                    self._apply_journal_entry(entry)
+                except Exception as e:
+                    # 기록 도중 중단된 마지막 줄 또는 스냅샷과 어긋난 항목
+                    self.logger.error(f"Stopping journal replay at {line[:80]!r}: {e}")
+                    stopped = True
+                    break
+
+                self._journal_seq = seq
+                replayed += 1
+        finally:
+            self._replaying = False
+
+        self._journal_ops = replayed
+        if replayed:
+            self.logger.info(f"Replayed {replayed} journal entries")
+
+        if stopped:
+            self._recover_journal(lines)
+
+    def _recover_journal(self, lines: List[str]):
+        """
+        재적용이 중단된 로그를 <파일명>.log.failed 뒤에 덧붙이고 현재 상태를 스냅샷으로 저장
+
+        이전 실패에서 남긴 항목을 덮어쓰지 않도록 .failed 파일에는 추가만 함.
+        남은 항목 뒤에 새 항목이 추가되거나 번호가 겹치지 않도록 로그를 비움
+        """
+        failed_path = self.journal_path.with_name(self.journal_path.name + ".failed")
+        with open(failed_path, 'a', encoding='utf-8') as f:
+            for line in lines:
+                # 기록 도중 잘린 마지막 줄도 한 줄로 닫아 다음 실패분과 섞이지 않게 함
+                f.write(line if line.endswith("\n") else line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.journal_path.unlink()
+        self.logger.error(f"Unapplied journal entries moved to {failed_path}")
+
+        # 옮긴 로그의 항목 번호와 겹치지 않도록 가장 큰 번호부터 이어서 매김
+        for line in lines:
             try:
-                with open(self.filepath, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f) or {}
-
-                holdings = data.get("holdings", [])
-                for holding_data in holdings:
-                    holding = Holding.from_dict(holding_data)
-                    self._holdings[holding.ticker] = holding
-                self.logger.info(f"Loaded {len(self._holdings)} holdings")
-            except Exception as e:
-                self.logger.warning(f"Failed to load portfolio: {e}")
-
-    def _save(self):
-        """파일에 저장"""
+                self._journal_seq = max(self._journal_seq, int(json.loads(line)["seq"]))
+            except Exception:
+                continue
+
+        self._save()
+        self._journal_ops = 0
+
+    def _apply_journal_entry(self, entry: Dict[str, Any]):
+        """journal 항목 하나 적용"""
+        op = entry.pop("op")
+        if op == "add":
+            entry["bought_at"] = date.fromisoformat(entry["bought_at"])
+            self.add(**entry)
+        elif op == "sell":
+            entry["sold_at"] = date.fromisoformat(entry["sold_at"])
+            self.sell(**entry)
+        elif op == "remove":
+            self.remove(**entry)
+        elif op == "update":
+            self.update(**entry)
+        else:
+            self.logger.warning(f"Unknown journal op: {op}")
+
+    def _commit(self, op: str, **fields):
+        """변경 반영 (journal 모드면 로그 한 줄 추가, 아니면 저장 표시)"""
+        if self._replaying:
+            return
+
+        if not self.journal:
+            self._mark_dirty()
+            return
+
+        with self._flush_lock:
+            if self._journal_file is None:
+                self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+                self._journal_file = open(self.journal_path, 'a', encoding='utf-8', buffering=1)
+
+            self._journal_seq += 1
+            self._journal_file.write(json.dumps({"seq": self._journal_seq, "op": op, **fields}) + "\n")
+            self._journal_ops += 1
+
+        if self._journal_ops >= self.JOURNAL_COMPACT_OPS:
+            self.compact()
+
+    def compact(self):
+        """journal을 YAML 스냅샷에 반영하고 로그 삭제"""
+        with self._flush_lock:
+            if self._journal_file is not None:
+                self._journal_file.close()
+                self._journal_file = None
+
+            if not self._journal_ops and not self._dirty:
+                return
+
+            # 스냅샷에 journal_seq를 함께 기록하므로 로그 삭제 전 중단돼도 중복 적용 없음
+            self._save()
+            self._dirty = False
+            self.journal_path.unlink(missing_ok=True)
+            self._journal_ops = 0
+
+    def _save(self, durable: bool = False):
+        """
+        파일에 저장 (임시 파일 기록 후 교체)
+
+        Args:
+            durable: True면 교체 전 fsync로 디스크 기록 보장
+        """
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
 
+        # journal 모드가 아니어도 기록: 이후 journal 모드로 열 때 이미 반영된 로그 항목을 건너뜀
         data = {
-            "holdings": [h.to_dict() for h in self._holdings.values()]
+            "holdings": [h.to_dict() for h in list(self._holdings.values())],
+            "journal_seq": self._journal_seq,
         }
-
-        with open(self.filepath, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
+        content = yaml.dump(
+            data, Dumper=_Dumper, allow_unicode=True, default_flow_style=False, sort_keys=False
+        ).encode('utf-8')
+
+        tmp_path = self.filepath.with_suffix(self.filepath.suffix + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.filepath)
+
+        # mtime 해상도가 낮은 파일시스템에서 같은 키로 이전 내용을 읽지 않도록
+        _load_cached.cache_clear()
+
+    def _mark_dirty(self):
+        """변경 표시 (batch 중이면 보류, autosave_delay 설정 시 지연 저장)"""
+        # flush가 진행 중이면 끝난 뒤에 표시해야 이번 변경이 다음 저장에 포함됨
+        with self._flush_lock:
+            self._dirty = True
+
+        if self._batch_depth:
+            return
+
+        if self.autosave_delay is None:
+            self.flush()
+            return
+
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(self.autosave_delay, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+            _open_portfolios.add(self)
+
+    def flush(self, durable: bool = False):
+        """보류 중인 변경사항 저장 (durable=True면 fsync)"""
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            if not self._dirty:
+                return
+
+            # 스냅샷 전에 해제: 저장 중 들어온 변경은 다시 dirty로 표시됨
+            self._dirty = False
+            try:
+                self._save(durable=durable)
+            except Exception:
+                self._dirty = True
+                raise
+
+    @contextmanager
+    def batch(self):
+        """블록 안의 변경을 모아 종료 시 한 번만 저장"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self.flush()
 
     def add(
         self,
@@ -179,7 +471,10 @@ class Portfolio:
             )
             self._holdings[ticker] = holding
 
-        self._save()
+        self._commit(
+            "add", ticker=ticker, quantity=quantity, avg_price=avg_price,
+            name=name, bought_at=bought_at.isoformat(), note=note
+        )
         self.logger.info(f"Added/Updated holding: {ticker} ({quantity} @ {avg_price})")
         return holding
 
@@ -191,7 +486,7 @@ class Portfolio:
         """종목 전체 매도/삭제"""
         if ticker in self._holdings:
             del self._holdings[ticker]
-            self._save()
+            self._commit("remove", ticker=ticker)
             self.logger.info(f"Removed holding: {ticker}")
             return True
         return False
@@ -200,7 +495,8 @@ class Portfolio:
         self,
         ticker: str,
         quantity: int,
-        price: Optional[float] = None
+        price: Optional[float] = None,
+        sold_at: Optional[date] = None
     ) -> Optional[Holding]:
         """
         부분 매도
@@ -209,6 +505,7 @@ class Portfolio:
             ticker: 종목 코드
             quantity: 매도 수량
             price: 매도 가격 (기록용)
+            sold_at: 매도일 (기본: 오늘)
 
         Returns:
             업데이트된 Holding 또는 None (전량 매도 시)
@@ -224,15 +521,18 @@ class Portfolio:
             return None
 
         # 부분 매도
+        if sold_at is None:
+            sold_at = date.today()
+
         holding.quantity -= quantity
         holding.transactions.append({
             "type": "SELL",
             "quantity": quantity,
             "price": price,
-            "date": date.today().isoformat(),
+            "date": sold_at.isoformat(),
         })
 
-        self._save()
+        self._commit("sell", ticker=ticker, quantity=quantity, price=price, sold_at=sold_at.isoformat())
         self.logger.info(f"Sold {quantity} shares of {ticker}")
         return holding
 
@@ -259,7 +559,7 @@ class Portfolio:
         if note is not None:
             holding.note = note
 
-        self._save()
+        self._commit("update", ticker=ticker, quantity=quantity, avg_price=avg_price, name=name, note=note)
         return holding
 
     def get_all(self) -> List[Holding]:
@@ -270,12 +570,13 @@ class Portfolio:
         """보유 종목 코드 목록"""
         return list(self._holdings.keys())
 
-    def total_value(self, prices: Dict[str, float]) -> Dict[str, Any]:
+    def total_value(self, prices: Dict[str, float], include_details: bool = True) -> Dict[str, Any]:
         """
         포트폴리오 총 가치 계산
 
         Args:
             prices: {ticker: current_price} 딕셔너리
+            include_details: False면 종목별 상세(holdings) 생략
 
         Returns:
             총 가치, 총 손익 등
@@ -283,18 +584,30 @@ class Portfolio:
         total_cost = 0
         total_current = 0
         details = []
+        get_price = prices.get
 
+        # calculate_pnl()을 인라인 (종목별 중간 dict 생성 없이 합산)
         for holding in self._holdings.values():
-            current_price = prices.get(holding.ticker, holding.avg_price)
-            pnl = holding.calculate_pnl(current_price)
-
-            total_cost += pnl["cost_basis"]
-            total_current += pnl["current_value"]
-            details.append({
-                "ticker": holding.ticker,
-                "name": holding.name,
-                **pnl
-            })
+            quantity = holding.quantity
+            avg_price = holding.avg_price
+            current_price = get_price(holding.ticker, avg_price)
+            cost_basis = quantity * avg_price
+            current_value = quantity * current_price
+
+            total_cost += cost_basis
+            total_current += current_value
+
+            if include_details:
+                pnl_amount = current_value - cost_basis
+                details.append({
+                    "ticker": holding.ticker,
+                    "name": holding.name,
+                    "current_price": current_price,
+                    "current_value": current_value,
+                    "cost_basis": cost_basis,
+                    "pnl_amount": pnl_amount,
+                    "pnl_pct": (pnl_amount / cost_basis * 100) if cost_basis > 0 else 0,
+                })
 
         total_pnl = total_current - total_cost
         total_pnl_pct = (total_pnl / total_cost * 100) if total_cost > 0 else 0
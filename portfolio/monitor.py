@@ -14,19 +14,33 @@ Usage:
 
     monitor.on_update(on_update)
     monitor.start()
+
+    # 폴링 대신 WebSocket 푸시 (yfinance WebSocket 사용 가능 시)
+    monitor = PriceMonitor(stream=True)
+
+    # 다른 곳에서 같은 종목 가격이 필요할 때 (공유 캐시 재사용)
+    from portfolio.monitor import get_price_cache
+    prices = get_price_cache().get_many(["005930.KS", "AAPL"], max_age=30)
 """
 
 import logging
 import threading
 import time
-from typing import Dict, List, Callable, Optional, Any
+from typing import Dict, List, Callable, Optional, Any, Tuple
 from datetime import datetime
 from dataclasses import dataclass, field
 
+import numpy as np
 import yfinance as yf
 
+try:
+    from yfinance import WebSocket as YFWebSocket
+    HAS_YF_WEBSOCKET = True
+except ImportError:
+    HAS_YF_WEBSOCKET = False
+
 
-@dataclass
+@dataclass(slots=True)
 class PriceData:
     """가격 데이터"""
     ticker: str
@@ -49,27 +63,219 @@ class PriceData:
         }
 
 
+class PriceCache:
+    """
+    가격 조회 캐시 (여러 소비자가 공유)
+
+    max_age 이내의 가격은 재사용하고, 없거나 오래된 종목만 모아
+    yf.download 한 번으로 조회. 동시 호출은 조회 락에서 대기한 뒤
+    먼저 받아온 결과를 재사용.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._entries: Dict[str, Tuple[PriceData, float]] = {}
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+
+    def _lookup(self, tickers: List[str], max_age: float) -> Tuple[Dict[str, PriceData], List[str]]:
+        """(max_age 이내 캐시 결과, 조회 필요 종목) 반환"""
+        now = time.monotonic()
+        fresh = {}
+        stale = []
+
+        with self._lock:
+            for ticker in tickers:
+                entry = self._entries.get(ticker)
+                if entry is not None and now - entry[1] < max_age:
+                    fresh[ticker] = entry[0]
+                else:
+                    stale.append(ticker)
+
+        return fresh, stale
+
+    def get_many(self, tickers: List[str], max_age: float = 60) -> Dict[str, PriceData]:
+        """
+        여러 종목 가격 조회 (캐시 우선)
+
+        Args:
+            tickers: 종목 코드 목록
+            max_age: 캐시 허용 시간 (초)
+
+        Returns:
+            {ticker: PriceData} (조회 실패 종목 제외, 입력 순서 유지)
+        """
+        results, stale = self._lookup(tickers, max_age)
+
+        if stale:
+            with self._fetch_lock:
+                # 대기 중 다른 소비자가 받아온 종목은 제외
+                fetched, stale = self._lookup(stale, max_age)
+                results.update(fetched)
+
+                if stale:
+                    fetched = self.fetch(stale)
+                    now = time.monotonic()
+                    with self._lock:
+                        for ticker, price_data in fetched.items():
+                            self._entries[ticker] = (price_data, now)
+                    results.update(fetched)
+
+        return {ticker: results[ticker] for ticker in tickers if ticker in results}
+
+    def get(self, ticker: str, max_age: float = 60) -> Optional[PriceData]:
+        """단일 종목 가격 조회 (캐시 우선)"""
+        return self.get_many([ticker], max_age).get(ticker)
+
+    def clear(self) -> None:
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+    def fetch(self, tickers: List[str]) -> Dict[str, PriceData]:
+        """캐시 없이 yf.download 배치 조회 (실패 시 종목별 조회)"""
+        if not tickers:
+            return {}
+
+        results = {}
+
+        try:
+            # Batch fetch for efficiency
+            tickers_str = " ".join(tickers)
+            data = yf.download(
+                tickers_str,
+                period="2d",
+                interval="1d",
+                progress=False,
+                threads=True
+            )
+
+            # pandas 인덱서 대신 ndarray 직접 인덱싱 (행: 날짜, 열: 종목)
+            close = data['Close']
+            close_arr = close.to_numpy()
+            volume_arr = data['Volume'].to_numpy()
+            if close_arr.ndim == 1:
+                close_arr = close_arr[:, None]
+                volume_arr = volume_arr[:, None]
+
+            if len(tickers) == 1:
+                columns = {tickers[0]: 0}
+            else:
+                columns = {ticker: i for i, ticker in enumerate(close.columns)}
+            n_rows = len(close_arr)
+
+            if n_rows:
+                # 전 종목 등락을 한 번에 계산
+                current = close_arr[-1]
+                prev = close_arr[-2] if n_rows > 1 else current
+                change = current - prev
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    change_pct = np.where(prev > 0, change / prev * 100, 0.0)
+
+                current_list = current.tolist()
+                prev_list = prev.tolist()
+                change_list = change.tolist()
+                change_pct_list = change_pct.tolist()
+                volume_list = volume_arr[-1].tolist()
+                now = datetime.now()
+
+                for ticker in tickers:
+                    try:
+                        col = columns[ticker]
+                        results[ticker] = PriceData(
+                            ticker=ticker,
+                            price=current_list[col],
+                            prev_close=prev_list[col],
+                            change=change_list[col],
+                            change_pct=change_pct_list[col],
+                            volume=int(volume_list[col]),
+                            timestamp=now
+                        )
+                    except Exception as e:
+                        self.logger.warning(f"Failed to fetch {ticker}: {e}")
+
+        except Exception as e:
+            self.logger.error(f"Batch fetch failed: {e}")
+            # Fallback to individual fetch
+            for ticker in tickers:
+                try:
+                    price_data = self._fetch_single(ticker)
+                    if price_data:
+                        results[ticker] = price_data
+                except Exception as e:
+                    self.logger.warning(f"Failed to fetch {ticker}: {e}")
+
+        return results
+
+    def _fetch_single(self, ticker: str) -> Optional[PriceData]:
+        """단일 종목 가격 조회"""
+        try:
+            yf_ticker = yf.Ticker(ticker)
+            hist = yf_ticker.history(period="2d")
+
+            if hist.empty:
+                return None
+
+            current_price = float(hist['Close'].iloc[-1])
+            prev_close = float(hist['Close'].iloc[-2]) if len(hist) > 1 else current_price
+            volume = int(hist['Volume'].iloc[-1])
+
+            change = current_price - prev_close
+            change_pct = (change / prev_close * 100) if prev_close > 0 else 0
+
+            return PriceData(
+                ticker=ticker,
+                price=current_price,
+                prev_close=prev_close,
+                change=change,
+                change_pct=change_pct,
+                volume=volume,
+                timestamp=datetime.now()
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to fetch {ticker}: {e}")
+            return None
+
+
+_price_cache = PriceCache()
+
+
+def get_price_cache() -> PriceCache:
+    """프로세스 공유 PriceCache"""
+    return _price_cache
+
+
 class PriceMonitor:
     """가격 모니터링 클래스"""
 
-    def __init__(self, interval: int = 60):
+    def __init__(self, interval: int = 60, cache: Optional[PriceCache] = None, stream: bool = False):
         """
         Args:
             interval: 폴링 간격 (초)
+            cache: 가격 캐시 (기본: 프로세스 공유 캐시)
+            stream: True면 yfinance WebSocket 푸시 사용 (실패 시 폴링으로 전환)
         """
         self.interval = interval
         self.logger = logging.getLogger(__name__)
+        self._cache = cache if cache is not None else get_price_cache()
+
+        if stream and not HAS_YF_WEBSOCKET:
+            self.logger.warning("yfinance WebSocket not available, using polling")
+        self.stream = stream and HAS_YF_WEBSOCKET
+        self._ws = None
 
         self._tickers: List[str] = []
         self._prices: Dict[str, PriceData] = {}
         self._callbacks: List[Callable[[Dict[str, Any]], None]] = []
         self._running = False
+        self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
 
     def add(self, ticker: str) -> None:
         """모니터링 종목 추가"""
         if ticker not in self._tickers:
             self._tickers.append(ticker)
+            self._update_subscription("subscribe", ticker)
             self.logger.info(f"Added ticker to monitor: {ticker}")
 
     def remove(self, ticker: str) -> None:
@@ -78,8 +284,19 @@ class PriceMonitor:
             self._tickers.remove(ticker)
             if ticker in self._prices:
                 del self._prices[ticker]
+            self._update_subscription("unsubscribe", ticker)
             self.logger.info(f"Removed ticker from monitor: {ticker}")
 
+    def _update_subscription(self, action: str, ticker: str) -> None:
+        """스트리밍 중이면 구독 목록 갱신"""
+        ws = self._ws
+        if ws is None:
+            return
+        try:
+            getattr(ws, action)([ticker])
+        except Exception as e:
+            self.logger.warning(f"Failed to {action} {ticker}: {e}")
+
     def get_tickers(self) -> List[str]:
         """모니터링 중인 종목 목록"""
         return self._tickers.copy()
@@ -102,125 +319,108 @@ class PriceMonitor:
         return {ticker: data.price for ticker, data in self._prices.items()}
 
     def fetch_prices(self) -> Dict[str, PriceData]:
-        """모든 종목 가격 조회 (1회)"""
+        """
+        모든 종목 가격 조회 (1회)
+
+        공유 PriceCache를 거치므로 interval/2 이내에 다른 소비자가
+        받아온 가격은 다시 다운로드하지 않음
+        """
         if not self._tickers:
             return {}
 
-        results = {}
-
-        try:
-            # Batch fetch for efficiency
-            tickers_str = " ".join(self._tickers)
-            data = yf.download(
-                tickers_str,
-                period="2d",
-                interval="1d",
-                progress=False,
-                threads=True
-            )
-
-            for ticker in self._tickers:
-                try:
-                    if len(self._tickers) == 1:
-                        close_data = data['Close']
-                        volume_data = data['Volume']
-                    else:
-                        close_data = data['Close'][ticker]
-                        volume_data = data['Volume'][ticker]
-
-                    if close_data.empty:
-                        continue
-
-                    current_price = float(close_data.iloc[-1])
-                    prev_close = float(close_data.iloc[-2]) if len(close_data) > 1 else current_price
-                    volume = int(volume_data.iloc[-1]) if not volume_data.empty else 0
-
-                    change = current_price - prev_close
-                    change_pct = (change / prev_close * 100) if prev_close > 0 else 0
-
-                    price_data = PriceData(
-                        ticker=ticker,
-                        price=current_price,
-                        prev_close=prev_close,
-                        change=change,
-                        change_pct=change_pct,
-                        volume=volume,
-                        timestamp=datetime.now()
-                    )
-                    results[ticker] = price_data
-
-                except Exception as e:
-                    self.logger.warning(f"Failed to fetch {ticker}: {e}")
-
-        except Exception as e:
-            self.logger.error(f"Batch fetch failed: {e}")
-            # Fallback to individual fetch
-            for ticker in self._tickers:
-                try:
-                    price_data = self._fetch_single(ticker)
-                    if price_data:
-                        results[ticker] = price_data
-                except Exception as e:
-                    self.logger.warning(f"Failed to fetch {ticker}: {e}")
-
-        return results
+        return self._cache.get_many(self._tickers, max_age=self.interval / 2)
 
     def _fetch_single(self, ticker: str) -> Optional[PriceData]:
         """단일 종목 가격 조회"""
-        try:
-            yf_ticker = yf.Ticker(ticker)
-            hist = yf_ticker.history(period="2d")
+        return self._cache._fetch_single(ticker)
 
-            if hist.empty:
-                return None
+    def _publish(self, prices: Dict[str, PriceData]) -> None:
+        """가격 저장 및 콜백 호출"""
+        # 호출 중 on_update()로 목록이 바뀌어도 이번 배치에는 영향 없음
+        callbacks = tuple(self._callbacks)
 
-            current_price = float(hist['Close'].iloc[-1])
-            prev_close = float(hist['Close'].iloc[-2]) if len(hist) > 1 else current_price
-            volume = int(hist['Volume'].iloc[-1])
+        for ticker, price_data in prices.items():
+            self._prices[ticker] = price_data
 
-            change = current_price - prev_close
-            change_pct = (change / prev_close * 100) if prev_close > 0 else 0
+            if not callbacks:
+                continue
 
-            return PriceData(
-                ticker=ticker,
-                price=current_price,
-                prev_close=prev_close,
-                change=change,
-                change_pct=change_pct,
-                volume=volume,
-                timestamp=datetime.now()
-            )
-        except Exception as e:
-            self.logger.warning(f"Failed to fetch {ticker}: {e}")
-            return None
+            # Notify callbacks (to_dict는 종목당 1회)
+            price_dict = price_data.to_dict()
+            for callback in callbacks:
+                try:
+                    callback(price_dict)
+                except Exception as e:
+                    self.logger.error(f"Callback error: {e}")
 
     def _poll_loop(self):
         """폴링 루프"""
         while self._running:
             try:
                 prices = self.fetch_prices()
-
-                for ticker, price_data in prices.items():
-                    old_price = self._prices.get(ticker)
-                    self._prices[ticker] = price_data
-
-                    # Notify callbacks
-                    for callback in self._callbacks:
-                        try:
-                            callback(price_data.to_dict())
-                        except Exception as e:
-                            self.logger.error(f"Callback error: {e}")
-
+                self._publish(prices)
                 self.logger.debug(f"Fetched {len(prices)} prices")
 
             except Exception as e:
                 self.logger.error(f"Poll loop error: {e}")
 
-            # Wait for next interval
-            for _ in range(self.interval):
-                if not self._running:
-                    break
-                time.sleep(1)
+            # Wait for next interval (stop() 시 즉시 깨어남)
+            if self._stop_event.wait(self.interval):
+                break
+
+    def _on_tick(self, message: Dict[str, Any]) -> None:
+        """WebSocket 가격 메시지 처리"""
+        ticker = message.get("id")
+        price = message.get("price")
+        if ticker not in self._tickers or price is None:
+            return
+
+        previous = self._prices.get(ticker)
+        price = float(price)
+        prev_close = float(message.get("previous_close") or (previous.prev_close if previous else price))
+        # int64 필드는 문자열로 전달됨
+        volume = int(message.get("day_volume") or (previous.volume if previous else 0))
+
+        change = price - prev_close
+        change_pct = (change / prev_close * 100) if prev_close > 0 else 0
+
+        self._publish({ticker: PriceData(
+            ticker=ticker,
+            price=price,
+            prev_close=prev_close,
+            change=change,
+            change_pct=change_pct,
+            volume=volume,
+            timestamp=datetime.now()
+        )})
+
+    def _stream_loop(self):
+        """스트리밍 루프 (연결 종료/실패 시 폴링으로 전환)"""
+        try:
+            # 전일 종가/거래량 기준값 확보
+            self._publish(self.fetch_prices())
+
+            self._ws = YFWebSocket(verbose=False)
+            self._ws.subscribe(list(self._tickers))
+            if self._running:
+                self._ws.listen(self._on_tick)
+        except Exception as e:
+            if self._running:
+                self.logger.warning(f"Price stream failed, falling back to polling: {e}")
+        finally:
+            self._close_stream()
+
+        if self._running:
+            self._poll_loop()
+
+    def _close_stream(self) -> None:
+        """WebSocket 연결 종료"""
+        ws, self._ws = self._ws, None
+        if ws is not None:
+            try:
+                ws.close()
+            except Exception as e:
+                self.logger.debug(f"WebSocket close failed: {e}")
 
     def start(self) -> None:
         """모니터링 시작"""
@@ -233,13 +433,18 @@ class PriceMonitor:
             return
 
         self._running = True
-        self._thread = threading.Thread(target=self._poll_loop, daemon=True)
+        self._stop_event.clear()
+        target = self._stream_loop if self.stream else self._poll_loop
+        self._thread = threading.Thread(target=target, daemon=True)
         self._thread.start()
-        self.logger.info(f"Price monitor started (interval: {self.interval}s)")
+        mode = "stream" if self.stream else f"interval: {self.interval}s"
+        self.logger.info(f"Price monitor started ({mode})")
 
     def stop(self) -> None:
         """모니터링 중지"""
         self._running = False
+        self._stop_event.set()
+        self._close_stream()
         if self._thread:
             self._thread.join(timeout=5)
             self._thread = None
@@ -6,6 +6,8 @@ Usage:
     from portfolio.notifiers.base import BaseNotifier, AlertType, Notification
 """
 
+import asyncio
+import json
 import logging
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any
@@ -13,6 +15,13 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
 
 class AlertType(Enum):
     """알림 타입"""
@@ -34,7 +43,7 @@ class Priority(Enum):
     URGENT = 4
 
 
-@dataclass
+@dataclass(slots=True)
 class Notification:
     """알림 데이터"""
     message: str
@@ -66,6 +75,34 @@ ALERT_EMOJIS = {
     AlertType.SYSTEM_ERROR: "❌",
     AlertType.DAILY_REPORT: "📊",
 }
+DEFAULT_ALERT_EMOJI = "📢"
+
+# 문자열 → AlertType (send_alert에서 Enum 값 조회 대신 사용)
+_ALERT_TYPE_BY_VALUE = {t.value: t for t in AlertType}
+
+# 알림 타입별 헤더 문자열 (_format_notification에서 매번 만들지 않도록 미리 계산)
+_ALERT_HEADERS = {t: f"{ALERT_EMOJIS.get(t, DEFAULT_ALERT_EMOJI)} [{t.value}]" for t in AlertType}
+
+# 429 응답의 Retry-After가 이보다 길면 재시도하지 않음 (발송 스레드 장시간 블로킹 방지)
+MAX_RETRY_AFTER = 60.0
+
+
+# encode_json 본문과 함께 보낼 헤더
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def encode_json(payload: Dict[str, Any]) -> bytes:
+    """POST 본문용 JSON 인코딩 (orjson이 있으면 사용)"""
+    return _json_dumps(payload)
+
+
+def parse_retry_after(response: Any, default: float = 1.0) -> float:
+    """429 응답의 Retry-After 헤더(초)를 읽음 (없거나 날짜 형식이면 default)"""
+    value = response.headers.get("Retry-After")
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return default
 
 
 class BaseNotifier(ABC):
@@ -79,6 +116,18 @@ class BaseNotifier(ABC):
         """메시지 발송"""
         pass
 
+    def close(self) -> None:
+        """HTTP 세션 등 리소스 정리 (기본 구현은 없음)"""
+
+    async def send_message_async(self, message: str) -> bool:
+        """
+        메시지 비동기 발송
+
+        기본 구현은 동기 send를 스레드에서 실행합니다.
+        네이티브 비동기 클라이언트가 있는 발송기는 오버라이드하세요.
+        """
+        return await asyncio.to_thread(self.send, message)
+
     def send_notification(self, notification: Notification) -> bool:
         """Notification 객체 발송"""
         formatted = self._format_notification(notification)
@@ -94,7 +143,7 @@ class BaseNotifier(ABC):
         """알림 발송 (편의 메서드)"""
         notification = Notification(
             message=message,
-            alert_type=AlertType(alert_type),
+            alert_type=_ALERT_TYPE_BY_VALUE.get(alert_type) or AlertType(alert_type),
             ticker=ticker,
             details=details or {},
         )
@@ -102,28 +151,25 @@ class BaseNotifier(ABC):
 
     def _format_notification(self, notification: Notification) -> str:
         """알림 포맷팅"""
-        lines = []
-
-        # Header with emoji based on type
-        emoji = self._get_emoji(notification.alert_type)
-        lines.append(f"{emoji} [{notification.alert_type.value}]")
-
-        if notification.ticker:
-            lines.append(f"Ticker: {notification.ticker}")
-
-        lines.append(f"Message: {notification.message}")
+        header = _ALERT_HEADERS[notification.alert_type]
+        ticker = f"Ticker: {notification.ticker}\n" if notification.ticker else ""
 
+        details = ""
         if notification.details:
-            for key, value in notification.details.items():
-                if isinstance(value, float):
-                    lines.append(f"  {key}: {value:,.2f}")
-                else:
-                    lines.append(f"  {key}: {value}")
+            details = "".join([
+                f"  {key}: {value:,.2f}\n" if isinstance(value, float) else f"  {key}: {value}\n"
+                for key, value in notification.details.items()
+            ])
 
-        lines.append(f"Time: {notification.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
+        # isoformat이 strftime보다 빠름 (tz가 있으면 오프셋이 붙으므로 strftime 유지)
+        timestamp = notification.timestamp
+        if timestamp.tzinfo is None:
+            time_str = timestamp.isoformat(" ", "seconds")
+        else:
+            time_str = timestamp.strftime("%Y-%m-%d %H:%M:%S")
 
-        return "\n".join(lines)
+        return f"{header}\n{ticker}Message: {notification.message}\n{details}Time: {time_str}"
 
     def _get_emoji(self, alert_type: AlertType) -> str:
         """알림 타입별 이모지"""
-        return ALERT_EMOJIS.get(alert_type, "📢")
+        return ALERT_EMOJIS.get(alert_type, DEFAULT_ALERT_EMOJI)
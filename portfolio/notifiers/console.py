@@ -9,7 +9,8 @@ Usage:
     notifier.send("Hello!")
 """
 
-from typing import List, Dict, Any
+from collections import deque
+from typing import Deque, List, Dict, Any
 
 from .base import BaseNotifier, Notification
 
@@ -17,9 +18,13 @@ from .base import BaseNotifier, Notification
 class ConsoleNotifier(BaseNotifier):
     """콘솔 출력 알림 (테스트용)"""
 
-    def __init__(self):
+    def __init__(self, history_size: int = 1000):
+        """
+        Args:
+            history_size: 보관할 최근 알림 수 (초과하면 오래된 것부터 삭제)
+        """
         super().__init__()
-        self._history: List[Notification] = []
+        self._history: Deque[Notification] = deque(maxlen=history_size)
 
     def send(self, message: str) -> bool:
         print(f"\n{'='*50}")
@@ -34,7 +39,7 @@ class ConsoleNotifier(BaseNotifier):
         return super().send_notification(notification)
 
     def get_history(self) -> List[Dict[str, Any]]:
-        """알림 히스토리 조회"""
+        """알림 히스토리 조회 (최근 history_size개)"""
         return [n.to_dict() for n in self._history]
 
     def clear_history(self) -> None:
@@ -9,6 +9,14 @@ Usage:
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+from .base import AlertType, ALERT_EMOJIS
+
+# format_price_alert의 alert_type 문자열별 이모지 (그 외는 목표가 도달)
+PRICE_ALERT_EMOJIS = {
+    "STOP_LOSS": ALERT_EMOJIS[AlertType.STOP_LOSS],
+    "TAKE_PROFIT": ALERT_EMOJIS[AlertType.TAKE_PROFIT],
+}
+
 
 def format_daily_report(
     date: datetime,
@@ -109,12 +117,7 @@ def format_price_alert(
     """
     diff_pct = ((current_price - target_price) / target_price) * 100
 
-    if alert_type == "STOP_LOSS":
-        emoji = "🛑"
-    elif alert_type == "TAKE_PROFIT":
-        emoji = "💰"
-    else:
-        emoji = "🎯"
+    emoji = PRICE_ALERT_EMOJIS.get(alert_type, ALERT_EMOJIS[AlertType.PRICE_TARGET])
 
     return (
         f"{emoji} Price Alert - {alert_type}\n"
@@ -13,7 +13,10 @@ Usage:
     notifier.send("Hello!")  # 모든 발송기로 전송
 """
 
-from typing import List
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
 
 from .base import BaseNotifier
 
@@ -21,35 +24,80 @@ from .base import BaseNotifier
 class MultiNotifier(BaseNotifier):
     """다중 알림 발송기"""
 
+    MAX_WORKERS = 4
+
     def __init__(self):
         super().__init__()
-        self._notifiers: List[BaseNotifier] = []
+        # 변경 시 새 튜플로 교체 → send는 락 없이 현재 튜플을 그대로 순회
+        self._notifiers: Tuple[BaseNotifier, ...] = ()
+        self._lock = threading.Lock()
+        # 발송기가 2개 이상일 때 처음 send에서 생성
+        self._pool: Optional[ThreadPoolExecutor] = None
 
     def add(self, notifier: BaseNotifier) -> "MultiNotifier":
         """알림 발송기 추가"""
-        self._notifiers.append(notifier)
+        with self._lock:
+            self._notifiers = self._notifiers + (notifier,)
         return self
 
     def remove(self, notifier: BaseNotifier) -> bool:
         """알림 발송기 제거"""
-        try:
-            self._notifiers.remove(notifier)
+        with self._lock:
+            try:
+                index = self._notifiers.index(notifier)
+            except ValueError:
+                return False
+            self._notifiers = self._notifiers[:index] + self._notifiers[index + 1:]
             return True
-        except ValueError:
+
+    def _send_one(self, notifier: BaseNotifier, message: str) -> bool:
+        """단일 발송기 호출 (예외는 실패로 처리)"""
+        try:
+            return bool(notifier.send(message))
+        except Exception as e:
+            self.logger.error(f"Notifier error: {e}")
             return False
 
     def send(self, message: str) -> bool:
-        """모든 발송기로 메시지 발송"""
+        """모든 발송기로 메시지 발송 (여러 개면 병렬 발송)"""
+        notifiers = self._notifiers
+
+        if len(notifiers) <= 1:
+            return all([self._send_one(n, message) for n in notifiers])
+
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=self.MAX_WORKERS, thread_name_prefix="notifier")
+
+        futures = [self._pool.submit(self._send_one, n, message) for n in notifiers]
+        return all([f.result() for f in futures])
+
+    async def send_message_async(self, message: str) -> bool:
+        """모든 발송기로 메시지 동시 발송 (비동기)"""
+        results = await asyncio.gather(
+            *[n.send_message_async(message) for n in self._notifiers],
+            return_exceptions=True
+        )
+
         success = True
-        for notifier in self._notifiers:
-            try:
-                if not notifier.send(message):
-                    success = False
-            except Exception as e:
-                self.logger.error(f"Notifier error: {e}")
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error(f"Notifier error: {result}")
+                success = False
+            elif not result:
                 success = False
         return success
 
+    def close(self) -> None:
+        """발송 스레드 풀 및 모든 발송기 종료"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+        for notifier in self._notifiers:
+            notifier.close()
+
     def count(self) -> int:
         """등록된 발송기 수"""
         return len(self._notifiers)
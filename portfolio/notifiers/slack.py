@@ -9,18 +9,25 @@ Usage:
     notifier.send("Hello!")
 """
 
+import time
+
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     HAS_REQUESTS = True
 except ImportError:
     HAS_REQUESTS = False
 
-from .base import BaseNotifier, Notification
+from .base import BaseNotifier, Notification, JSON_HEADERS, MAX_RETRY_AFTER, encode_json, parse_retry_after
 
 
 class SlackNotifier(BaseNotifier):
     """Slack 웹훅 알림"""
 
+    # 429 응답 시 최대 시도 횟수
+    MAX_ATTEMPTS = 3
+
     def __init__(self, webhook_url: str):
         """
         Args:
@@ -32,26 +39,52 @@ class SlackNotifier(BaseNotifier):
         super().__init__()
         self.webhook_url = webhook_url
 
+        # Keep-alive session: reuse TLS connections across messages.
+        # 중복 발송 방지: 연결 실패만 재시도 (429는 send()에서 Retry-After 대기 후 재시도)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=2,
+            max_retries=Retry(total=3, read=0, backoff_factor=0.2),
+        )
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """HTTP 세션 종료"""
+        self._session.close()
+
     def send(self, message: str) -> bool:
-        """메시지 발송"""
-        try:
-            response = requests.post(
-                self.webhook_url,
-                json={"text": message},
-                timeout=10
-            )
+        """메시지 발송 (429면 Retry-After 만큼 대기 후 재시도)"""
+        body = encode_json({"text": message})
+
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            try:
+                response = self._session.post(
+                    self.webhook_url,
+                    data=body,
+                    headers=JSON_HEADERS,
+                    timeout=10
+                )
+            except Exception as e:
+                self.logger.error(f"Slack send error: {e}")
+                return False
 
             if response.status_code == 200:
                 self.logger.debug("Slack message sent")
                 return True
-            else:
-                self.logger.error(f"Slack API error: {response.status_code}")
-                return False
 
-        except Exception as e:
-            self.logger.error(f"Slack send error: {e}")
+            if response.status_code == 429 and attempt < self.MAX_ATTEMPTS:
+                retry_after = parse_retry_after(response)
+                if retry_after <= MAX_RETRY_AFTER:
+                    self.logger.warning(f"Slack rate limited, retrying in {retry_after:.1f}s")
+                    time.sleep(retry_after)
+                    continue
+
+            self.logger.error(f"Slack API error: {response.status_code}")
             return False
 
+        return False
+
     def _format_notification(self, notification: Notification) -> str:
         """Slack 포맷 (Markdown)"""
         lines = []
@@ -16,11 +16,16 @@ from typing import Optional
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     HAS_REQUESTS = True
 except ImportError:
     HAS_REQUESTS = False
 
-from .base import BaseNotifier
+from .base import BaseNotifier, JSON_HEADERS, MAX_RETRY_AFTER, encode_json, parse_retry_after
+
+# 워커 종료 신호 (큐에 넣어 블로킹 get()을 깨움)
+_STOP = object()
 
 
 class TelegramNotifier(BaseNotifier):
@@ -28,17 +33,30 @@ class TelegramNotifier(BaseNotifier):
 
     API_URL = "https://api.telegram.org/bot{token}/sendMessage"
 
+    # 429 응답 시 최대 시도 횟수
+    MAX_ATTEMPTS = 3
+
+    # 큐에 쌓인 메시지를 합쳐 보낼 때의 최대 길이 (API 한도 4096자)
+    MAX_BATCH_CHARS = 3800
+    BATCH_SEPARATOR = "\n\n---\n\n"
+
     def __init__(
         self,
         bot_token: str,
         chat_id: str,
-        rate_limit: float = 1.0  # 초당 최대 1개 메시지
+        rate_limit: float = 1.0,  # 초당 최대 1개 메시지
+        burst: Optional[float] = None,
+        coalesce_ms: float = 500,
+        max_batch_chars: Optional[int] = None
     ):
         """
         Args:
             bot_token: Telegram Bot API 토큰
             chat_id: 메시지를 보낼 채팅 ID
-            rate_limit: 초당 최대 메시지 수
+            rate_limit: 초당 최대 메시지 수 (장기 평균)
+            burst: 대기 없이 연속 발송 가능한 메시지 수 (기본: max(1, rate_limit))
+            coalesce_ms: send_async 메시지를 모아 한 번에 보낼 대기 시간 (밀리초, 0이면 즉시)
+            max_batch_chars: 합쳐 보낼 메시지의 최대 길이 (기본: MAX_BATCH_CHARS)
         """
         if not HAS_REQUESTS:
             raise ImportError("requests library required for TelegramNotifier")
@@ -46,46 +64,110 @@ class TelegramNotifier(BaseNotifier):
         super().__init__()
         self.bot_token = bot_token
         self.chat_id = chat_id
+        self._url = self.API_URL.format(token=bot_token)
         self.rate_limit = rate_limit
+        self.burst = max(1.0, rate_limit if burst is None else burst)
+        self.coalesce_ms = coalesce_ms
+        self.max_batch_chars = min(max_batch_chars or self.MAX_BATCH_CHARS, 4096)
+
+        # 토큰 버킷: 최대 burst개까지 연속 발송, 초당 rate_limit개 충전
+        self._capacity = self.burst
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._rate_lock = threading.Lock()
+
+        # Keep-alive session: reuse TLS connections across messages.
+        # 중복 발송 방지: 연결 실패만 재시도 (429는 send()에서 Retry-After 대기 후 재시도)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=2,
+            max_retries=Retry(total=3, read=0, backoff_factor=0.2),
+        )
+        self._session.mount("https://", adapter)
 
-        self._last_send_time = 0
         self._queue: queue.Queue = queue.Queue()
         self._running = False
         self._thread: Optional[threading.Thread] = None
+        # 워커 시작/종료 판단을 직렬화 (워커가 둘 이상 뜨지 않도록)
+        self._worker_lock = threading.Lock()
+
+    def close(self) -> None:
+        """HTTP 세션 종료"""
+        self._session.close()
 
     def send(self, message: str) -> bool:
-        """동기 메시지 발송"""
-        # Rate limiting
-        now = time.time()
-        wait_time = (1.0 / self.rate_limit) - (now - self._last_send_time)
-        if wait_time > 0:
-            time.sleep(wait_time)
+        """동기 메시지 발송 (429면 retry_after 만큼 대기 후 재시도)"""
+        body = encode_json({
+            "chat_id": self.chat_id,
+            "text": message,
+            "parse_mode": "HTML",
+        })
 
-        try:
-            url = self.API_URL.format(token=self.bot_token)
-            response = requests.post(
-                url,
-                json={
-                    "chat_id": self.chat_id,
-                    "text": message,
-                    "parse_mode": "HTML",
-                },
-                timeout=10
-            )
-
-            self._last_send_time = time.time()
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            self._acquire_token()
+
+            try:
+                response = self._session.post(self._url, data=body, headers=JSON_HEADERS, timeout=10)
+            except Exception as e:
+                self.logger.error(f"Telegram send error: {e}")
+                return False
 
             if response.status_code == 200:
                 self.logger.debug("Telegram message sent")
                 return True
-            else:
-                self.logger.error(f"Telegram API error: {response.status_code} - {response.text}")
-                return False
 
-        except Exception as e:
-            self.logger.error(f"Telegram send error: {e}")
+            if response.status_code == 429 and attempt < self.MAX_ATTEMPTS:
+                retry_after = self._retry_after(response)
+                if retry_after <= MAX_RETRY_AFTER:
+                    self.logger.warning(f"Telegram rate limited, retrying in {retry_after:.1f}s")
+                    self._backoff(retry_after)
+                    continue
+
+            self.logger.error(f"Telegram API error: {response.status_code} - {response.text}")
             return False
 
+        return False
+
+    @staticmethod
+    def _retry_after(response) -> float:
+        """Retry-After 헤더 또는 응답 본문의 parameters.retry_after (초)"""
+        if response.headers.get("Retry-After") is not None:
+            return parse_retry_after(response)
+        try:
+            return float(response.json()["parameters"]["retry_after"])
+        except Exception:
+            return 1.0
+
+    def _backoff(self, seconds: float) -> None:
+        """토큰 버킷을 비우고 seconds 동안 충전을 멈춰 모든 발송자가 대기하도록 함"""
+        with self._rate_lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._last_refill = max(self._last_refill, now + seconds)
+
+    def _refill(self, now: float) -> None:
+        """경과 시간만큼 토큰 충전 (_backoff 중이면 충전 재개 시각까지 보류)"""
+        if now > self._last_refill:
+            self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self.rate_limit)
+            self._last_refill = now
+
+    def _acquire_token(self) -> None:
+        """발송 토큰 확보 (부족하면 충전될 때까지 대기)"""
+        with self._rate_lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            # 음수로 예약해 동시 호출자가 순서대로 대기하도록 함
+            self._tokens -= 1
+            wait_time = max(0.0, self._last_refill - now)
+            if self._tokens < 0:
+                wait_time += -self._tokens / self.rate_limit
+
+        if wait_time > 0:
+            time.sleep(wait_time)
+
     def send_async(self, message: str) -> None:
         """비동기 메시지 발송 (큐에 추가)"""
         self._queue.put(message)
@@ -93,25 +175,81 @@ class TelegramNotifier(BaseNotifier):
 
     def _ensure_worker_running(self):
         """워커 스레드 확인 및 시작"""
-        if not self._running:
-            self._running = True
-            self._thread = threading.Thread(target=self._worker_loop, daemon=True)
-            self._thread.start()
+        with self._worker_lock:
+            if not self._running:
+                self._running = True
+                self._thread = threading.Thread(target=self._worker_loop, daemon=True)
+                self._thread.start()
+
+    def _finish_worker(self) -> bool:
+        """_STOP 수신 시 종료 여부 판단 (stop() 이후 들어온 메시지가 남아 있으면 계속 처리)"""
+        with self._worker_lock:
+            if not self._queue.empty():
+                return False
+            self._running = False
+            self._thread = None
+            return True
 
     def _worker_loop(self):
-        """메시지 큐 처리 루프"""
-        while self._running:
-            try:
-                message = self._queue.get(timeout=1.0)
-                self.send(message)
+        """메시지 큐 처리 루프 (_STOP을 받을 때까지, coalesce_ms 동안 들어온 메시지는 합쳐서 발송)"""
+        separator = self.BATCH_SEPARATOR
+        max_chars = self.max_batch_chars
+        pending = None
+
+        while True:
+            message = pending if pending is not None else self._queue.get()
+            pending = None
+            if message is _STOP:
                 self._queue.task_done()
-            except queue.Empty:
+                if self._finish_worker():
+                    break
                 continue
+
+            batch = [message]
+            size = len(message)
+            stop = False
+            deadline = time.monotonic() + self.coalesce_ms / 1000
+
+            while size < max_chars:
+                # 창이 끝난 뒤에도 이미 쌓인 메시지는 마저 합침
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        next_message = self._queue.get(timeout=remaining)
+                    else:
+                        next_message = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if next_message is _STOP:
+                    stop = True
+                    break
+                if size + len(separator) + len(next_message) > max_chars:
+                    # 다음 묶음의 첫 메시지로
+                    pending = next_message
+                    break
+                batch.append(next_message)
+                size += len(separator) + len(next_message)
+
+            try:
+                self.send(separator.join(batch))
             except Exception as e:
                 self.logger.error(f"Worker error: {e}")
+            finally:
+                for _ in range(len(batch) + stop):
+                    self._queue.task_done()
+
+            if stop and self._finish_worker():
+                break
 
     def stop(self):
-        """워커 스레드 중지"""
-        self._running = False
-        if self._thread:
-            self._thread.join(timeout=5)
+        """워커 스레드 중지 (이미 큐에 있는 메시지는 발송 후 종료)
+
+        join이 시간 초과돼도 워커 상태는 그대로 두고, 워커가 _STOP을 받아
+        스스로 정리함 - 그 사이 send_async가 두 번째 워커를 띄우지 않음
+        """
+        with self._worker_lock:
+            thread = self._thread
+            if thread is None:
+                return
+            self._queue.put(_STOP)
+        thread.join(timeout=5)
@@ -29,6 +29,13 @@ Usage:
         portfolio_value=10000000,
         current_price=70000
     )
+
+    # 여러 종목 일괄 계산 (NumPy 배열)
+    qtys = calculate_quantity_batch(
+        method="amount",
+        values=np.array([1000000, 500000]),
+        current_prices=np.array([70000, 150])
+    )
 """
 
 import math
@@ -36,6 +43,8 @@ from enum import Enum
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 
+import numpy as np
+
 
 class QuantityMethod(Enum):
     """수량 계산 방식"""
@@ -46,6 +55,10 @@ class QuantityMethod(Enum):
     ALL = "all"  # 전량
 
 
+# 문자열 → QuantityMethod (Enum 값 조회보다 빠름, 매 계산마다 호출되므로 미리 구성)
+_METHOD_BY_VALUE = {m.value: m for m in QuantityMethod}
+
+
 @dataclass
 class QuantityConfig:
     """수량 계산 설정"""
@@ -72,6 +85,57 @@ class QuantityConfig:
         )
 
 
+def _quantity_fixed(value, current_price, holdings_quantity, portfolio_value, rounder, commission_rate):
+    """고정 수량"""
+    return int(value)
+
+
+def _quantity_amount(value, current_price, holdings_quantity, portfolio_value, rounder, commission_rate):
+    """금액 기반 (수수료 고려)"""
+    if current_price is None or current_price <= 0:
+        raise ValueError("current_price is required for amount-based calculation")
+
+    effective_amount = value * (1 - commission_rate)
+    return rounder(effective_amount / current_price)
+
+
+def _quantity_percent(value, current_price, holdings_quantity, portfolio_value, rounder, commission_rate):
+    """보유 수량의 퍼센트"""
+    if holdings_quantity is None:
+        raise ValueError("holdings_quantity is required for percent-based calculation")
+
+    return rounder(holdings_quantity * (value / 100))
+
+
+def _quantity_portfolio_pct(value, current_price, holdings_quantity, portfolio_value, rounder, commission_rate):
+    """포트폴리오 비율 기반"""
+    if portfolio_value is None:
+        raise ValueError("portfolio_value is required for portfolio_pct calculation")
+    if current_price is None or current_price <= 0:
+        raise ValueError("current_price is required for portfolio_pct calculation")
+
+    target_amount = portfolio_value * (value / 100)
+    effective_amount = target_amount * (1 - commission_rate)
+    return rounder(effective_amount / current_price)
+
+
+def _quantity_all(value, current_price, holdings_quantity, portfolio_value, rounder, commission_rate):
+    """전량"""
+    if holdings_quantity is None:
+        raise ValueError("holdings_quantity is required for all calculation")
+    return holdings_quantity
+
+
+# 계산 방식별 수량 함수 (calculate_quantity에서 if/elif 대신 사용)
+_QUANTITY_HANDLERS = {
+    QuantityMethod.FIXED: _quantity_fixed,
+    QuantityMethod.AMOUNT: _quantity_amount,
+    QuantityMethod.PERCENT: _quantity_percent,
+    QuantityMethod.PORTFOLIO_PCT: _quantity_portfolio_pct,
+    QuantityMethod.ALL: _quantity_all,
+}
+
+
 def calculate_quantity(
     method: str,
     value: float,
@@ -101,71 +165,96 @@ def calculate_quantity(
     Raises:
         ValueError: 필수 파라미터 누락시
     """
-    qty_method = QuantityMethod(method)
+    # QuantityMethod 인스턴스나 잘못된 값은 생성자로 (ValueError 유지)
+    qty_method = _METHOD_BY_VALUE.get(method) or QuantityMethod(method)
+    rounder = math.floor if round_down else round
 
-    if qty_method == QuantityMethod.FIXED:
-        # 고정 수량
-        quantity = int(value)
+    quantity = _QUANTITY_HANDLERS[qty_method](
+        value, current_price, holdings_quantity, portfolio_value, rounder, commission_rate
+    )
 
-    elif qty_method == QuantityMethod.AMOUNT:
-        # 금액 기반
-        if current_price is None or current_price <= 0:
-            raise ValueError("current_price is required for amount-based calculation")
+    # 최소 수량 적용
+    quantity = max(int(quantity), 0)
 
-        # 수수료 고려
-        effective_amount = value * (1 - commission_rate)
-        quantity = effective_amount / current_price
+    # min_quantity 체크 (0이 아닌 경우에만)
+    if quantity > 0 and quantity < min_quantity:
+        quantity = min_quantity
 
-        if round_down:
-            quantity = math.floor(quantity)
-        else:
-            quantity = round(quantity)
+    return quantity
 
-    elif qty_method == QuantityMethod.PERCENT:
-        # 보유 수량의 퍼센트
-        if holdings_quantity is None:
-            raise ValueError("holdings_quantity is required for percent-based calculation")
 
-        quantity = holdings_quantity * (value / 100)
+def calculate_quantity_batch(
+    method: str,
+    values: np.ndarray,
+    current_prices: Optional[np.ndarray] = None,
+    holdings: Optional[np.ndarray] = None,
+    portfolio_value: Optional[float] = None,
+    min_quantity: int = 1,
+    round_down: bool = True,
+    commission_rate: float = 0.0
+) -> np.ndarray:
+    """
+    매수/매도 수량 일괄 계산 (calculate_quantity의 벡터화 버전)
+
+    종목별 결과는 같은 인자로 calculate_quantity를 호출한 것과 동일합니다.
+    백테스트처럼 많은 종목을 한 번에 계산할 때 사용하세요.
+
+    Args:
+        method: 계산 방식 (fixed, amount, percent, portfolio_pct, all)
+        values: 종목별 값 (스칼라면 모든 종목에 동일 적용)
+        current_prices: 종목별 현재가 (amount, portfolio_pct에 필요)
+        holdings: 종목별 보유 수량 (percent, all에 필요)
+        portfolio_value: 포트폴리오 총 가치 (portfolio_pct에 필요)
+        min_quantity: 최소 주문 수량
+        round_down: 내림 처리 여부
+        commission_rate: 수수료율 (금액 기반 계산시 고려)
+
+    Returns:
+        종목별 수량 (int64 배열)
+
+    Raises:
+        ValueError: 필수 파라미터 누락 또는 현재가가 0 이하인 종목이 있을 때
+    """
+    # QuantityMethod 인스턴스나 잘못된 값은 생성자로 (ValueError 유지)
+    qty_method = _METHOD_BY_VALUE.get(method) or QuantityMethod(method)
+    values = np.asarray(values, dtype=np.float64)
+
+    if qty_method in (QuantityMethod.AMOUNT, QuantityMethod.PORTFOLIO_PCT):
+        if current_prices is None:
+            raise ValueError(f"current_prices is required for {qty_method.value} calculation")
+        prices = np.asarray(current_prices, dtype=np.float64)
+        if not (prices > 0).all():
+            raise ValueError(f"current_prices must be positive for {qty_method.value} calculation")
 
-        if round_down:
-            quantity = math.floor(quantity)
-        else:
-            quantity = round(quantity)
+    if qty_method in (QuantityMethod.PERCENT, QuantityMethod.ALL) and holdings is None:
+        raise ValueError(f"holdings is required for {qty_method.value} calculation")
+
+    if qty_method == QuantityMethod.FIXED:
+        quantity = np.trunc(values)
+
+    elif qty_method == QuantityMethod.AMOUNT:
+        quantity = values * (1 - commission_rate) / prices
+
+    elif qty_method == QuantityMethod.PERCENT:
+        quantity = np.asarray(holdings, dtype=np.float64) * (values / 100)
 
     elif qty_method == QuantityMethod.PORTFOLIO_PCT:
-        # 포트폴리오 비율 기반
         if portfolio_value is None:
             raise ValueError("portfolio_value is required for portfolio_pct calculation")
-        if current_price is None or current_price <= 0:
-            raise ValueError("current_price is required for portfolio_pct calculation")
-
-        target_amount = portfolio_value * (value / 100)
-        effective_amount = target_amount * (1 - commission_rate)
-        quantity = effective_amount / current_price
-
-        if round_down:
-            quantity = math.floor(quantity)
-        else:
-            quantity = round(quantity)
+        quantity = portfolio_value * (values / 100) * (1 - commission_rate) / prices
 
-    elif qty_method == QuantityMethod.ALL:
+    else:
         # 전량
-        if holdings_quantity is None:
-            raise ValueError("holdings_quantity is required for all calculation")
-        quantity = holdings_quantity
+        quantity = np.asarray(holdings, dtype=np.float64)
 
-    else:
-        raise ValueError(f"Unknown method: {method}")
+    if qty_method not in (QuantityMethod.FIXED, QuantityMethod.ALL):
+        # np.round는 내장 round와 같은 banker's rounding
+        quantity = np.floor(quantity) if round_down else np.round(quantity)
 
-    # 최소 수량 적용
-    quantity = max(int(quantity), 0)
+    quantity = np.maximum(quantity, 0).astype(np.int64)
 
     # min_quantity 체크 (0이 아닌 경우에만)
-    if quantity > 0 and quantity < min_quantity:
-        quantity = min_quantity
-
-    return quantity
+    return np.where((quantity > 0) & (quantity < min_quantity), min_quantity, quantity)
 
 
 def calculate_buy_quantity(
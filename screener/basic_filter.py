@@ -1,6 +1,7 @@
 import os
 import pandas as pd
 import logging
+from pathlib import Path
 from typing import List
 from datetime import datetime
 from .screening_criteria import ScreeningCriteria
@@ -13,9 +14,17 @@ class BasicInfoScreener:
     - 가격, 거래량, 시가총액 등 기본 필터링
     """
 
+    CACHE_KEEP_DAYS = 5  # 보관할 일별 parquet 캐시 개수
+    NO_CACHE_ENV = "QUANT_NO_CACHE"  # 설정 시 parquet 캐시 비활성화
+
     def __init__(self, logger=None):
         self.logger = logger or logging.getLogger(__name__)
         self.config = ConfigManager()
+        self.cache_dir = (
+            self.config.project_root
+            / self.config.get_config_value('data.cache_dir', 'data/cache')
+            / 'basic_info'
+        )
 
     def get_snp500_basic_info(self) -> pd.DataFrame:
         """
@@ -37,7 +46,7 @@ class BasicInfoScreener:
                 # If file is less than 1 day old, use cached data
                 if (current_time - file_time).days < 1:
                     self.logger.info("Using cached basic info data")
-                    return pd.read_csv(file_path)
+                    return self._load_with_parquet_cache(file_path, current_time)
             
             self.logger.warning("Basic info file not found or outdated. Please run data collection first.")
             return pd.DataFrame()
@@ -46,6 +55,41 @@ class BasicInfoScreener:
             self.logger.error(f"Failed to load basic info: {e}")
             return pd.DataFrame()
 
+    def _load_with_parquet_cache(self, csv_path: str, current_time: datetime) -> pd.DataFrame:
+        """
+        CSV를 일별 parquet 캐시를 거쳐 로드합니다.
+
+        같은 날 두 번째 호출부터는 CSV 파싱 대신 parquet를 읽습니다.
+        CSV가 parquet보다 새로우면 다시 변환합니다.
+        """
+        if os.environ.get(self.NO_CACHE_ENV):
+            return pd.read_csv(csv_path)
+
+        cache_path = self.cache_dir / f"snp500_basic_{current_time.date().isoformat()}.parquet"
+
+        try:
+            if cache_path.exists() and cache_path.stat().st_mtime >= os.path.getmtime(csv_path):
+                return pd.read_parquet(cache_path)
+        except Exception as e:
+            self.logger.warning(f"Failed to read basic info parquet cache: {e}")
+
+        df = pd.read_csv(csv_path)
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(cache_path, index=False)
+            self._prune_parquet_cache()
+        except Exception as e:
+            self.logger.debug(f"Skipping basic info parquet cache: {e}")
+
+        return df
+
+    def _prune_parquet_cache(self) -> None:
+        """최근 CACHE_KEEP_DAYS 개의 일별 캐시만 유지"""
+        cache_files = sorted(self.cache_dir.glob("snp500_basic_*.parquet"))
+        for old_file in cache_files[:-self.CACHE_KEEP_DAYS]:
+            old_file.unlink(missing_ok=True)
+
     def apply_basic_filters(self, df: pd.DataFrame, criteria) -> pd.DataFrame:
         """
         기본 필터를 적용합니다.
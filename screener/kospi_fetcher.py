@@ -143,15 +143,16 @@ class KospiListFetcher:
 
         try:
             df = pd.read_csv(master_path, dtype={'code': str})
+            sectors = df['sector'] if 'sector' in df.columns else [''] * len(df)
             symbols = []
 
-            for _, row in df.iterrows():
-                code = str(row['code']).zfill(6)  # 6자리로 패딩
+            for raw_code, name, sector in zip(df['code'], df['name'], sectors):
+                code = str(raw_code).zfill(6)  # 6자리로 패딩
                 symbols.append({
                     'symbol': f"{code}.KS",
                     'code': code,
-                    'name': row['name'],
-                    'sector': row.get('sector', '')
+                    'name': name,
+                    'sector': sector
                 })
 
             logger.info(f"마스터 파일에서 {len(symbols)}개 종목 로드: {master_path}")
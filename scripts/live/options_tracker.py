@@ -7,18 +7,19 @@ Based on Todo/1.bot.md specifications
 
 import sys
 import time
+import random
+import asyncio
 import logging
 from datetime import datetime, timedelta
-import pandas as pd
 from typing import List, Dict
 from utils.options_fetch import (
     fetch_options_chain,
-    calculate_volume_metrics,
+    calculate_volume_metrics_pair,
     detect_unusual_activity,
-    save_options_volume_history,
+    save_options_volume_history_many,
     get_options_volume_history
 )
-from utils.timezone_utils import get_current_market_time
+from utils.timezone_utils import get_current_market_time, is_market_open
 
 # Configure logging
 logging.basicConfig(
@@ -36,6 +37,10 @@ TARGET_SYMBOLS = ['NVDA', 'AAPL', 'TSLA', 'AMZN']
 
 # Configuration
 CHECK_INTERVAL = 60  # seconds
+CHECK_JITTER = 5  # +/- seconds, keeps multiple instances from syncing up
+OFF_HOURS_INTERVAL = 300  # seconds between market-open checks while closed
+MARKET_HOURS_ONLY = True  # skip fetches outside the regular session
+CONCURRENCY_LIMIT = 4  # max symbols analyzed at once
 VOLUME_THRESHOLD = 2.0  # 2x average for unusual activity
 ALERT_THRESHOLD = 3.0  # 3x average for high alert
 
@@ -60,34 +65,21 @@ def analyze_single_stock(symbol: str) -> Dict:
         # Fetch current options chain
         options_data = fetch_options_chain(symbol)
         
-        # Calculate metrics for calls and puts
-        call_metrics = calculate_volume_metrics(options_data['calls'])
-        put_metrics = calculate_volume_metrics(options_data['puts'])
-        
-        # Combined metrics
-        total_metrics = {
-            'total_volume': call_metrics['total_volume'] + put_metrics['total_volume'],
-            'call_volume': call_metrics['total_volume'],
-            'put_volume': put_metrics['total_volume'],
-            'total_open_interest': call_metrics['total_open_interest'] + put_metrics['total_open_interest'],
-            'put_call_ratio': put_metrics['total_volume'] / call_metrics['total_volume'] 
-                             if call_metrics['total_volume'] > 0 else 0
-        }
+        # Calculate combined call/put metrics
+        pair = calculate_volume_metrics_pair(options_data['calls'], options_data['puts'])
+        total_metrics = pair['metrics']
         
         # Detect unusual activity
         detection = detect_unusual_activity(symbol, total_metrics, VOLUME_THRESHOLD)
         
-        # Save to history
-        save_options_volume_history(symbol, total_metrics)
-        
         # Prepare result
         result = {
             'symbol': symbol,
             'timestamp': datetime.now(),
             'metrics': total_metrics,
             'detection': detection,
-            'top_call_strikes': call_metrics['top_strikes'][:3],
-            'top_put_strikes': put_metrics['top_strikes'][:3],
+            'top_call_strikes': pair['top_call_strikes'],
+            'top_put_strikes': pair['top_put_strikes'],
             'alert_level': 'HIGH' if detection['ratio'] >= ALERT_THRESHOLD else 
                           'MEDIUM' if detection['is_unusual'] else 'NORMAL'
         }
@@ -103,6 +95,31 @@ def analyze_single_stock(symbol: str) -> Dict:
             'alert_level': 'ERROR'
         }
 
+async def analyze_single_stock_async(symbol: str, sem: asyncio.Semaphore) -> Dict:
+    """Run analyze_single_stock in a worker thread, bounded by the semaphore"""
+    async with sem:
+        return await asyncio.to_thread(analyze_single_stock, symbol)
+
+async def _analyze_all_async(symbols: List[str]) -> List[Dict]:
+    sem = asyncio.Semaphore(CONCURRENCY_LIMIT)
+    return list(await asyncio.gather(
+        *[analyze_single_stock_async(symbol, sem) for symbol in symbols]
+    ))
+
+def analyze_all_stocks(symbols: List[str] = TARGET_SYMBOLS) -> List[Dict]:
+    """
+    Analyze all symbols concurrently
+
+    Each symbol's fetch is network-bound, so wall-clock time is roughly the
+    slowest symbol instead of the sum. Results keep the input order.
+    Volume history for the whole check is saved once afterwards.
+    """
+    results = asyncio.run(_analyze_all_async(symbols))
+    save_options_volume_history_many({
+        r['symbol']: r['metrics'] for r in results if 'error' not in r
+    })
+    return results
+
 def display_results(results: List[Dict]):
     """Display analysis results in formatted table"""
     
@@ -179,16 +196,18 @@ def run_continuous_monitoring():
     
     try:
         while True:
-            check_count += 1
-            
-            # Check if market is open (optional - can run after hours too)
+            # Options volume is stale outside the session - skip the fetch
             market_time = get_current_market_time()
+            if MARKET_HOURS_ONLY and not is_market_open(market_time):
+                logger.info(f"Market closed ({market_time.strftime('%Y-%m-%d %H:%M %Z')}), "
+                            f"next check in {OFF_HOURS_INTERVAL} seconds")
+                time.sleep(OFF_HOURS_INTERVAL)
+                continue
+            
+            check_count += 1
             
             # Analyze all stocks
-            results = []
-            for symbol in TARGET_SYMBOLS:
-                result = analyze_single_stock(symbol)
-                results.append(result)
+            results = analyze_all_stocks(TARGET_SYMBOLS)
             
             # Display results
             display_results(results)
@@ -202,7 +221,7 @@ def run_continuous_monitoring():
             print("   (Press Ctrl+C to stop)")
             
             # Wait for next check
-            time.sleep(CHECK_INTERVAL)
+            time.sleep(CHECK_INTERVAL + random.uniform(-CHECK_JITTER, CHECK_JITTER))
             
     except KeyboardInterrupt:
         print("\n\n🛑 Options Volume Tracker stopped by user")
@@ -216,10 +235,7 @@ def run_single_check():
     
     print("\n🔍 Running single options volume check...")
     
-    results = []
-    for symbol in TARGET_SYMBOLS:
-        result = analyze_single_stock(symbol)
-        results.append(result)
+    results = analyze_all_stocks(TARGET_SYMBOLS)
     
     display_results(results)
     
@@ -69,14 +69,16 @@ def run():
     logger.info(f"Found {len(fresh_breakouts)} fresh breakouts in technology sector")
     
     if fresh_breakouts:
-        logger.info("\n=== TOP TECHNOLOGY BREAKOUTS ===")
-        for i, stock in enumerate(fresh_breakouts[:10], 1):
-            logger.info(
-                f"{i}. {stock['symbol']:6s} | "
-                f"Price: ${stock['current_price']:.2f} | "
-                f"Volume Ratio: {stock.get('volume_ratio', 0):.1f}x | "
-                f"Above Bottom: {stock.get('above_bottom_pct', 0):.1f}%"
-            )
+        # Emit the ranking as a single log record
+        lines = ["\n=== TOP TECHNOLOGY BREAKOUTS ==="]
+        lines.extend(
+            f"{i}. {stock['symbol']:6s} | "
+            f"Price: ${stock['current_price']:.2f} | "
+            f"Volume Ratio: {stock.get('volume_ratio', 0):.1f}x | "
+            f"Above Bottom: {stock.get('above_bottom_pct', 0):.1f}%"
+            for i, stock in enumerate(fresh_breakouts[:10], 1)
+        )
+        logger.info("\n".join(lines))
     
     return final_results
 
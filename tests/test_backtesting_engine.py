@@ -0,0 +1,91 @@
+"""
+Tests for Backtesting Engine
+"""
+
+import multiprocessing
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+from backtesting import Strategy
+
+from engine.backtesting_engine import BacktestEngine, BacktestResult
+
+
+# ============================================================
+# Fixtures
+# ============================================================
+
+def make_ohlcv(periods=60):
+    """Deterministic OHLCV frame in Backtesting.py's column layout"""
+    index = pd.date_range("2025-01-01", periods=periods, freq="D")
+    close = 100 + np.sin(np.arange(periods) / 5) * 10
+    return pd.DataFrame({
+        "Open": close,
+        "High": close + 1,
+        "Low": close - 1,
+        "Close": close,
+        "Volume": np.full(periods, 1000),
+    }, index=index)
+
+
+def fake_fetch_data(self, ticker, period="1y", start=None, end=None):
+    """fetch_data without network access ("BAD" has no data)"""
+    if ticker == "BAD":
+        raise ValueError(f"No data found for ticker: {ticker}")
+    return make_ohlcv()
+
+
+class BuyAndHold(Strategy):
+    """Module-level strategy so worker processes can unpickle it"""
+
+    def init(self):
+        pass
+
+    def next(self):
+        if not self.position:
+            self.buy()
+
+
+# ============================================================
+# batch_run
+# ============================================================
+
+class TestBatchRunSequential:
+    """workers=1 runs in-process"""
+
+    def test_results_in_input_order_and_failures_dropped(self, monkeypatch):
+        def fake_run(self, strategy, ticker, **kwargs):
+            if ticker == "BAD":
+                raise ValueError("no data")
+            stats = pd.Series({"Return [%]": 5.0, "_strategy": object()})
+            return BacktestResult(stats=stats, trades=pd.DataFrame(), equity_curve=pd.DataFrame())
+
+        monkeypatch.setattr(BacktestEngine, "run", fake_run)
+
+        results = BacktestEngine().batch_run(BuyAndHold, ["MSFT", "BAD", "AAPL"], workers=1)
+
+        assert list(results) == ["MSFT", "AAPL"]
+        assert results["AAPL"].total_return == pytest.approx(0.05)
+        assert "_strategy" not in results["AAPL"].stats.index
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="workers inherit the patched fetch_data only under fork"
+)
+class TestBatchRunProcesses:
+    """workers>1 runs each ticker in a worker process"""
+
+    def test_results_pickle_back_from_workers(self, monkeypatch):
+        monkeypatch.setattr(BacktestEngine, "fetch_data", fake_fetch_data)
+
+        results = BacktestEngine().batch_run(BuyAndHold, ["AAPL", "BAD", "MSFT"], workers=2)
+
+        assert list(results) == ["AAPL", "MSFT"]
+        result = results["AAPL"]
+        assert result.num_trades == 1
+        assert not [key for key in result.stats.index if str(key).startswith("_")]
+        assert len(result.equity_curve) == 60
+        pickle.dumps(result)
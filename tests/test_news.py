@@ -0,0 +1,459 @@
+"""
+Tests for News Providers and Aggregator
+"""
+
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from news import finnhub
+from news import cache as cache_module
+from news.aggregator import NewsAggregator
+from news.finnhub import FinnhubProvider
+from news.marketaux import MarketauxProvider
+from news.provider import BaseNewsProvider, NewsItem, Sentiment
+
+
+# ============================================================
+# Fixtures
+# ============================================================
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response"""
+
+    def __init__(self, payload, status_code=200):
+        self._payload = payload
+        self.status_code = status_code
+
+    @property
+    def content(self):
+        return json.dumps(self._payload).encode()
+
+    def json(self):
+        return self._payload
+
+
+class StaticProvider(BaseNewsProvider):
+    """Provider returning a fixed list of news items"""
+
+    def __init__(self, name, items):
+        super().__init__(api_key="test")
+        self._name = name
+        self._items = items
+
+    @property
+    def name(self):
+        return self._name
+
+    def get_news(self, ticker, limit=10, from_date=None, to_date=None):
+        self.last_limit = limit
+        return list(self._items[:limit])
+
+
+def make_item(title, hours_ago=0, score=None, provider="static"):
+    """Build a NewsItem for aggregator tests"""
+    sentiment = None
+    if score is not None:
+        sentiment = (
+            Sentiment.POSITIVE if score > 0.2
+            else Sentiment.NEGATIVE if score < -0.2
+            else Sentiment.NEUTRAL
+        )
+    return NewsItem(
+        title=title,
+        summary=None,
+        url=f"https://example.com/{abs(hash(title))}",
+        source="Test",
+        published_at=datetime(2026, 1, 1) - timedelta(hours=hours_ago),
+        ticker="AAPL",
+        sentiment=sentiment,
+        sentiment_score=score,
+        provider=provider,
+    )
+
+
+@pytest.fixture
+def aggregator():
+    """NewsAggregator with two static providers and no network access"""
+    agg = NewsAggregator(enable_finnhub=False, enable_marketaux=False)
+    agg.add_provider(StaticProvider("a", [
+        make_item("Apple beats earnings estimates", hours_ago=1, score=0.6),
+        make_item("Apple unveils new headset", hours_ago=5, score=0.0),
+    ]))
+    agg.add_provider(StaticProvider("b", [
+        make_item("Apple beats earnings estimates", hours_ago=2),
+        make_item("iPhone sales drop in China", hours_ago=3, score=-0.5),
+    ]))
+    return agg
+
+
+@pytest.fixture
+def finnhub_payload():
+    """Sample Finnhub company-news payload"""
+    return [
+        {
+            "datetime": 1700000000,
+            "headline": "Apple shares surge on record profit",
+            "summary": "Strong growth in services",
+            "url": "https://example.com/1",
+            "source": "Reuters",
+        },
+        {
+            "datetime": 1700003600,
+            "headline": "Apple faces downgrade amid concern",
+            "summary": "Analysts warn of weak demand",
+            "url": "https://example.com/2",
+            "source": "Bloomberg",
+        },
+    ]
+
+
+@pytest.fixture
+def finnhub_provider(monkeypatch, finnhub_payload):
+    """FinnhubProvider with the HTTP layer replaced by a call counter"""
+    calls = []
+
+    def fake_get(url, params=None, timeout=None):
+        calls.append(params)
+        return FakeResponse(finnhub_payload)
+
+    provider = FinnhubProvider(api_key="test")
+    monkeypatch.setattr(provider._session, "get", fake_get)
+    provider.clear_cache()
+    provider.calls = calls
+    return provider
+
+
+def marketaux_article(symbol, title, score):
+    """Sample Marketaux article with a single entity"""
+    return {
+        "title": title,
+        "description": f"{title} description",
+        "url": f"https://example.com/{symbol}/{title}",
+        "source": "Reuters",
+        "published_at": "2026-01-02T15:30:00.000000Z",
+        "entities": [{"symbol": symbol, "sentiment_score": score}],
+    }
+
+
+@pytest.fixture
+def marketaux_provider(monkeypatch, tmp_path):
+    """MarketauxProvider with the HTTP layer replaced by a call counter"""
+    calls = []
+
+    def fake_get(url, params=None, timeout=None):
+        calls.append(params)
+        symbol = params.get("symbols", "MARKET")
+        return FakeResponse({"data": [
+            marketaux_article(symbol, f"{symbol} rallies", 0.5),
+            marketaux_article(symbol, f"{symbol} slips", -0.4),
+        ]})
+
+    provider = MarketauxProvider(api_key="test", cache_dir=str(tmp_path / "marketaux"))
+    monkeypatch.setattr(provider._session, "get", fake_get)
+    provider.calls = calls
+    return provider
+
+
+# ============================================================
+# FinnhubProvider
+# ============================================================
+
+class TestFinnhubCache:
+    """Finnhub get_news TTL cache"""
+
+    def test_repeated_call_hits_cache(self, finnhub_provider):
+        first = finnhub_provider.get_news("AAPL")
+        second = finnhub_provider.get_news("aapl")
+
+        assert len(finnhub_provider.calls) == 1
+        assert [n.title for n in first] == [n.title for n in second]
+
+    def test_cached_list_is_not_shared(self, finnhub_provider):
+        first = finnhub_provider.get_news("AAPL")
+        first.clear()
+
+        assert len(finnhub_provider.get_news("AAPL")) == 2
+
+    def test_expired_entry_refetches(self, finnhub_provider, monkeypatch):
+        finnhub_provider.get_news("AAPL")
+
+        now = finnhub.time.monotonic()
+        monkeypatch.setattr(
+            finnhub.time, "monotonic",
+            lambda: now + finnhub_provider.cache_ttl + 1
+        )
+        finnhub_provider.get_news("AAPL")
+
+        assert len(finnhub_provider.calls) == 2
+
+    def test_store_prunes_expired_entries(self, finnhub_provider, monkeypatch):
+        finnhub_provider.get_news("AAPL")
+
+        now = finnhub.time.monotonic()
+        monkeypatch.setattr(
+            finnhub.time, "monotonic",
+            lambda: now + finnhub_provider.cache_ttl + 1
+        )
+        finnhub_provider.get_news("MSFT")
+
+        assert [key[0] for key in finnhub_provider._cache] == ["MSFT"]
+
+    def test_expired_entry_removed_by_another_thread(self, finnhub_provider):
+        stale = (finnhub.time.monotonic() - finnhub_provider.cache_ttl - 1, [])
+
+        class RacedCache(dict):
+            """get() sees the expired entry, but another thread already removed it"""
+
+            def get(self, key, default=None):
+                return stale
+
+        finnhub_provider._cache = RacedCache()
+
+        assert finnhub_provider._get_cached(("AAPL",)) is None
+
+    def test_clear_cache(self, finnhub_provider):
+        finnhub_provider.get_news("AAPL")
+        finnhub_provider.clear_cache()
+        finnhub_provider.get_news("AAPL")
+
+        assert len(finnhub_provider.calls) == 2
+
+
+class TestFinnhubSession:
+    """HTTP session configuration"""
+
+    def test_429_not_retried_by_urllib3(self):
+        retry = FinnhubProvider(api_key="test")._session.get_adapter("https://finnhub.io").max_retries
+
+        assert 429 not in retry.status_forcelist
+        assert 503 in retry.status_forcelist
+
+    def test_aggregator_closes_providers(self, aggregator):
+        closed = []
+        for provider in aggregator._providers:
+            provider.close = lambda name=provider.name: closed.append(name)
+
+        with aggregator:
+            pass
+
+        assert closed == ["a", "b"]
+
+
+class TestFinnhubAsync:
+    """Async path runs get_news in a worker thread"""
+
+    def test_async_uses_session(self, finnhub_provider):
+        news = asyncio.run(finnhub_provider.get_news_async("AAPL"))
+
+        assert len(news) == 2
+        assert len(finnhub_provider.calls) == 1
+
+
+class TestFinnhubParse:
+    """Batch parsing of Finnhub payloads"""
+
+    def test_skips_malformed_items(self, finnhub_payload):
+        provider = FinnhubProvider(api_key="test")
+        data = finnhub_payload + [
+            {"headline": "No timestamp"},
+            {"datetime": "2024-01-01", "headline": "Bad timestamp"},
+            "not a dict",
+        ]
+
+        items = provider._parse_batch(data, "AAPL")
+
+        assert [n.url for n in items] == ["https://example.com/1", "https://example.com/2"]
+
+    def test_published_at_is_naive_utc(self, finnhub_payload):
+        item = FinnhubProvider(api_key="test")._parse_batch(finnhub_payload[:1], "AAPL")[0]
+
+        assert item.published_at == datetime(2023, 11, 14, 22, 13, 20)
+        assert item.raw_data is None
+
+
+class TestFinnhubSentiment:
+    """Keyword-based sentiment scoring"""
+
+    def test_positive(self):
+        sentiment, score = FinnhubProvider(api_key="test")._analyze_sentiment(
+            "Shares surge to record high"
+        )
+        assert sentiment == Sentiment.POSITIVE
+        assert score > 0.2
+
+    def test_negative(self):
+        sentiment, score = FinnhubProvider(api_key="test")._analyze_sentiment(
+            "Stock plunge after earnings miss"
+        )
+        assert sentiment == Sentiment.NEGATIVE
+        assert score < -0.2
+
+    def test_empty(self):
+        assert FinnhubProvider(api_key="test")._analyze_sentiment("") == (None, None)
+
+
+# ============================================================
+# MarketauxProvider
+# ============================================================
+
+class TestMarketaux:
+    """Marketaux parsing and fan-out"""
+
+    def test_get_news(self, marketaux_provider):
+        news = marketaux_provider.get_news("AAPL")
+
+        assert [n.sentiment for n in news] == [Sentiment.POSITIVE, Sentiment.NEGATIVE]
+        assert news[0].published_at == datetime(2026, 1, 2, 15, 30)
+        assert news[0].summary == "AAPL rallies description"
+
+    def test_limit_sent_upstream(self, marketaux_provider):
+        news = marketaux_provider.get_news("AAPL", limit=1)
+
+        assert marketaux_provider.calls[0]["limit"] == 1
+        assert len(news) == 1
+
+    def test_get_news_many(self, marketaux_provider):
+        results = marketaux_provider.get_news_many(["AAPL", "MSFT", "005930.KS"])
+
+        assert list(results) == ["AAPL", "MSFT", "005930.KS"]
+        assert results["MSFT"][0].title == "MSFT rallies"
+        assert results["005930.KS"][0].sentiment_score == 0.5
+        assert len(marketaux_provider.calls) == 3
+
+    def test_file_cache_hit(self, marketaux_provider, tmp_path):
+        marketaux_provider.get_news("AAPL")
+        cached = marketaux_provider.get_news("AAPL")
+
+        assert len(marketaux_provider.calls) == 1
+        assert [n.title for n in cached] == ["AAPL rallies", "AAPL slips"]
+
+        # Cache file must not contain the API token
+        cache_files = list((tmp_path / "marketaux").glob("*.json"))
+        assert len(cache_files) == 1
+        assert "api_token" not in cache_files[0].read_text()
+
+    def test_empty_response_not_cached(self, monkeypatch, tmp_path):
+        calls = []
+        provider = MarketauxProvider(api_key="test", cache_dir=str(tmp_path / "marketaux"))
+        monkeypatch.setattr(
+            provider._session, "get",
+            lambda url, params=None, timeout=None: calls.append(params) or FakeResponse({"meta": {}})
+        )
+
+        assert provider.get_news("AAPL") == []
+        assert provider.get_news("AAPL") == []
+        assert len(calls) == 2
+        assert not (tmp_path / "marketaux").exists()
+
+    def test_default_cache_dir_independent_of_cwd(self, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+
+        cache_dir = Path(MarketauxProvider(api_key="test")._cache.cache_dir)
+
+        assert cache_dir.is_absolute()
+        assert cache_dir.name == "marketaux"
+        assert tmp_path not in cache_dir.parents
+
+    def test_file_cache_expired(self, marketaux_provider, monkeypatch):
+        marketaux_provider.get_news("AAPL")
+
+        now = time.time()
+        monkeypatch.setattr(
+            cache_module.time, "time",
+            lambda: now + MarketauxProvider.NEWS_CACHE_TTL + 1
+        )
+        marketaux_provider.get_news("AAPL")
+
+        assert len(marketaux_provider.calls) == 2
+
+
+# ============================================================
+# NewsAggregator
+# ============================================================
+
+class TestAggregator:
+    """Merge, dedup and sentiment aggregation"""
+
+    def test_get_news_dedups_and_sorts(self, aggregator):
+        news = aggregator.get_news("AAPL")
+
+        assert [n.title for n in news] == [
+            "Apple beats earnings estimates",
+            "iPhone sales drop in China",
+            "Apple unveils new headset",
+        ]
+
+    def test_per_provider_limit(self, aggregator):
+        aggregator.get_news("AAPL", limit=10)
+
+        # ceil(10 * 1.5 / 2) per provider instead of 10 each
+        assert [p.last_limit for p in aggregator._providers] == [8, 8]
+
+    def test_single_provider_limit_capped(self):
+        agg = NewsAggregator(enable_finnhub=False, enable_marketaux=False)
+        provider = StaticProvider("a", [])
+        agg.add_provider(provider)
+        agg.get_news("AAPL", limit=10)
+
+        assert provider.last_limit == 10
+
+    def test_async_matches_sync(self, aggregator):
+        sync_titles = [n.title for n in aggregator.get_news("AAPL")]
+        async_titles = [n.title for n in asyncio.run(aggregator.get_news_async("AAPL"))]
+
+        assert async_titles == sync_titles
+
+    def test_multi_sentiment_async(self, aggregator):
+        results = asyncio.run(aggregator.get_multi_sentiment_async(["AAPL", "MSFT"]))
+
+        assert set(results) == {"AAPL", "MSFT"}
+        assert results["AAPL"].total_count == 3
+        assert results["AAPL"].positive_count == 1
+        assert results["AAPL"].negative_count == 1
+
+    def test_multi_sentiment_async_bounded(self, aggregator, monkeypatch):
+        monkeypatch.setattr(NewsAggregator, "CONCURRENCY_LIMIT", 2)
+        in_flight = []
+        peak = []
+        original = aggregator.get_sentiment_async
+
+        async def tracked(ticker):
+            in_flight.append(ticker)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            try:
+                return await original(ticker)
+            finally:
+                in_flight.remove(ticker)
+
+        monkeypatch.setattr(aggregator, "get_sentiment_async", tracked)
+        results = asyncio.run(aggregator.get_multi_sentiment_async(["A", "B", "C", "D", "E"]))
+
+        assert set(results) == {"A", "B", "C", "D", "E"}
+        assert max(peak) == 2
+
+
+class TestSentimentEnum:
+    """Sentiment keeps its string values"""
+
+    def test_values_and_serialization(self):
+        item = make_item("Apple beats earnings estimates", score=0.6)
+
+        assert Sentiment.POSITIVE == "positive"
+        assert item.to_dict()["sentiment"] == "positive"
+        assert json.dumps({"s": Sentiment.NEGATIVE}) == '{"s": "negative"}'
+
+    def test_flags_fall_back_to_score(self):
+        item = make_item("Apple unveils new headset")
+        item_with_score = NewsItem(
+            title="t", summary=None, url="u", source="s",
+            published_at=datetime(2026, 1, 1), sentiment_score=-0.5,
+        )
+
+        assert (item.is_positive, item.is_negative) == (False, False)
+        assert (item_with_score.is_positive, item_with_score.is_negative) == (False, True)
@@ -0,0 +1,407 @@
+"""
+Tests for Portfolio Notifiers
+"""
+
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from portfolio.notifiers import slack as slack_module
+from portfolio.notifiers import telegram as telegram_module
+from portfolio.notifiers.base import AlertType, BaseNotifier, Notification
+from portfolio.notifiers.console import ConsoleNotifier
+from portfolio.notifiers.multi import MultiNotifier
+from portfolio.notifiers.slack import SlackNotifier
+from portfolio.notifiers.telegram import TelegramNotifier
+
+
+# ============================================================
+# Fixtures
+# ============================================================
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response"""
+
+    def __init__(self, status_code=200, text="ok", headers=None, payload=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+        self._payload = payload
+
+    def json(self):
+        if self._payload is None:
+            raise ValueError("no JSON body")
+        return self._payload
+
+
+@pytest.fixture
+def telegram(monkeypatch):
+    """TelegramNotifier with the HTTP layer replaced by a call recorder"""
+    sent = []
+
+    def fake_post(url, data=None, headers=None, timeout=None):
+        sent.append(json.loads(data)["text"])
+        return FakeResponse()
+
+    notifier = TelegramNotifier(bot_token="token", chat_id="1", rate_limit=1000)
+    monkeypatch.setattr(notifier._session, "post", fake_post)
+    notifier.sent = sent
+    return notifier
+
+
+# ============================================================
+# TelegramNotifier
+# ============================================================
+
+class TestTelegramWorker:
+    """Async queue worker"""
+
+    def test_stop_drains_queue_and_returns_quickly(self, telegram):
+        for i in range(5):
+            telegram.send_async(f"msg {i}")
+
+        started = time.monotonic()
+        telegram.stop()
+
+        assert time.monotonic() - started < 1
+        delivered = [m for text in telegram.sent for m in text.split(TelegramNotifier.BATCH_SEPARATOR)]
+        assert delivered == [f"msg {i}" for i in range(5)]
+        assert telegram._thread is None
+
+    def test_queued_messages_batched(self, telegram):
+        long_message = "x" * 2000
+        for message in ["a", "b", long_message, long_message, "c"]:
+            telegram._queue.put(message)
+
+        telegram._ensure_worker_running()
+        telegram._queue.join()
+        telegram.stop()
+
+        separator = TelegramNotifier.BATCH_SEPARATOR
+        assert telegram.sent == [
+            separator.join(["a", "b", long_message]),
+            separator.join([long_message, "c"]),
+        ]
+
+    def test_restart_after_stop(self, telegram):
+        telegram.send_async("first")
+        telegram.stop()
+        telegram.send_async("second")
+        telegram._queue.join()
+        telegram.stop()
+
+        assert telegram.sent == ["first", "second"]
+
+    def test_coalesce_window_joins_spaced_messages(self, telegram):
+        telegram.coalesce_ms = 300
+        telegram.send_async("a")
+        time.sleep(0.05)
+        telegram.send_async("b")
+        telegram._queue.join()
+        telegram.stop()
+
+        assert telegram.sent == [TelegramNotifier.BATCH_SEPARATOR.join(["a", "b"])]
+
+    def test_zero_window_sends_immediately(self, telegram):
+        telegram.coalesce_ms = 0
+        telegram.send_async("a")
+        telegram._queue.join()
+        telegram.send_async("b")
+        telegram._queue.join()
+        telegram.stop()
+
+        assert telegram.sent == ["a", "b"]
+
+
+class TestTelegramRateLimit:
+    """Token bucket rate limiting"""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        class FakeClock:
+            def __init__(self):
+                self.now = 1000.0
+                self.sleeps = []
+
+            def monotonic(self):
+                return self.now
+
+            def sleep(self, seconds):
+                self.sleeps.append(round(seconds, 6))
+                self.now += seconds
+
+        fake = FakeClock()
+        monkeypatch.setattr(telegram_module, "time", fake)
+        return fake
+
+    def test_burst_then_throttle(self, monkeypatch, clock):
+        notifier = TelegramNotifier(bot_token="token", chat_id="1", rate_limit=5)
+        monkeypatch.setattr(notifier._session, "post", lambda *a, **k: FakeResponse())
+
+        for _ in range(7):
+            notifier.send("hi")
+
+        # 5 immediate sends, then one token per 0.2s
+        assert clock.sleeps == [0.2, 0.2]
+
+        clock.now += 10
+        notifier.send("hi")
+        assert clock.sleeps == [0.2, 0.2]
+
+    def test_burst_independent_of_rate(self, monkeypatch, clock):
+        notifier = TelegramNotifier(bot_token="token", chat_id="1", rate_limit=0.5, burst=3)
+        monkeypatch.setattr(notifier._session, "post", lambda *a, **k: FakeResponse())
+
+        for _ in range(4):
+            notifier.send("hi")
+
+        # 3 immediate sends, then one token every 2s
+        assert clock.sleeps == [2.0]
+
+    def test_429_waits_retry_after_then_resends(self, monkeypatch, clock):
+        notifier = TelegramNotifier(bot_token="token", chat_id="1", rate_limit=1000)
+        responses = [
+            FakeResponse(429, payload={"ok": False, "parameters": {"retry_after": 3}}),
+            FakeResponse(429, headers={"Retry-After": "2"}),
+            FakeResponse(200),
+        ]
+        monkeypatch.setattr(notifier._session, "post", lambda *a, **k: responses.pop(0))
+
+        assert notifier.send("hi")
+        assert clock.sleeps == [3.001, 2.001]
+
+    def test_429_gives_up(self, monkeypatch, clock):
+        notifier = TelegramNotifier(bot_token="token", chat_id="1", rate_limit=1000)
+        calls = []
+        monkeypatch.setattr(
+            notifier._session, "post",
+            lambda *a, **k: calls.append(1) or FakeResponse(429, headers={"Retry-After": "1"}),
+        )
+        assert not notifier.send("hi")
+        assert len(calls) == TelegramNotifier.MAX_ATTEMPTS
+
+        # A flood wait longer than MAX_RETRY_AFTER is not slept through
+        calls.clear()
+        monkeypatch.setattr(
+            notifier._session, "post",
+            lambda *a, **k: calls.append(1) or FakeResponse(429, headers={"Retry-After": "600"}),
+        )
+        assert not notifier.send("hi")
+        assert len(calls) == 1
+
+    def test_default_rate_keeps_one_per_second(self, monkeypatch, clock):
+        notifier = TelegramNotifier(bot_token="token", chat_id="1")
+        monkeypatch.setattr(notifier._session, "post", lambda *a, **k: FakeResponse())
+
+        for _ in range(3):
+            notifier.send("hi")
+
+        assert clock.sleeps == [1.0, 1.0]
+
+
+# ============================================================
+# Connection reuse
+# ============================================================
+
+class TestSessions:
+    """Notifiers post through a pooled keep-alive session"""
+
+    @pytest.mark.parametrize("notifier", [
+        TelegramNotifier(bot_token="token", chat_id="1", rate_limit=1000),
+        SlackNotifier(webhook_url="https://hooks.slack.com/test"),
+    ])
+    def test_session_reused(self, notifier, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            notifier._session, "post",
+            lambda url, data=None, headers=None, timeout=None: calls.append(url) or FakeResponse(),
+        )
+
+        assert notifier.send("a") and notifier.send("b")
+        assert len(calls) == 2
+
+        # Only connection failures are retried by urllib3; 429 is handled in send()
+        retry = notifier._session.get_adapter("https://example.com").max_retries
+        assert retry.read == 0
+        assert not retry.status_forcelist
+
+
+# ============================================================
+# MultiNotifier
+# ============================================================
+
+class RecordingNotifier(BaseNotifier):
+    """Notifier that records messages, optionally slow or failing"""
+
+    def __init__(self, result=True, delay=0.0, error=None):
+        super().__init__()
+        self.result = result
+        self.delay = delay
+        self.error = error
+        self.messages = []
+
+    def send(self, message):
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        self.messages.append(message)
+        return self.result
+
+
+class TestFormatNotification:
+    """Plain-text notification layout"""
+
+    def test_full_layout(self):
+        notification = Notification(
+            message="Price fell",
+            alert_type=AlertType.STOP_LOSS,
+            ticker="AAPL",
+            details={"price": 1234.5, "quantity": 3},
+            timestamp=datetime(2026, 1, 2, 9, 30, 15, 123456),
+        )
+
+        assert RecordingNotifier()._format_notification(notification) == (
+            "🛑 [STOP_LOSS]\n"
+            "Ticker: AAPL\n"
+            "Message: Price fell\n"
+            "  price: 1,234.50\n"
+            "  quantity: 3\n"
+            "Time: 2026-01-02 09:30:15"
+        )
+
+    def test_minimal_layout_with_aware_timestamp(self):
+        notification = Notification(
+            message="hi", timestamp=datetime(2026, 1, 2, 9, 30, tzinfo=timezone.utc)
+        )
+
+        assert RecordingNotifier()._format_notification(notification) == (
+            "ℹ️ [INFO]\nMessage: hi\nTime: 2026-01-02 09:30:00"
+        )
+
+
+class TestConsoleHistory:
+    """ConsoleNotifier keeps a bounded history"""
+
+    def test_oldest_entries_dropped(self, capsys):
+        notifier = ConsoleNotifier(history_size=2)
+        for message in ["a", "b", "c"]:
+            notifier.send_notification(Notification(message=message))
+
+        assert [n["message"] for n in notifier.get_history()] == ["b", "c"]
+
+        notifier.clear_history()
+        assert notifier.get_history() == []
+
+
+class TestMultiNotifier:
+    """Fan-out to several notifiers"""
+
+    def test_sends_in_parallel(self):
+        multi = MultiNotifier()
+        backends = [RecordingNotifier(delay=0.2) for _ in range(3)]
+        for backend in backends:
+            multi.add(backend)
+
+        started = time.monotonic()
+        assert multi.send("hi")
+        elapsed = time.monotonic() - started
+        multi.close()
+
+        assert elapsed < 0.5
+        assert all(b.messages == ["hi"] for b in backends)
+
+    def test_failure_and_exception_reported(self):
+        multi = MultiNotifier()
+        ok = RecordingNotifier()
+        multi.add(ok).add(RecordingNotifier(result=False))
+
+        assert not multi.send("a")
+
+        multi.remove(multi._notifiers[1])
+        multi.add(RecordingNotifier(error=RuntimeError("boom")))
+
+        assert not multi.send("b")
+        assert ok.messages == ["a", "b"]
+        multi.close()
+
+    def test_single_and_empty(self):
+        multi = MultiNotifier()
+        assert multi.send("nothing")
+
+        multi.add(RecordingNotifier())
+        assert multi.send("one")
+        assert multi._pool is None
+
+    def test_add_remove_during_send(self):
+        multi = MultiNotifier()
+        slow = RecordingNotifier(delay=0.2)
+        multi.add(slow).add(RecordingNotifier())
+
+        sender = threading.Thread(target=multi.send, args=("hi",))
+        sender.start()
+        time.sleep(0.05)
+        late = RecordingNotifier()
+        multi.add(late)
+        assert multi.remove(slow)
+        assert not multi.remove(slow)
+        sender.join(timeout=5)
+        multi.close()
+
+        # The in-flight send used the snapshot taken when it started
+        assert slow.messages == ["hi"]
+        assert late.messages == []
+        assert multi.count() == 2
+
+    def test_close_closes_children(self):
+        multi = MultiNotifier()
+        backends = [RecordingNotifier(), RecordingNotifier()]
+        closed = []
+        for backend in backends:
+            backend.close = lambda b=backend: closed.append(b)
+            multi.add(backend)
+
+        multi.close()
+
+        assert closed == backends
+
+    def test_async_send_concurrent(self):
+        multi = MultiNotifier()
+        backends = [RecordingNotifier(delay=0.2) for _ in range(3)]
+        for backend in backends:
+            multi.add(backend)
+        multi.add(RecordingNotifier(error=RuntimeError("boom")))
+
+        started = time.monotonic()
+        result = asyncio.run(multi.send_message_async("hi"))
+
+        assert time.monotonic() - started < 0.5
+        assert not result
+        assert all(b.messages == ["hi"] for b in backends)
+
+
+class TestSlackRetry:
+    """Slack 429 handling"""
+
+    def test_429_retried_after_header(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr(slack_module.time, "sleep", sleeps.append)
+        notifier = SlackNotifier(webhook_url="https://hooks.slack.com/test")
+        responses = [FakeResponse(429, headers={"Retry-After": "5"}), FakeResponse(200)]
+        monkeypatch.setattr(notifier._session, "post", lambda *a, **k: responses.pop(0))
+
+        assert notifier.send("hi")
+        assert sleeps == [5.0]
+
+    def test_other_errors_not_retried(self, monkeypatch):
+        notifier = SlackNotifier(webhook_url="https://hooks.slack.com/test")
+        calls = []
+        monkeypatch.setattr(
+            notifier._session, "post", lambda *a, **k: calls.append(1) or FakeResponse(500)
+        )
+
+        assert not notifier.send("hi")
+        assert len(calls) == 1
@@ -0,0 +1,178 @@
+"""
+Tests for Portfolio Trading Conditions
+"""
+
+import random
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from portfolio.conditions import (
+    TradingContext,
+    TradingContextBatch,
+    ConditionChain,
+    StopLossCondition,
+    TakeProfitCondition,
+    TrailingStopCondition,
+    RSICondition,
+    MACDCondition,
+    HoldingPeriodCondition,
+    create_default_sell_conditions,
+    create_technical_conditions,
+)
+
+
+# ============================================================
+# Fixtures
+# ============================================================
+
+@pytest.fixture
+def random_contexts():
+    """Contexts mixing normal values, None and zero prices"""
+    rng = random.Random(7)
+
+    def maybe(value):
+        roll = rng.random()
+        if roll < 0.1:
+            return None
+        if roll < 0.15:
+            return 0.0
+        return value
+
+    contexts = []
+    for i in range(300):
+        avg = rng.uniform(50, 150)
+        contexts.append(TradingContext(
+            ticker=f"T{i}",
+            current_price=avg * rng.uniform(0.8, 1.25),
+            avg_price=maybe(avg),
+            high_since_buy=maybe(avg * rng.uniform(1.0, 1.3)),
+            rsi=maybe(rng.uniform(0, 100)),
+            macd=maybe(rng.uniform(-2, 2)),
+            macd_signal=maybe(rng.uniform(-2, 2)),
+        ))
+    return contexts
+
+
+# ============================================================
+# Batch masks
+# ============================================================
+
+class TestConditionMasks:
+    """Vectorized masks must agree with the scalar conditions"""
+
+    @pytest.mark.parametrize("condition", [
+        StopLossCondition(pct=0.05),
+        TakeProfitCondition(pct=0.15),
+        TrailingStopCondition(pct=0.08),
+        RSICondition(),
+        MACDCondition(),
+    ])
+    def test_mask_matches_scalar(self, condition, random_contexts):
+        batch = TradingContextBatch.from_contexts(random_contexts)
+
+        expected_sell = [condition.should_sell(c) for c in random_contexts]
+        expected_buy = [condition.should_buy(c) for c in random_contexts]
+
+        assert condition.should_sell_mask(batch).tolist() == expected_sell
+        assert condition.should_buy_mask(batch).tolist() == expected_buy
+
+    @pytest.mark.parametrize("factory", [create_default_sell_conditions, create_technical_conditions])
+    def test_chain_mask_matches_scalar(self, factory, random_contexts):
+        chain = factory()
+        batch = TradingContextBatch.from_contexts(random_contexts)
+
+        expected = [chain.should_sell(c) for c in random_contexts]
+
+        assert chain.should_sell_mask(batch).tolist() == expected
+
+    def test_and_chain(self, random_contexts):
+        chain = ConditionChain(operator="AND")
+        chain.add(RSICondition()).add(MACDCondition())
+        batch = TradingContextBatch.from_contexts(random_contexts)
+
+        expected = [chain.should_sell(c) for c in random_contexts]
+
+        assert chain.should_sell_mask(batch).tolist() == expected
+
+    def test_fallback_for_scalar_only_condition(self, random_contexts):
+        condition = HoldingPeriodCondition(max_days=10)
+        batch = TradingContextBatch.from_contexts(random_contexts)
+
+        assert not condition.should_sell_mask(batch).any()
+
+    def test_empty_chain(self, random_contexts):
+        batch = TradingContextBatch.from_contexts(random_contexts)
+
+        mask = ConditionChain().should_sell_mask(batch)
+
+        assert mask.dtype == np.bool_
+        assert not mask.any()
+
+
+# ============================================================
+# TradingContext
+# ============================================================
+
+class TestTradingContext:
+    """Derived fields computed at construction"""
+
+    def test_pnl_pct(self):
+        assert TradingContext(ticker="A", current_price=110, avg_price=100).pnl_pct == pytest.approx(0.1)
+        assert TradingContext(ticker="A", current_price=110).pnl_pct is None
+        assert TradingContext(ticker="A", current_price=110, avg_price=0).pnl_pct is None
+
+    def test_holding_days_uses_timestamp(self):
+        context = TradingContext(
+            ticker="A",
+            current_price=100,
+            bought_at=datetime(2026, 1, 1),
+            timestamp=datetime(2026, 1, 31, 12),
+        )
+
+        assert context.holding_days == 30
+        assert HoldingPeriodCondition(max_days=30).should_sell(context)
+
+
+class TestConditionChain:
+    """Chain evaluation order"""
+
+    def test_auto_order_sorts_by_cost(self, random_contexts):
+        trailing = TrailingStopCondition()
+        stop_loss = StopLossCondition()
+        take_profit = TakeProfitCondition()
+
+        chain = ConditionChain(auto_order=True)
+        chain.add(trailing).add(stop_loss).add(take_profit)
+
+        assert chain._conditions == [stop_loss, take_profit, trailing]
+
+        # Same decisions as insertion order
+        plain = create_default_sell_conditions()
+        assert [chain.should_sell(c) for c in random_contexts] == [plain.should_sell(c) for c in random_contexts]
+
+    @pytest.mark.parametrize("operator", ["OR", "AND"])
+    def test_compiled_chain_matches(self, operator, random_contexts):
+        chain = ConditionChain(operator=operator)
+        chain.add(StopLossCondition()).add(TrailingStopCondition()).add(RSICondition()).add(MACDCondition())
+
+        compiled = chain.compile_sell()
+
+        assert [compiled(c) for c in random_contexts] == [chain.should_sell(c) for c in random_contexts]
+
+    def test_compiled_default_chain(self, random_contexts):
+        chain = create_default_sell_conditions()
+        compiled = chain.compile_sell()
+
+        assert [compiled(c) for c in random_contexts] == [chain.should_sell(c) for c in random_contexts]
+        assert ConditionChain().compile_sell()(random_contexts[0]) is False
+
+    def test_triggered_reasons_or(self):
+        chain = create_default_sell_conditions()
+
+        assert chain.should_sell(TradingContext(ticker="A", current_price=90, avg_price=100))
+        assert chain.get_triggered_reasons()[0].startswith("Stop loss triggered")
+
+        assert not chain.should_sell(TradingContext(ticker="A", current_price=101, avg_price=100))
+        assert chain.get_triggered_reasons() == []
@@ -0,0 +1,190 @@
+"""
+Tests for Portfolio Order Executor
+"""
+
+import random
+
+import pytest
+
+from portfolio.executor import Order, OrderExecutor, OrderResult, PaperExecutor, OrderSide, OrderStatus
+
+
+# ============================================================
+# Fixtures
+# ============================================================
+
+@pytest.fixture
+def executor():
+    """PaperExecutor with round numbers for easy arithmetic"""
+    return PaperExecutor(slippage_pct=0.01, commission_rate=0.001, initial_balance=10_000)
+
+
+# ============================================================
+# Order
+# ============================================================
+
+class TestOrder:
+    """Order construction"""
+
+    def test_order_ids_are_unique(self):
+        ids = {Order(ticker="AAPL", side="BUY", quantity=1).order_id for _ in range(1000)}
+
+        assert len(ids) == 1000
+
+    def test_explicit_order_id_kept(self):
+        assert Order(ticker="AAPL", side="BUY", quantity=1, order_id="abc").order_id == "abc"
+
+    def test_side_and_type_normalized(self):
+        order = Order(ticker="AAPL", side=OrderSide.SELL, quantity=1, order_type="limit")
+
+        assert order.side == "SELL"
+        assert order.order_type == "LIMIT"
+        assert Order(ticker="AAPL", side="buy", quantity=1).side == "BUY"
+
+    def test_invalid_side_rejected(self):
+        with pytest.raises(ValueError):
+            Order(ticker="AAPL", side="HOLD", quantity=1)
+
+
+# ============================================================
+# PaperExecutor
+# ============================================================
+
+class TestPaperExecutor:
+    """Paper trading fills, balance and positions"""
+
+    def test_buy_then_sell(self, executor):
+        buy = executor.execute(Order(ticker="AAPL", side="BUY", quantity=10), market_price=100)
+
+        assert buy.success
+        assert buy.fill_price == pytest.approx(101)
+        assert buy.commission == pytest.approx(1.01)
+        assert executor.get_balance() == pytest.approx(10_000 - 1010 - 1.01)
+        assert executor.get_positions()["AAPL"]["quantity"] == 10
+
+        sell = executor.execute(Order(ticker="AAPL", side="SELL", quantity=10), market_price=110)
+
+        assert sell.success
+        assert sell.fill_price == pytest.approx(108.9)
+        assert "AAPL" not in executor.get_positions()
+
+    def test_rejects_insufficient_balance(self, executor):
+        result = executor.execute(Order(ticker="AAPL", side="BUY", quantity=1000), market_price=100)
+
+        assert not result.success
+        assert result.status == OrderStatus.REJECTED.value
+        assert executor.get_balance() == 10_000
+
+    def test_rejects_sell_without_position(self, executor):
+        result = executor.execute(Order(ticker="AAPL", side="SELL", quantity=1), market_price=100)
+
+        assert not result.success
+        assert "No position" in result.message
+
+    def test_market_order_requires_price(self, executor):
+        result = executor.execute(Order(ticker="AAPL", side="BUY", quantity=1))
+
+        assert not result.success
+        assert result.status == OrderStatus.REJECTED.value
+
+    def test_execute_batch_matches_sequential(self):
+        rng = random.Random(3)
+        tickers = ["AAPL", "MSFT", "NVDA"]
+        orders, prices = [], []
+        for i in range(300):
+            side = rng.choice(["BUY", "BUY", "SELL"])
+            order_type = rng.choice(["MARKET", "MARKET", "LIMIT"])
+            price = rng.choice([None, rng.uniform(50, 150)])
+            orders.append(Order(
+                ticker=rng.choice(tickers), side=side, quantity=rng.randint(1, 20),
+                price=price, order_type=order_type, order_id=f"o{i}",
+            ))
+            prices.append(rng.choice([None, -1.0, rng.uniform(50, 150)]))
+
+        sequential = PaperExecutor(initial_balance=50_000)
+        expected = [sequential.execute(o, p) for o, p in zip(orders, prices)]
+
+        batched = PaperExecutor(initial_balance=50_000)
+        results = batched.execute_batch(orders, prices)
+
+        strip = lambda r: {k: v for k, v in r.to_dict().items() if k != "executed_at"}
+        assert [strip(r) for r in results] == [strip(r) for r in expected]
+        assert batched.get_balance() == sequential.get_balance()
+        assert batched.get_positions() == sequential.get_positions()
+
+    def test_trade_log(self, executor):
+        executor.execute(Order(ticker="AAPL", side="BUY", quantity=10), market_price=100)
+        first = executor.get_trade_log(copy=True)
+        executor.execute(Order(ticker="AAPL", side="SELL", quantity=5), market_price=100)
+        executor.execute(Order(ticker="AAPL", side="SELL", quantity=50), market_price=100)  # rejected
+
+        log = executor.get_trade_log()
+
+        assert len(first) == 1
+        assert [t["order"]["side"] for t in log] == ["BUY", "SELL"]
+        assert log[-1]["balance_after"] == executor.get_balance()
+
+        # copy=True is independent of the executor's state
+        first[0]["order"]["quantity"] = 999
+        first[0]["balance_after"] = 0
+        assert log[0]["order"]["quantity"] == 10
+        assert log[0]["balance_after"] != 0
+
+        frame = executor.get_trade_frame()
+        assert frame["quantity"].tolist() == [10, 5]
+        assert frame["fill_price"].tolist() == pytest.approx([101, 99])
+
+
+# ============================================================
+# OrderExecutor
+# ============================================================
+
+class TestOrderExecutor:
+    """Mode dispatch"""
+
+    def test_dry_run_uses_paper_executor(self):
+        executor = OrderExecutor(dry_run=True, initial_balance=10_000)
+
+        result = executor.execute(Order(ticker="AAPL", side="BUY", quantity=1), market_price=100)
+
+        assert result.simulated and result.success
+        assert executor.get_paper_positions()["AAPL"]["quantity"] == 1
+
+    def test_live_without_executor_rejects(self):
+        executor = OrderExecutor(dry_run=False)
+
+        result = executor.execute(Order(ticker="AAPL", side="BUY", quantity=1), market_price=100)
+
+        assert not result.success
+        assert result.message == "Live executor not configured"
+
+    def test_dry_run_override_keeps_paper_state(self):
+        executor = OrderExecutor(dry_run=False, initial_balance=10_000)
+
+        executor.execute(Order(ticker="AAPL", side="BUY", quantity=1), market_price=100, dry_run=True)
+        sell = executor.execute(Order(ticker="AAPL", side="SELL", quantity=1), market_price=100, dry_run=True)
+
+        # Same paper executor across override calls, so the position exists
+        assert sell.success
+
+    def test_flipping_dry_run_after_live_executor(self):
+        class FakeLive:
+            def __init__(self):
+                self.orders = []
+
+            def execute(self, order):
+                self.orders.append(order)
+                return OrderResult(order_id=order.order_id, success=True, status=OrderStatus.FILLED.value)
+
+        live = FakeLive()
+        executor = OrderExecutor(initial_balance=10_000)
+        executor.set_live_executor(live)
+
+        executor.dry_run = True
+        paper = executor.execute(Order(ticker="AAPL", side="BUY", quantity=1), market_price=100)
+        executor.dry_run = False
+        real = executor.execute(Order(ticker="AAPL", side="BUY", quantity=1), market_price=100)
+
+        assert paper.simulated
+        assert not real.simulated
+        assert len(live.orders) == 1
@@ -0,0 +1,344 @@
+"""
+Tests for Portfolio Holdings
+"""
+
+import gc
+import json
+import threading
+import weakref
+from datetime import date
+
+import pytest
+
+from portfolio import holdings as holdings_module
+from portfolio.holdings import Portfolio
+
+
+# ============================================================
+# Fixtures
+# ============================================================
+
+@pytest.fixture
+def portfolio_path(tmp_path):
+    """Temporary portfolio.yaml path"""
+    return tmp_path / "portfolio.yaml"
+
+
+# ============================================================
+# Persistence
+# ============================================================
+
+class TestPersistence:
+    """YAML load/save round trip"""
+
+    def test_round_trip(self, portfolio_path):
+        portfolio = Portfolio(str(portfolio_path))
+        portfolio.add("005930.KS", quantity=10, avg_price=70000, name="삼성전자", bought_at=date(2026, 1, 2))
+        portfolio.add("005930.KS", quantity=10, avg_price=80000)
+        portfolio.add("AAPL", quantity=5, avg_price=150.5, note="core")
+
+        loaded = Portfolio(str(portfolio_path))
+
+        assert loaded.get_tickers() == ["005930.KS", "AAPL"]
+        samsung = loaded.get("005930.KS")
+        assert samsung.name == "삼성전자"
+        assert samsung.avg_price == pytest.approx(75000)
+        assert samsung.bought_at == date(2026, 1, 2)
+        assert len(samsung.transactions) == 2
+        assert loaded.get("AAPL").note == "core"
+
+    def test_unicode_written_verbatim(self, portfolio_path):
+        Portfolio(str(portfolio_path)).add("005930.KS", quantity=1, avg_price=1, name="삼성전자")
+
+        assert "삼성전자" in portfolio_path.read_text(encoding="utf-8")
+
+    def test_missing_file_is_empty(self, portfolio_path):
+        assert len(Portfolio(str(portfolio_path))) == 0
+
+    def test_save_replaces_file_atomically(self, portfolio_path):
+        portfolio = Portfolio(str(portfolio_path))
+        portfolio.add("AAPL", quantity=1, avg_price=100)
+        portfolio.update("AAPL", quantity=2)
+        portfolio._dirty = True
+        portfolio.flush(durable=True)
+
+        assert [p.name for p in portfolio_path.parent.iterdir()] == ["portfolio.yaml"]
+        assert Portfolio(str(portfolio_path)).get("AAPL").quantity == 2
+
+
+class TestDeferredSave:
+    """batch() and autosave_delay coalesce writes"""
+
+    @pytest.fixture
+    def save_counter(self, monkeypatch):
+        calls = []
+        original = Portfolio._save
+
+        def counting_save(portfolio, *args, **kwargs):
+            calls.append(len(portfolio))
+            original(portfolio, *args, **kwargs)
+
+        monkeypatch.setattr(Portfolio, "_save", counting_save)
+        return calls
+
+    def test_immediate_save_by_default(self, portfolio_path, save_counter):
+        portfolio = Portfolio(str(portfolio_path))
+        portfolio.add("AAPL", quantity=1, avg_price=100)
+        portfolio.add("MSFT", quantity=1, avg_price=100)
+
+        assert save_counter == [1, 2]
+
+    def test_batch_saves_once(self, portfolio_path, save_counter):
+        portfolio = Portfolio(str(portfolio_path))
+
+        with portfolio.batch():
+            portfolio.add("AAPL", quantity=10, avg_price=100)
+            portfolio.add("MSFT", quantity=1, avg_price=100)
+            with portfolio.batch():
+                portfolio.sell("AAPL", quantity=3)
+            portfolio.remove("MSFT")
+            assert save_counter == []
+
+        assert save_counter == [1]
+        assert Portfolio(str(portfolio_path)).get("AAPL").quantity == 7
+
+    def test_autosave_delay_until_flush(self, portfolio_path, save_counter):
+        portfolio = Portfolio(str(portfolio_path), autosave_delay=60)
+        portfolio.add("AAPL", quantity=1, avg_price=100)
+        portfolio.update("AAPL", note="core")
+
+        assert save_counter == []
+        assert not portfolio_path.exists()
+
+        portfolio.flush()
+        portfolio.flush()
+
+        assert save_counter == [1]
+        assert Portfolio(str(portfolio_path)).get("AAPL").note == "core"
+
+    def test_autosave_delay_timer_fires(self, portfolio_path, save_counter):
+        portfolio = Portfolio(str(portfolio_path), autosave_delay=0.2)
+        portfolio.add("AAPL", quantity=1, avg_price=100)
+        timer = portfolio._flush_timer
+
+        timer.join(timeout=5)
+
+        assert save_counter == [1]
+
+
+    def test_change_during_flush_not_lost(self, portfolio_path, monkeypatch):
+        portfolio = Portfolio(str(portfolio_path), autosave_delay=60)
+        portfolio.add("AAPL", quantity=1, avg_price=100)
+
+        saved = threading.Event()
+        release = threading.Event()
+        original = Portfolio._save
+
+        def blocking_save(self, *args, **kwargs):
+            original(self, *args, **kwargs)
+            saved.set()
+            release.wait(timeout=5)
+
+        monkeypatch.setattr(Portfolio, "_save", blocking_save)
+        flusher = threading.Thread(target=portfolio.flush)
+        flusher.start()
+        assert saved.wait(timeout=5)
+
+        # Lands after the snapshot was written but before flush returns
+        mutator = threading.Thread(target=portfolio.update, args=("AAPL",), kwargs={"note": "late"})
+        mutator.start()
+        release.set()
+        flusher.join(timeout=5)
+        mutator.join(timeout=5)
+
+        monkeypatch.setattr(Portfolio, "_save", original)
+        portfolio.flush()
+
+        assert Portfolio(str(portfolio_path)).get("AAPL").note == "late"
+
+    def test_failed_save_stays_dirty(self, portfolio_path, monkeypatch):
+        portfolio = Portfolio(str(portfolio_path), autosave_delay=60)
+        portfolio.add("AAPL", quantity=1, avg_price=100)
+
+        def failing_save(self, *args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(Portfolio, "_save", failing_save)
+        with pytest.raises(OSError):
+            portfolio.flush()
+
+        assert portfolio._dirty
+
+
+class TestTotalValue:
+    """total_value aggregates per-holding calculate_pnl"""
+
+    def test_matches_calculate_pnl(self, portfolio_path):
+        portfolio = Portfolio(str(portfolio_path))
+        with portfolio.batch():
+            portfolio.add("AAPL", quantity=10, avg_price=150)
+            portfolio.add("MSFT", quantity=3, avg_price=300)
+            portfolio.add("ZERO", quantity=0, avg_price=0)
+        prices = {"AAPL": 165.5, "ZERO": 10}
+
+        result = portfolio.total_value(prices)
+
+        expected = [
+            {"ticker": h.ticker, "name": h.name, **h.calculate_pnl(prices.get(h.ticker, h.avg_price))}
+            for h in portfolio.get_all()
+        ]
+        assert result["holdings"] == expected
+        assert result["total_cost"] == pytest.approx(2400)
+        assert result["total_value"] == pytest.approx(2555)
+        assert result["total_pnl_pct"] == pytest.approx(155 / 2400 * 100)
+
+        summary = portfolio.total_value(prices, include_details=False)
+        assert summary["holdings"] == []
+        assert summary["total_pnl"] == result["total_pnl"]
+
+
+class TestLoadCache:
+    """Parsed holdings are reused while the file is unchanged"""
+
+    def test_cached_load_is_not_shared(self, portfolio_path):
+        Portfolio(str(portfolio_path)).add("AAPL", quantity=1, avg_price=100)
+
+        first = Portfolio(str(portfolio_path))
+        second = Portfolio(str(portfolio_path))
+        first.get("AAPL").transactions.append({"type": "SELL"})
+        first.get("AAPL").quantity = 99
+
+        assert second.get("AAPL").quantity == 1
+        assert len(second.get("AAPL").transactions) == 1
+
+    def test_external_change_reloads(self, portfolio_path):
+        Portfolio(str(portfolio_path)).add("AAPL", quantity=1, avg_price=100)
+        Portfolio(str(portfolio_path))
+
+        portfolio_path.write_text(
+            "holdings:\n- ticker: MSFT\n  quantity: 2\n  avg_price: 300\n", encoding="utf-8"
+        )
+
+        assert Portfolio(str(portfolio_path)).get_tickers() == ["MSFT"]
+
+
+class TestJournal:
+    """Append-only journal mode"""
+
+    def test_mutations_append_instead_of_rewrite(self, portfolio_path):
+        Portfolio(str(portfolio_path)).add("AAPL", quantity=10, avg_price=100)
+        snapshot = portfolio_path.read_text(encoding="utf-8")
+
+        portfolio = Portfolio(str(portfolio_path), journal=True)
+        portfolio.add("AAPL", quantity=10, avg_price=120)
+        portfolio.sell("AAPL", quantity=5, price=130, sold_at=date(2026, 2, 1))
+        portfolio.add("MSFT", quantity=1, avg_price=300, bought_at=date(2026, 2, 2))
+        portfolio.update("MSFT", note="core")
+        portfolio.add("TSLA", quantity=1, avg_price=200)
+        portfolio.remove("TSLA")
+
+        assert portfolio_path.read_text(encoding="utf-8") == snapshot
+        assert len(portfolio.journal_path.read_text().splitlines()) == 6
+
+        replayed = Portfolio(str(portfolio_path), journal=True)
+        for ticker in ("AAPL", "MSFT"):
+            assert replayed.get(ticker).to_dict() == portfolio.get(ticker).to_dict()
+        assert "TSLA" not in replayed
+
+    def test_compact_writes_snapshot_and_drops_log(self, portfolio_path):
+        portfolio = Portfolio(str(portfolio_path), journal=True)
+        portfolio.add("AAPL", quantity=10, avg_price=100)
+        portfolio.compact()
+
+        assert not portfolio.journal_path.exists()
+        assert Portfolio(str(portfolio_path)).get("AAPL").quantity == 10
+
+        portfolio.sell("AAPL", quantity=3)
+        assert Portfolio(str(portfolio_path), journal=True).get("AAPL").quantity == 7
+
+    def test_log_left_after_compact_is_not_reapplied(self, portfolio_path):
+        portfolio = Portfolio(str(portfolio_path), journal=True)
+        portfolio.add("AAPL", quantity=10, avg_price=100)
+        portfolio.add("AAPL", quantity=10, avg_price=100)
+        log = portfolio.journal_path.read_text()
+
+        portfolio.compact()
+        # Simulate a crash between the snapshot write and the log delete
+        portfolio.journal_path.write_text(log)
+
+        assert Portfolio(str(portfolio_path), journal=True).get("AAPL").quantity == 20
+
+    def test_torn_last_line_ignored(self, portfolio_path):
+        portfolio = Portfolio(str(portfolio_path), journal=True)
+        portfolio.add("AAPL", quantity=10, avg_price=100)
+        with open(portfolio.journal_path, "a") as f:
+            f.write('{"seq": 2, "op": "sell", "tick')
+
+        assert Portfolio(str(portfolio_path), journal=True).get("AAPL").quantity == 10
+
+    def test_auto_compact(self, portfolio_path, monkeypatch):
+        monkeypatch.setattr(Portfolio, "JOURNAL_COMPACT_OPS", 3)
+        portfolio = Portfolio(str(portfolio_path), journal=True)
+
+        for _ in range(3):
+            portfolio.add("AAPL", quantity=1, avg_price=100)
+
+        assert not portfolio.journal_path.exists()
+        assert Portfolio(str(portfolio_path)).get("AAPL").quantity == 3
+
+    def test_failed_entry_stops_replay_without_raising(self, portfolio_path):
+        portfolio = Portfolio(str(portfolio_path), journal=True)
+        portfolio.add("AAPL", quantity=10, avg_price=100)
+        with open(portfolio.journal_path, "a") as f:
+            f.write(json.dumps({"seq": 2, "op": "add", "ticker": "BAD"}) + "\n")
+            f.write(json.dumps({"seq": 3, "op": "remove", "ticker": "AAPL"}) + "\n")
+
+        recovered = Portfolio(str(portfolio_path), journal=True)
+
+        assert recovered.get_tickers() == ["AAPL"]
+        assert not recovered.journal_path.exists()
+        failed = recovered.journal_path.with_name("portfolio.log.failed")
+        assert len(failed.read_text().splitlines()) == 3
+
+        # New entries are numbered after the moved-aside ones and replay cleanly
+        recovered.sell("AAPL", quantity=4)
+        assert Portfolio(str(portfolio_path), journal=True).get("AAPL").quantity == 6
+
+    def test_second_failed_replay_keeps_earlier_entries(self, portfolio_path):
+        portfolio = Portfolio(str(portfolio_path), journal=True)
+        portfolio.add("AAPL", quantity=10, avg_price=100)
+        with open(portfolio.journal_path, "a") as f:
+            f.write(json.dumps({"seq": 2, "op": "add", "ticker": "BAD"}) + "\n")
+
+        recovered = Portfolio(str(portfolio_path), journal=True)
+        recovered.add("MSFT", quantity=5, avg_price=300)
+        with open(recovered.journal_path, "a") as f:
+            f.write('{"seq": 9, "op": "sell", "tick')
+
+        Portfolio(str(portfolio_path), journal=True)
+
+        failed = recovered.journal_path.with_name("portfolio.log.failed")
+        assert len(failed.read_text().splitlines()) == 4
+
+    def test_plain_save_keeps_journal_seq(self, portfolio_path):
+        portfolio = Portfolio(str(portfolio_path), journal=True)
+        portfolio.add("AAPL", quantity=10, avg_price=100)
+        log = portfolio.journal_path.read_text()
+        portfolio.compact()
+
+        Portfolio(str(portfolio_path)).update("AAPL", note="core")
+        # Log left behind by a crash between snapshot write and delete
+        portfolio.journal_path.write_text(log)
+
+        assert Portfolio(str(portfolio_path), journal=True).get("AAPL").quantity == 10
+
+    def test_exit_registry_does_not_pin_instances(self, portfolio_path):
+        portfolio = Portfolio(str(portfolio_path), journal=True)
+        portfolio.add("AAPL", quantity=1, avg_price=100)
+        ref = weakref.ref(portfolio)
+
+        assert portfolio in holdings_module._open_portfolios
+        del portfolio
+        gc.collect()
+
+        assert ref() is None
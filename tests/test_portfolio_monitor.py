@@ -0,0 +1,220 @@
+"""
+Tests for Portfolio Price Monitor
+"""
+
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from portfolio import monitor as monitor_module
+from portfolio.monitor import PriceCache, PriceData, PriceMonitor
+
+
+# ============================================================
+# Fixtures
+# ============================================================
+
+def make_price(ticker, price=100.0):
+    """PriceData with fixed values"""
+    return PriceData(
+        ticker=ticker, price=price, prev_close=price, change=0.0,
+        change_pct=0.0, volume=1000, timestamp=datetime(2026, 1, 2),
+    )
+
+
+def download_frame(closes, volumes):
+    """Frame shaped like yf.download output ((Price, Ticker) MultiIndex columns)"""
+    index = pd.date_range("2026-01-01", periods=len(next(iter(closes.values()))), freq="D")
+    frame = {("Close", t): v for t, v in closes.items()}
+    frame.update({("Volume", t): v for t, v in volumes.items()})
+    return pd.DataFrame(frame, index=index)
+
+
+@pytest.fixture
+def price_cache(monkeypatch):
+    """PriceCache whose download is replaced by a call recorder"""
+    cache = PriceCache()
+    calls = []
+
+    def fake_fetch(tickers):
+        calls.append(list(tickers))
+        return {t: make_price(t) for t in tickers if t != "MISSING"}
+
+    monkeypatch.setattr(cache, "fetch", fake_fetch)
+    cache.calls = calls
+    return cache
+
+
+# ============================================================
+# PriceCache
+# ============================================================
+
+class TestPriceCache:
+    """Shared price cache"""
+
+    def test_only_stale_tickers_downloaded(self, price_cache):
+        price_cache.get_many(["AAPL", "MSFT"])
+        result = price_cache.get_many(["MSFT", "NVDA", "AAPL"])
+
+        assert price_cache.calls == [["AAPL", "MSFT"], ["NVDA"]]
+        assert list(result) == ["MSFT", "NVDA", "AAPL"]
+
+    def test_expired_entries_refetched(self, price_cache, monkeypatch):
+        price_cache.get("AAPL", max_age=10)
+
+        now = time.monotonic()
+        monkeypatch.setattr(monitor_module.time, "monotonic", lambda: now + 11)
+        price_cache.get("AAPL", max_age=10)
+
+        assert price_cache.calls == [["AAPL"], ["AAPL"]]
+
+    def test_failed_tickers_omitted(self, price_cache):
+        assert list(price_cache.get_many(["AAPL", "MISSING"])) == ["AAPL"]
+
+    def test_concurrent_callers_share_download(self, monkeypatch):
+        cache = PriceCache()
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_fetch(tickers):
+            calls.append(list(tickers))
+            started.set()
+            release.wait(timeout=5)
+            return {t: make_price(t) for t in tickers}
+
+        monkeypatch.setattr(cache, "fetch", slow_fetch)
+
+        first = threading.Thread(target=cache.get_many, args=(["AAPL", "MSFT"],))
+        first.start()
+        started.wait(timeout=5)
+
+        second_result = {}
+        second = threading.Thread(
+            target=lambda: second_result.update(cache.get_many(["MSFT", "AAPL"]))
+        )
+        second.start()
+        release.set()
+        first.join(timeout=5)
+        second.join(timeout=5)
+
+        assert calls == [["AAPL", "MSFT"]]
+        assert list(second_result) == ["MSFT", "AAPL"]
+
+
+class TestPriceCacheFetch:
+    """Parsing of the yf.download batch frame"""
+
+    def test_multi_ticker(self, monkeypatch):
+        frame = download_frame(
+            {"AAPL": [100.0, 110.0], "MSFT": [200.0, 190.0], "ZERO": [0.0, 5.0]},
+            {"AAPL": [1, 10], "MSFT": [2, 20], "ZERO": [3, 30]},
+        )
+        monkeypatch.setattr(monitor_module.yf, "download", lambda *a, **k: frame)
+
+        prices = PriceCache().fetch(["AAPL", "MSFT", "ZERO", "UNKNOWN"])
+
+        assert list(prices) == ["AAPL", "MSFT", "ZERO"]
+        assert (prices["AAPL"].price, prices["AAPL"].prev_close, prices["AAPL"].volume) == (110.0, 100.0, 10)
+        assert prices["AAPL"].change_pct == pytest.approx(10.0)
+        assert prices["MSFT"].change == pytest.approx(-10.0)
+        assert prices["ZERO"].change_pct == 0
+
+    def test_single_ticker_and_single_row(self, monkeypatch):
+        frame = download_frame({"AAPL": [120.0]}, {"AAPL": [7]})
+        monkeypatch.setattr(monitor_module.yf, "download", lambda *a, **k: frame)
+
+        price = PriceCache().fetch(["AAPL"])["AAPL"]
+
+        assert (price.price, price.prev_close, price.change, price.volume) == (120.0, 120.0, 0.0, 7)
+
+    def test_nan_volume_skips_ticker(self, monkeypatch):
+        frame = download_frame(
+            {"AAPL": [100.0, 110.0], "MSFT": [200.0, 190.0]},
+            {"AAPL": [1.0, np.nan], "MSFT": [2.0, 20.0]},
+        )
+        monkeypatch.setattr(monitor_module.yf, "download", lambda *a, **k: frame)
+
+        assert list(PriceCache().fetch(["AAPL", "MSFT"])) == ["MSFT"]
+
+
+class TestPriceMonitor:
+    """PriceMonitor reads through the cache"""
+
+    def test_fetch_prices_uses_cache(self, price_cache):
+        monitor = PriceMonitor(interval=60, cache=price_cache)
+        monitor.add("AAPL")
+        monitor.add("MSFT")
+
+        monitor.fetch_prices()
+        prices = monitor.fetch_prices()
+
+        assert price_cache.calls == [["AAPL", "MSFT"]]
+        assert prices["AAPL"].price == 100.0
+
+    def test_stream_ticks_update_prices(self, price_cache, monkeypatch):
+        closed = threading.Event()
+        subscriptions = []
+
+        class FakeWebSocket:
+            def __init__(self, verbose=True):
+                pass
+
+            def subscribe(self, symbols):
+                subscriptions.append(list(symbols))
+
+            def listen(self, handler):
+                handler({"id": "AAPL", "price": 110.0, "previous_close": 100.0, "day_volume": "1234"})
+                handler({"id": "OTHER", "price": 1.0})
+                handler({"id": "MSFT", "price": 99.0})
+                closed.wait(timeout=5)
+
+            def close(self):
+                closed.set()
+
+        monkeypatch.setattr(monitor_module, "HAS_YF_WEBSOCKET", True)
+        monkeypatch.setattr(monitor_module, "YFWebSocket", FakeWebSocket, raising=False)
+
+        monitor = PriceMonitor(cache=price_cache, stream=True)
+        monitor.add("AAPL")
+        monitor.add("MSFT")
+        updates = []
+        seen_msft_tick = threading.Event()
+
+        def on_update(data):
+            updates.append(data)
+            if data["ticker"] == "MSFT" and data["price"] == 99.0:
+                seen_msft_tick.set()
+
+        monitor.on_update(on_update)
+
+        monitor.start()
+        assert seen_msft_tick.wait(timeout=5)
+        monitor.stop()
+
+        assert subscriptions == [["AAPL", "MSFT"]]
+        assert [d["ticker"] for d in updates] == ["AAPL", "MSFT", "AAPL", "MSFT"]
+
+        aapl = monitor.get_price("AAPL")
+        assert (aapl.price, aapl.prev_close, aapl.volume) == (110.0, 100.0, 1234)
+        assert aapl.change_pct == pytest.approx(10.0)
+
+        # Missing fields fall back to the snapshot values
+        msft = monitor.get_price("MSFT")
+        assert (msft.prev_close, msft.volume) == (100.0, 1000)
+        assert not monitor.is_running()
+
+    def test_stop_wakes_poll_loop(self, price_cache):
+        monitor = PriceMonitor(interval=60, cache=price_cache)
+        monitor.add("AAPL")
+        monitor.start()
+
+        started = time.monotonic()
+        monitor.stop()
+
+        assert time.monotonic() - started < 1
+        assert price_cache.calls == [["AAPL"]]
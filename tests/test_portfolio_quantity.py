@@ -0,0 +1,79 @@
+"""
+Tests for Portfolio Quantity Calculator
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from portfolio.quantity import QuantityMethod, calculate_quantity, calculate_quantity_batch
+
+
+# ============================================================
+# Fixtures
+# ============================================================
+
+@pytest.fixture
+def random_inputs():
+    """Values, prices and holdings covering zero and fractional results"""
+    rng = random.Random(11)
+    n = 300
+    return {
+        "values": np.array([rng.choice([0.0, rng.uniform(0, 150), rng.uniform(0, 5e6)]) for _ in range(n)]),
+        "prices": np.array([rng.uniform(1, 200_000) for _ in range(n)]),
+        "holdings": np.array([rng.randint(0, 500) for _ in range(n)]),
+    }
+
+
+# ============================================================
+# calculate_quantity_batch
+# ============================================================
+
+class TestQuantityBatch:
+    """Vectorized quantities must agree with calculate_quantity"""
+
+    @pytest.mark.parametrize("method", ["fixed", "amount", "percent", "portfolio_pct", "all"])
+    @pytest.mark.parametrize("round_down", [True, False])
+    def test_matches_scalar(self, method, round_down, random_inputs):
+        kwargs = dict(
+            portfolio_value=50_000_000, min_quantity=3,
+            round_down=round_down, commission_rate=0.00015,
+        )
+
+        batch = calculate_quantity_batch(
+            method, random_inputs["values"], random_inputs["prices"], random_inputs["holdings"], **kwargs
+        )
+
+        expected = [
+            calculate_quantity(
+                method, value, current_price=price, holdings_quantity=int(holding), **kwargs
+            )
+            for value, price, holding in zip(*random_inputs.values())
+        ]
+        assert batch.dtype == np.int64
+        assert batch.tolist() == expected
+
+    def test_scalar_value_broadcasts(self):
+        quantities = calculate_quantity_batch("amount", 1_000_000, current_prices=np.array([70_000, 150, 2e6]))
+
+        assert quantities.tolist() == [14, 6666, 0]
+
+    def test_invalid_price_rejected(self):
+        with pytest.raises(ValueError):
+            calculate_quantity_batch("amount", np.array([100.0, 100.0]), current_prices=np.array([10.0, 0.0]))
+
+        with pytest.raises(ValueError):
+            calculate_quantity_batch("percent", np.array([50.0]))
+
+
+class TestQuantityMethodLookup:
+    """Method given as string or enum"""
+
+    def test_enum_and_string_equivalent(self):
+        assert calculate_quantity(QuantityMethod.AMOUNT, 1_000_000, current_price=70_000) == 14
+        assert calculate_quantity("amount", 1_000_000, current_price=70_000) == 14
+
+    def test_unknown_method_raises_value_error(self):
+        with pytest.raises(ValueError):
+            calculate_quantity("unknown", 1)
@@ -1,4 +1,5 @@
 import os
+import numpy as np
 import pandas as pd
 import yfinance as yf
 from datetime import datetime, timedelta
@@ -116,33 +117,87 @@ def get_options_volume_history(symbol: str, days: int = 5) -> pd.DataFrame:
     
     return pd.DataFrame()
 
-def save_options_volume_history(symbol: str, volume_data: Dict):
+def save_options_volume_history(symbol: str, volume_data: Dict, timestamp: Optional[datetime] = None):
     """
     Save current options volume to history
     
     Args:
         symbol: Stock symbol
         volume_data: Dict with 'call_volume', 'put_volume', 'total_volume'
+        timestamp: Row timestamp (default: now)
     """
     path = get_options_volume_cache_path(symbol)
     os.makedirs(os.path.dirname(path), exist_ok=True)
     
-    # Load existing or create new
+    new_row = pd.DataFrame([volume_data], index=[timestamp or datetime.now()])
+    now = datetime.now()
+    cutoff_date = now - timedelta(days=30)
+    # Rows may age past 30 days by up to a day before the file is pruned, so
+    # a long-running tracker appends most saves instead of rewriting each time
+    prune_date = now - timedelta(days=31)
+    
     if os.path.exists(path):
+        # Append in place while the oldest row is newer than the prune date
+        # and the columns match - avoids reading and rewriting the whole history
+        head = pd.read_csv(path, index_col=0, parse_dates=True, nrows=1)
+        if (not head.empty and list(head.columns) == list(new_row.columns)
+                and head.index[0] > prune_date):
+            new_row.to_csv(path, mode='a', header=False)
+            return
         df = pd.read_csv(path, index_col=0, parse_dates=True)
     else:
         df = pd.DataFrame()
     
     # Add new row
-    new_row = pd.DataFrame([volume_data], index=[datetime.now()])
     df = pd.concat([df, new_row])
     
     # Keep only last 30 days
-    cutoff_date = datetime.now() - timedelta(days=30)
     df = df[df.index > cutoff_date]
     
     df.to_csv(path)
 
+def save_options_volume_history_many(records: Dict[str, Dict]):
+    """
+    Save one check's volume rows for several symbols with a shared timestamp
+    
+    Args:
+        records: {symbol: volume_data}
+    """
+    timestamp = datetime.now()
+    for symbol, volume_data in records.items():
+        # One bad file must not stop the remaining symbols' saves
+        try:
+            save_options_volume_history(symbol, volume_data, timestamp)
+        except Exception as e:
+            print(f"Error saving volume history for {symbol}: {e}")
+
+def top_n_positions(values: np.ndarray, n: int) -> np.ndarray:
+    """
+    Positions of the n largest values, largest first (O(N) selection)
+
+    Same result as DataFrame.nlargest(n, keep='first'): ties at the cut-off
+    keep the earliest rows, and NaN rows only fill in when fewer than n
+    values are present.
+    """
+    is_nan = np.isnan(values)
+    valid = np.flatnonzero(~is_nan)
+    if n <= 0:
+        return valid[:0]
+    if valid.size <= n:
+        order = np.argsort(-values[valid], kind='stable')
+        return np.concatenate([valid[order], np.flatnonzero(is_nan)[:n - valid.size]])
+
+    valid_values = values[valid]
+    cutoff = np.partition(valid_values, valid_values.size - n)[valid_values.size - n]
+
+    above = valid[valid_values > cutoff]
+    ties = valid[valid_values == cutoff][:n - above.size]
+    picked = np.concatenate([above, ties])
+    picked.sort()
+
+    order = np.argsort(-values[picked], kind='stable')
+    return picked[order]
+
 def calculate_volume_metrics(options_df: pd.DataFrame) -> Dict:
     """
     Calculate volume metrics from options DataFrame
@@ -165,7 +220,8 @@ def calculate_volume_metrics(options_df: pd.DataFrame) -> Dict:
     # Find top strikes by volume
     top_strikes = []
     if 'volume' in options_df.columns and 'strike' in options_df.columns:
-        top_5 = options_df.nlargest(5, 'volume')[['strike', 'volume', 'openInterest', 'expiry']]
+        top_idx = top_n_positions(options_df['volume'].to_numpy(dtype=float), 5)
+        top_5 = options_df[['strike', 'volume', 'openInterest', 'expiry']].iloc[top_idx]
         top_strikes = top_5.to_dict('records')
     
     return {
@@ -175,6 +231,32 @@ def calculate_volume_metrics(options_df: pd.DataFrame) -> Dict:
         'top_strikes': top_strikes
     }
 
+def calculate_volume_metrics_pair(calls_df: pd.DataFrame, puts_df: pd.DataFrame, top_n: int = 3) -> Dict:
+    """
+    Calculate combined call/put metrics in one call
+
+    Returns:
+        Dict with 'metrics' (total/call/put volume, open interest, put/call
+        ratio - the row stored in volume history) and the top call/put strikes
+    """
+    call_metrics = calculate_volume_metrics(calls_df)
+    put_metrics = calculate_volume_metrics(puts_df)
+
+    call_volume = call_metrics['total_volume']
+    put_volume = put_metrics['total_volume']
+
+    return {
+        'metrics': {
+            'total_volume': call_volume + put_volume,
+            'call_volume': call_volume,
+            'put_volume': put_volume,
+            'total_open_interest': call_metrics['total_open_interest'] + put_metrics['total_open_interest'],
+            'put_call_ratio': put_volume / call_volume if call_volume > 0 else 0
+        },
+        'top_call_strikes': call_metrics['top_strikes'][:top_n],
+        'top_put_strikes': put_metrics['top_strikes'][:top_n]
+    }
+
 def detect_unusual_activity(symbol: str, current_metrics: Dict, threshold: float = 2.0) -> Dict:
     """
     Detect unusual options activity based on historical averages
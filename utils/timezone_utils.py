@@ -230,6 +230,25 @@ def get_current_market_time() -> datetime:
     """
     return datetime.now(US_EASTERN)
 
+def is_market_open(dt: Optional[datetime] = None) -> bool:
+    """
+    Check if the regular NYSE session is open (holidays and early closes aware)
+
+    Args:
+        dt: datetime to check (default: now); naive values are treated as US Eastern
+
+    Returns:
+        True if dt falls between the session open and close
+    """
+    dt = now() if dt is None else make_timezone_aware(dt)
+
+    schedule = get_market_calendar().schedule(start_date=dt.date(), end_date=dt.date())
+    if schedule.empty:
+        return False
+
+    session = schedule.iloc[0]
+    return session['market_open'] <= pd.Timestamp(dt) < session['market_close']
+
 def get_market_date_range(days_back: int = 365) -> tuple[datetime, datetime]:
     """
     Get a date range for market operations